@@ -207,7 +207,7 @@ def get_tile_info():
                 "jokers": evaluator.valid_tiles['jokers'],
                 "year_tiles": evaluator.valid_tiles['year_tiles']
             },
-            "dragon_associations": evaluator.dragon_associations,
+            "dragon_associations": dict(evaluator.dragon_associations),
             "total_tiles": sum(len(tiles) for tiles in evaluator.valid_tiles.values()),
             "year": 2024,
             "rules_version": "2024 American Mahjong"
@@ -4,41 +4,89 @@ Implements comprehensive logic for evaluating American Mahjong hands including
 hand patterns and scoring based on year-specific rules.
 """
 
-from collections import Counter, defaultdict
-from typing import List, Dict, Tuple, Set, Optional
+from collections import Counter, OrderedDict
+import copy
+from itertools import chain
+from typing import List, Dict, Mapping, Tuple, Set, Optional
 import logging
 import re
+import threading
+from types import MappingProxyType
+
+import numpy as np
+
+from .rules_specification import DRAGON_ASSOCIATIONS, SUIT_REQUIREMENT_MASKS, TILE_MASK_BITS
+from .tiles import (
+    DRAGON_IDS, FLOWER_ID, JOKER_ID, NO_SUIT, NUM_NUMBERED, SUIT_LETTERS, TILE_ID, TILE_NAMES, TILE_RANK,
+    TILE_SUIT, YEAR_ID, hand_counts, tile_ids
+)
 
 logger = logging.getLogger(__name__)
 
+# All valid American Mahjong tiles by category
+VALID_TILES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'bams': tuple(f"{i}B" for i in range(1, 10)),  # 1B-9B (Bamboo)
+    'cracks': tuple(f"{i}C" for i in range(1, 10)),  # 1C-9C (Characters)
+    'dots': tuple(f"{i}D" for i in range(1, 10)),  # 1D-9D (Circles)
+    'winds': ('E', 'S', 'W', 'N'),  # East, South, West, North
+    'dragons': ('R', 'G', '0'),  # Red, Green, White Dragons
+    'flowers': ('F',),  # Flowers
+    'jokers': ('J',),  # Jokers
+    'blanks': tuple(f"B{i}" for i in range(1, 7)),  # B1-B6 (Blanks)
+    'year_tiles': ('2024',)  # Year-specific tiles
+})
+
+# Every valid tile in one set, for validation
+_ALL_VALID_TILES = frozenset(chain.from_iterable(VALID_TILES.values()))
+
+# Evaluations kept for repeated hands, shared by every evaluator
+EVALUATION_CACHE_SIZE = 4096
+
+# Tile id ranges of the honor tiles in a count vector
+_WIND_IDS = slice(TILE_ID['E'], TILE_ID['N'] + 1)
+_DRAGON_IDS = slice(DRAGON_IDS.start, DRAGON_IDS.stop)
+
+# Suit bits of a suit-presence mask (see rules_specification.SUIT_REQUIREMENT_MASKS)
+_SUIT_BITS = (1 << NO_SUIT) - 1
+
+# Rank-presence bit of each tile id: bit n-1 for number n, 0 for tiles without a number
+_RANK_BITS = tuple(1 << (rank - 1) if rank else 0 for rank in TILE_RANK)
+
+# Allowed suit counts of the plain suit requirements
+_SUIT_COUNTS = {
+    'any_1_suit': (1,),
+    'any_2_suits': (2,),
+    'any_3_suits': (3,),
+    'any_1_or_2_suits': (1, 2),
+    'any_1_or_3_suits': (1, 3),
+    'any_2_or_3_suits': (2, 3),
+}
+
+# Five ranks in a row, as a rank-presence mask
+_FIVE_CONSECUTIVE = 0b11111
+
 class HandEvaluator:
     """Evaluates American Mahjong hands for patterns and scoring"""
     
+    # Results of evaluate_hand by (hand, year), least recently used first
+    _evaluation_cache: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+    
+    # Guards _evaluation_cache, which Flask's worker threads share
+    _evaluation_lock = threading.Lock()
+    
+    # Parsed components of each (pattern, year), shared read-only by every evaluator
+    _parsed_patterns: Dict[Tuple[str, int], Tuple[Dict, ...]] = {}
+    
     def __init__(self):
-        # Define all valid American Mahjong tiles
-        self.valid_tiles = {
-            'bams': [f"{i}B" for i in range(1, 10)],  # 1B-9B (Bamboo)
-            'cracks': [f"{i}C" for i in range(1, 10)],  # 1C-9C (Characters)
-            'dots': [f"{i}D" for i in range(1, 10)],  # 1D-9D (Circles)
-            'winds': ['E', 'S', 'W', 'N'],  # East, South, West, North
-            'dragons': ['R', 'G', '0'],  # Red, Green, White Dragons
-            'flowers': ['F'],  # Flowers
-            'jokers': ['J'],  # Jokers
-            'blanks': [f"B{i}" for i in range(1, 7)],  # B1-B6 (Blanks)
-            'year_tiles': ['2024']  # Year-specific tiles
-        }
-        
-        # Dragon associations for matching
-        self.dragon_associations = {
-            'C': 'R',  # Cracks/Characters match Red Dragon
-            'B': 'G',  # Bams/Bamboo match Green Dragon
-            'D': '0'   # Dots/Circles match White Dragon
-        }
+        # Shared read-only tile tables
+        self.valid_tiles = VALID_TILES
+        self.dragon_associations = DRAGON_ASSOCIATIONS
+        self._all_valid_tiles = _ALL_VALID_TILES
         
         # Import rules from rules specification
         from .rules_specification import mahjong_rules
         self.rules = mahjong_rules
-    
+
     def evaluate_hand(self, tiles: List[str], year: int = 2024) -> Dict:
         """
         Evaluate a 13-tile American Mahjong hand and return analysis
@@ -58,11 +106,21 @@ class HandEvaluator:
             # Validate all tiles are valid
             self._validate_tiles(tiles)
             
+            # Reuse the analysis of a hand seen before; the caller gets its own copy.
+            # The key keeps the tile order, which the distribution and groups follow
+            key = (tuple(tiles), year)
+            with self._evaluation_lock:
+                cached = self._evaluation_cache.get(key)
+                if cached is not None:
+                    self._evaluation_cache.move_to_end(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+            
             # Count tiles by suit
             tile_counts = Counter(tiles)
             
             # Find potential hands for the year
-            potential_hands = self._find_potential_hands(tiles, year)
+            potential_hands = self._find_potential_hands(tiles, year, tile_counts)
             
             # Find tiles needed to complete hands
             tiles_to_win = self._find_tiles_to_win(tiles, year)
@@ -76,7 +134,7 @@ class HandEvaluator:
             # Analyze hand structure
             hand_structure = self._analyze_hand_structure(tiles)
             
-            return {
+            analysis = {
                 "hand_value": hand_value,
                 "potential_hands": potential_hands,
                 "tiles_to_win": tiles_to_win,
@@ -85,6 +143,12 @@ class HandEvaluator:
                 "hand_structure": hand_structure,
                 "year": year
             }
+            cached = copy.deepcopy(analysis)
+            with self._evaluation_lock:
+                self._evaluation_cache[key] = cached
+                if len(self._evaluation_cache) > EVALUATION_CACHE_SIZE:
+                    self._evaluation_cache.popitem(last=False)
+            return analysis
             
         except Exception as e:
             logger.error(f"Error evaluating hand: {str(e)}")
@@ -92,24 +156,28 @@ class HandEvaluator:
     
     def _validate_tiles(self, tiles: List[str]) -> None:
         """Validate that all tiles are valid American Mahjong tiles"""
-        all_valid_tiles = []
-        for suit_tiles in self.valid_tiles.values():
-            all_valid_tiles.extend(suit_tiles)
-        
-        invalid_tiles = [tile for tile in tiles if tile not in all_valid_tiles]
+        invalid_tiles = [tile for tile in tiles if tile not in self._all_valid_tiles]
         if invalid_tiles:
             raise ValueError(f"Invalid tiles found: {invalid_tiles}")
     
-    def _find_potential_hands(self, tiles: List[str], year: int) -> List[Dict]:
-        """Find potential hands based on year-specific rules"""
+    def _find_potential_hands(self, tiles: List[str], year: int,
+                              tile_counts: Optional[Counter] = None) -> List[Dict]:
+        """
+        Find potential hands based on year-specific rules
+
+        tile_counts is Counter(tiles); it is built once here when not passed in
+        and shared by every pattern check.
+        """
         potential_hands = []
+        if tile_counts is None:
+            tile_counts = Counter(tiles)
         
         # Get year patterns from rules
         year_patterns = self.rules.get_all_patterns(year)
         
         # Check each pattern
         for pattern_id, pattern_info in year_patterns.items():
-            if self._check_pattern_match(tiles, pattern_info, year):
+            if self._check_pattern_match(tiles, pattern_info, year, tile_counts):
                 potential_hands.append({
                     "name": pattern_info['name'],
                     "points": pattern_info['points'],
@@ -121,23 +189,67 @@ class HandEvaluator:
                 })
         
         return potential_hands
-    
-    def _check_pattern_match(self, tiles: List[str], pattern_info: Dict, year: int) -> bool:
-        """Check if tiles match a specific pattern"""
+
+    def match_patterns(self, tiles: List[str], year: int = 2024) -> List[str]:
+        """
+        Find the patterns a hand completely covers using exact tile counts
+
+        Args:
+            tiles: List of tile strings
+            year: American Mahjong rules year
+
+        Returns:
+            List of matching pattern ids
+        """
+        self._validate_tiles(tiles)
+        return self.rules.match_hand(hand_counts(tiles), year)
+
+    def match_patterns_batch(self, hands: List[List[str]], year: int = 2024) -> List[List[str]]:
+        """
+        Find the patterns each of many hands completely covers, in one pass over the pattern table
+
+        Args:
+            hands: List of hands, each a list of tile strings
+            year: American Mahjong rules year
+
+        Returns:
+            List of matching pattern ids for each hand, in the order of hands
+        """
+        for tiles in hands:
+            self._validate_tiles(tiles)
+        if not hands:
+            return []
+        table = self.rules.get_pattern_table(year)
+        counts = np.stack([hand_counts(tiles) for tiles in hands])
+        return [[table.pattern_ids[i] for i in np.flatnonzero(row)] for row in table.match_many(counts)]
+
+    def _check_pattern_match(self, tiles: List[str], pattern_info: Dict, year: int,
+                             tile_counts: Optional[Counter] = None) -> bool:
+        """
+        Check if tiles match a specific pattern
+
+        tile_counts is Counter(tiles); callers checking many patterns pass it in
+        so it is built once per hand.
+        """
         pattern = pattern_info['pattern']
         suit_requirement = pattern_info.get('suit_requirement', 'any')
         joker_allowed = pattern_info.get('joker_allowed', True)
         
         # Check joker usage
-        joker_count = tiles.count('J')
+        if tile_counts is None:
+            tile_counts = Counter(tiles)
+        joker_count = tile_counts['J']
         if not joker_allowed and joker_count > 0:
             return False
         
-        # Parse pattern into components
-        pattern_components = self._parse_pattern(pattern, year)
+        # Parse pattern into components, once per pattern and year
+        key = (pattern, year)
+        pattern_components = self._parsed_patterns.get(key)
+        if pattern_components is None:
+            pattern_components = self._parsed_patterns[key] = tuple(self._parse_pattern(pattern, year))
         
         # Check if tiles can satisfy the pattern
-        if not self._can_satisfy_pattern(tiles, pattern_components, pattern_info, year):
+        if not self._can_satisfy_pattern(tiles, pattern_components, pattern_info, year, tile_counts):
             return False
         
         # Check suit requirements
@@ -203,15 +315,26 @@ class HandEvaluator:
         
         return components
     
-    def _can_satisfy_pattern(self, tiles: List[str], pattern_components: List[Dict], pattern_info: Dict, year: int) -> bool:
-        """Check if tiles can satisfy the pattern components"""
-        tile_counts = Counter(tiles)
+    def _can_satisfy_pattern(self, tiles: List[str], pattern_components: List[Dict], pattern_info: Dict, year: int,
+                             tile_counts: Optional[Counter] = None) -> bool:
+        """
+        Check if tiles can satisfy the pattern components
+
+        tile_counts is Counter(tiles), when the caller already has it.
+        """
+        if tile_counts is None:
+            tile_counts = Counter(tiles)
         
         # Remove flowers and jokers from consideration for pattern matching
         flower_count = tile_counts.get('F', 0)
         joker_count = tile_counts.get('J', 0)
         available_tiles = {k: v for k, v in tile_counts.items() if k not in ['F', 'J']}
         
+        # Numbered tiles by number across the suits; slot 0 collects the tiles without one
+        number_counts = [0] * 10
+        for tile, count in available_tiles.items():
+            number_counts[TILE_RANK[TILE_ID[tile]]] += count
+        
         # Check each component
         for component in pattern_components:
             if component['type'] == 'flower':
@@ -260,12 +383,7 @@ class HandEvaluator:
                     return False
             elif component['type'] == 'specific_numbers':
                 # Check for specific numbers in any suit
-                number_count = 0
-                for tile, count in available_tiles.items():
-                    if tile.endswith(('B', 'C', 'D')):
-                        number = int(tile[0])
-                        if number in component['numbers']:
-                            number_count += count
+                number_count = sum(number_counts[number] for number in set(component['numbers']) if 1 <= number <= 9)
                 if number_count < len(component['numbers']):  # Need at least one of each number
                     return False
             elif component['type'] == 'numbered_pattern':
@@ -274,12 +392,7 @@ class HandEvaluator:
                 count_needed = component['count']
                 
                 # Count tiles with this number in any suit
-                number_count = 0
-                for tile, count in available_tiles.items():
-                    if tile.endswith(('B', 'C', 'D')):
-                        tile_number = int(tile[0])
-                        if tile_number == number:
-                            number_count += count
+                number_count = number_counts[number] if 1 <= number <= 9 else 0
                 
                 if number_count < count_needed:
                     return False
@@ -287,81 +400,40 @@ class HandEvaluator:
         return True
     
     def _check_suit_requirements(self, tiles: List[str], suit_requirement: str, pattern_info: Dict) -> bool:
-        """Check if tiles meet suit requirements"""
-        numbered_tiles = [tile for tile in tiles if tile.endswith(('B', 'C', 'D'))]
-        
-        if not numbered_tiles:
+        """Check if tiles meet suit requirements, using suit- and rank-presence bitmasks of the hand"""
+        ids = tile_ids(tiles)
+        presence = 0
+        ranks = 0
+        for tile_id in ids:
+            presence |= TILE_MASK_BITS[tile_id]
+            ranks |= _RANK_BITS[tile_id]
+        
+        if not ranks:
             # No numbered tiles, check if pattern allows this
             return suit_requirement in ['any_3_dragons', 'any_2_dragons']
         
-        suits_used = set(tile[-1] for tile in numbered_tiles)
-        num_suits = len(suits_used)
-        
-        if suit_requirement == 'any_1_suit':
-            return num_suits == 1
-        elif suit_requirement == 'any_2_suits':
-            return num_suits == 2
-        elif suit_requirement == 'any_3_suits':
-            return num_suits == 3
-        elif suit_requirement == 'any_1_or_2_suits':
-            return num_suits in [1, 2]
-        elif suit_requirement == 'any_1_or_3_suits':
-            return num_suits in [1, 3]
-        elif suit_requirement == 'any_2_or_3_suits':
-            return num_suits in [2, 3]
-        elif suit_requirement == 'any_1_suit_matching_dragons':
-            if num_suits != 1:
-                return False
-            # Check if dragons match the suit
-            suit = list(suits_used)[0]
-            matching_dragon = self.dragon_associations.get(suit)
-            # Check if the matching dragon is in the tiles
-            return matching_dragon in tiles
-        elif suit_requirement == 'any_2_suits_matching_dragons':
-            if num_suits != 2:
-                return False
-            # Check if dragons match one of the suits
-            for suit in suits_used:
-                matching_dragon = self.dragon_associations.get(suit)
-                if matching_dragon in tiles:
-                    return True
-            return False
-        elif suit_requirement == 'any_1_suit_opposite_dragons':
-            if num_suits != 1:
-                return False
-            # Check if dragons don't match the suit
-            suit = list(suits_used)[0]
-            matching_dragon = self.dragon_associations.get(suit)
-            # Check if there's a dragon that doesn't match the suit
-            for dragon in ['R', 'G', '0']:
-                if dragon in tiles and dragon != matching_dragon:
-                    return True
-            return False
+        if suit_requirement in _SUIT_COUNTS:
+            return bin(presence & _SUIT_BITS).count('1') in _SUIT_COUNTS[suit_requirement]
+        elif suit_requirement in ('any_1_suit_matching_dragons', 'any_2_suits_matching_dragons',
+                                  'any_1_suit_opposite_dragons'):
+            # Dragons are compared by suit index through the rules' suit-presence mask
+            return presence in SUIT_REQUIREMENT_MASKS[suit_requirement]
         elif suit_requirement == 'any_5_consec_opposite_dragons':
-            # Check for 5 consecutive numbers
-            numbers = [int(tile[0]) for tile in numbered_tiles]
-            numbers.sort()
-            consecutive_count = 1
-            max_consecutive = 1
-            for i in range(1, len(numbers)):
-                if numbers[i] == numbers[i-1] + 1:
-                    consecutive_count += 1
-                    max_consecutive = max(max_consecutive, consecutive_count)
-                else:
-                    consecutive_count = 1
-            return max_consecutive >= 5
+            # Check for 5 consecutive numbers: some rank starts a full run of five bits
+            return any((ranks >> start) & _FIVE_CONSECUTIVE == _FIVE_CONSECUTIVE for start in range(5))
         elif suit_requirement == 'specific_numbers':
             # Check for specific numbers mentioned in pattern
-            specific_numbers = pattern_info.get('specific_numbers', [])
-            if not specific_numbers:
-                return True
-            numbers = [int(tile[0]) for tile in numbered_tiles]
-            return all(num in numbers for num in specific_numbers)
+            required = 0
+            for number in pattern_info.get('specific_numbers', []):
+                if not 1 <= number <= 9:
+                    return False  # Only ranks 1-9 can be held
+                required |= 1 << (number - 1)
+            return ranks & required == required
         elif suit_requirement == 'any_3_dragons':
-            dragon_count = sum(1 for tile in tiles if tile in ['R', 'G', '0'])
+            dragon_count = sum(map(ids.count, DRAGON_IDS))
             return dragon_count >= 3
         elif suit_requirement == 'any_2_dragons':
-            dragon_count = sum(1 for tile in tiles if tile in ['R', 'G', '0'])
+            dragon_count = sum(map(ids.count, DRAGON_IDS))
             return dragon_count >= 2
         
         return True  # Default to allowing any suit combination
@@ -392,16 +464,14 @@ class HandEvaluator:
                 helpful_tiles.append(tile)
         
         # Add tiles that could form sequences
-        for tile in tiles:
-            if tile.endswith(('B', 'C', 'D')):
-                number = int(tile[0])
-                suit = tile[-1]
-                
-                # Add tiles that could form sequences
+        for tile_id in tile_ids(tiles):
+            number = TILE_RANK[tile_id]
+            if number:
+                # Neighbouring numbers of the same suit have the neighbouring ids
                 if number > 1:
-                    helpful_tiles.append(f"{number-1}{suit}")
+                    helpful_tiles.append(TILE_NAMES[tile_id - 1])
                 if number < 9:
-                    helpful_tiles.append(f"{number+1}{suit}")
+                    helpful_tiles.append(TILE_NAMES[tile_id + 1])
         
         # Remove duplicates and limit results
         helpful_tiles = list(set(helpful_tiles))[:8]
@@ -420,36 +490,33 @@ class HandEvaluator:
             return "Weak"
     
     def _analyze_hand_structure(self, tiles: List[str]) -> Dict:
-        """Analyze the structure of the hand"""
-        tile_counts = Counter(tiles)
+        """Analyze the structure of the hand from its count vector, indexed by tile id"""
+        counts = hand_counts(tiles)
         
-        # Count by type
-        numbered_tiles = [tile for tile in tiles if tile.endswith(('B', 'C', 'D'))]
-        wind_tiles = [tile for tile in tiles if tile in ['E', 'S', 'W', 'N']]
-        dragon_tiles = [tile for tile in tiles if tile in ['R', 'G', '0']]
-        flower_tiles = [tile for tile in tiles if tile == 'F']
-        joker_tiles = [tile for tile in tiles if tile == 'J']
-        year_tiles = [tile for tile in tiles if tile == '2024']
+        # Numbered tiles in hand order, for the sequence search
+        numbered_tiles = [tile for tile in tiles if TILE_SUIT[TILE_ID[tile]] != NO_SUIT]
         
-        # Analyze suits
-        suits_used = set(tile[-1] for tile in numbered_tiles)
+        # Analyze suits; the numbered ids are nine per suit in SUIT_LETTERS order
+        suit_totals = counts[:NUM_NUMBERED].reshape(len(SUIT_LETTERS), 9).sum(axis=1)
+        suits_used = [SUIT_LETTERS[suit_index] for suit_index in np.flatnonzero(suit_totals)]
         
-        # Find pairs, triplets, etc.
-        pairs = [tile for tile, count in tile_counts.items() if count == 2]
-        triplets = [tile for tile, count in tile_counts.items() if count == 3]
-        quads = [tile for tile, count in tile_counts.items() if count == 4]
+        # Find pairs, triplets, etc., in the order the tiles first appear
+        distinct_tiles = dict.fromkeys(tiles)
+        pairs = [tile for tile in distinct_tiles if counts[TILE_ID[tile]] == 2]
+        triplets = [tile for tile in distinct_tiles if counts[TILE_ID[tile]] == 3]
+        quads = [tile for tile in distinct_tiles if counts[TILE_ID[tile]] == 4]
         
         # Find potential sequences
         sequences = self._find_potential_sequences(numbered_tiles)
         
         return {
-            "numbered_tiles": len(numbered_tiles),
-            "wind_tiles": len(wind_tiles),
-            "dragon_tiles": len(dragon_tiles),
-            "flower_tiles": len(flower_tiles),
-            "joker_tiles": len(joker_tiles),
-            "year_tiles": len(year_tiles),
-            "suits_used": list(suits_used),
+            "numbered_tiles": int(suit_totals.sum()),
+            "wind_tiles": int(counts[_WIND_IDS].sum()),
+            "dragon_tiles": int(counts[_DRAGON_IDS].sum()),
+            "flower_tiles": int(counts[FLOWER_ID]),
+            "joker_tiles": int(counts[JOKER_ID]),
+            "year_tiles": int(counts[YEAR_ID]),
+            "suits_used": suits_used,
             "num_suits": len(suits_used),
             "pairs": pairs,
             "triplets": triplets,
@@ -458,25 +525,14 @@ class HandEvaluator:
         }
     
     def _find_potential_sequences(self, numbered_tiles: List[str]) -> List[List[str]]:
-        """Find potential sequences in numbered tiles"""
-        sequences = []
-        
-        # Group by suit
-        by_suit = defaultdict(list)
-        for tile in numbered_tiles:
-            suit = tile[-1]
-            number = int(tile[0])
-            by_suit[suit].append((number, tile))
-        
-        # Find sequences in each suit
-        for suit, tiles in by_suit.items():
-            tiles.sort()  # Sort by number
-            numbers = [num for num, _ in tiles]
-            
-            # Find consecutive sequences
-            for i in range(len(numbers) - 2):
-                if numbers[i+1] == numbers[i] + 1 and numbers[i+2] == numbers[i] + 2:
-                    sequence = [tiles[i][1], tiles[i+1][1], tiles[i+2][1]]
-                    sequences.append(sequence)
+        """Find potential sequences in numbered tiles, each run of three ranks once"""
+        # Count each suit's ranks, one row per suit in SUIT_LETTERS order
+        counts = hand_counts(numbered_tiles)[:NUM_NUMBERED].reshape(len(SUIT_LETTERS), 9)
+        
+        # A run starts at every rank where it and the next two are all held
+        starts = np.minimum(np.minimum(counts[:, :-2], counts[:, 1:-1]), counts[:, 2:])
         
-        return sequences 
\ No newline at end of file
+        return [
+            [TILE_NAMES[suit_index * 9 + rank + offset] for offset in range(3)]
+            for suit_index, rank in zip(*np.nonzero(starts))
+        ]
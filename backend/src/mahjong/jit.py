@@ -0,0 +1,27 @@
+"""
+Optional Numba Support
+Exposes `njit` and `prange` from numba when it is installed, and pass-through
+stand-ins otherwise so jitted kernels still run as plain Python.
+"""
+
+try:
+    import numba
+except ImportError:  # numba is an optional speed-up
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+if NUMBA_AVAILABLE:
+    njit = numba.njit
+    prange = numba.prange
+else:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
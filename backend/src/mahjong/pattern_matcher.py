@@ -0,0 +1,518 @@
+"""
+American Mahjong Pattern Matcher
+Checks hands against year patterns using tile-count vectors. Each pattern is
+expanded into one required-count row per assignment of SUIT A/B/C to actual
+suits, and every match compares the hand's counts with those rows in NumPy.
+"""
+
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import permutations
+import threading
+from typing import Dict, List, Mapping, Optional, Tuple
+import numpy as np
+
+from .rules_specification import SUIT_REQUIREMENT_MASKS, TILE_MASK_BITS, Pattern, RuleBit
+from .tiles import SUIT_LETTERS, NUM_TILE_KINDS, JOKER_ID, ANY_DRAGON_ID, DRAGON_ID_FOR_SUIT
+
+# Pattern suit letters in the order they are mapped onto real suits
+PATTERN_SUITS = ('A', 'B', 'C')
+
+# Every assignment of SUIT A/B/C to Bams/Cracks/Dots (3! = 6 rows)
+SUIT_PERMUTATIONS = np.array(list(permutations(range(len(SUIT_LETTERS)))), dtype=np.int8)
+
+
+# Component flags that change which tiles a group needs
+_QUALIFIERS = ('matching', 'opposite', 'not_allowed')
+
+# Rule kinds that let every number of a pattern slide to another starting value
+_SHIFTABLE_RULES = RuleBit.CONSEC2 | RuleBit.CONSEC3 | RuleBit.CONSEC4 | RuleBit.CONSEC5 | RuleBit.ANY_NUMBER
+
+# Shared template and suit-map tuples, keyed by themselves
+_TEMPLATES: Dict[Tuple, Tuple] = {}
+_SUIT_MAPS: Dict[Tuple[int, ...], Tuple[int, ...]] = {}
+
+# Hands compared against every requirement row at once by PatternTable.match_many,
+# bounding its (hands, rows, tile kinds) intermediate to a few MB
+MATCH_BATCH_SIZE = 64
+
+
+# Zobrist keys: one random 64-bit word per (tile kind, count), with count 0 keyed
+# as 0 so a tile entering or leaving the hand updates the hash with two XORs
+ZOBRIST_COUNTS = 16
+_ZOBRIST = np.random.default_rng(0).integers(0, 2**64, size=(NUM_TILE_KINDS, ZOBRIST_COUNTS), dtype=np.uint64)
+_ZOBRIST[:, 0] = 0
+_KINDS = np.arange(NUM_TILE_KINDS)
+
+# Hands whose match results PatternTable keeps
+MATCH_CACHE_SIZE = 65536
+
+
+def hand_hash(hand_counts: np.ndarray) -> int:
+    """Get the 64-bit Zobrist hash of a tile-count vector"""
+    return int(np.bitwise_xor.reduce(_ZOBRIST[_KINDS, np.asarray(hand_counts) % ZOBRIST_COUNTS]))
+
+
+def update_hand_hash(hash_value: int, kind: int, old_count: int, new_count: int) -> int:
+    """Update a hand hash for one tile kind changing count, without rehashing the hand"""
+    return hash_value ^ int(_ZOBRIST[kind, old_count % ZOBRIST_COUNTS]) ^ int(_ZOBRIST[kind, new_count % ZOBRIST_COUNTS])
+
+
+def split_template(pattern_info: Dict) -> Tuple[Tuple, Tuple[int, ...]]:
+    """
+    Split a pattern into a suit-free template and the suit of each group
+
+    Args:
+        pattern_info: Pattern definition from the rules specification
+
+    Returns:
+        Tuple of (template, suit_map). The template holds one
+        (type, value_id, count, qualifier) entry per group and is shared by every
+        pattern with the same shape; suit_map holds the SUIT A/B/C index of
+        each group, or -1 for groups without a suit.
+    """
+    template = []
+    suit_map = []
+    for component in pattern_info['components']:
+        qualifier = next((flag for flag in _QUALIFIERS if component.get(flag)), '')
+        template.append((component['type'], component['value_id'], component['count'], qualifier))
+        suit = component.get('suit')
+        suit_map.append(PATTERN_SUITS.index(suit) if suit else -1)
+
+    template = tuple(template)
+    suit_map = tuple(suit_map)
+    return _TEMPLATES.setdefault(template, template), _SUIT_MAPS.setdefault(suit_map, suit_map)
+
+
+def number_offsets(pattern_info: Dict) -> Tuple[int, ...]:
+    """
+    Get the shifts applied to every number of a pattern to cover its
+    "any consecutive numbers" and "any number 1-9" variants
+
+    Args:
+        pattern_info: Pattern definition from the rules specification
+
+    Returns:
+        Tuple of offsets, (0,) for patterns whose numbers are fixed
+    """
+    rule_bits = pattern_info.get('rule_bits', RuleBit.NONE)
+    values = [component['value'] for component in pattern_info['components'] if component['type'] == 'number']
+    if not values or not rule_bits & _SHIFTABLE_RULES:
+        return (0,)
+
+    # Odd-number runs move in steps of two so the numbers stay odd
+    step = 2 if rule_bits & RuleBit.ODD else 1
+    return tuple(range(0, 9 - max(values) + 1, step))
+
+
+def build_requirements(pattern_info: Dict) -> np.ndarray:
+    """
+    Build the required tile counts of a pattern for every suit assignment
+
+    Args:
+        pattern_info: Pattern definition from the rules specification
+
+    Returns:
+        int8 array of shape (6 * len(number_offsets), NUM_TILE_KINDS), one row
+        per number offset and suit permutation
+    """
+    return _template_requirements(*split_template(pattern_info), number_offsets(pattern_info))
+
+
+@lru_cache(maxsize=None)
+def count_templates(pattern_info: Pattern) -> np.ndarray:
+    """
+    Get the read-only requirement rows of a pattern, built once per pattern
+
+    Args:
+        pattern_info: Frozen pattern record from the rules specification
+
+    Returns:
+        int8 array as returned by build_requirements
+    """
+    req_counts = build_requirements(pattern_info)
+    req_counts.setflags(write=False)
+    return req_counts
+
+
+def _template_requirements(template: Tuple, suit_map: Tuple[int, ...],
+                           offsets: Tuple[int, ...] = (0,)) -> np.ndarray:
+    """Build the requirement rows of a template projected onto a suit map"""
+    req_counts = np.zeros((len(offsets) * len(SUIT_PERMUTATIONS), NUM_TILE_KINDS), dtype=np.int8)
+    variants = [(offset, permutation) for offset in offsets for permutation in SUIT_PERMUTATIONS.tolist()]
+
+    for row, (offset, permutation) in enumerate(variants):
+        last_suit = 0
+        opposite_seen = 0
+        plain_dragons_seen = 0
+
+        for (group_type, value_id, count, qualifier), suit in zip(template, suit_map):
+            if group_type == 'number':
+                last_suit = suit
+                req_counts[row, permutation[suit] * 9 + value_id + offset] += count
+            elif group_type == 'dragon':
+                if value_id != ANY_DRAGON_ID:
+                    dragon_id = value_id
+                elif qualifier == 'matching':
+                    # Matching dragons follow the suit of the numbers before them
+                    dragon_id = DRAGON_ID_FOR_SUIT[permutation[last_suit]]
+                elif qualifier == 'opposite':
+                    # Opposite dragons take the dragon of another suit
+                    dragon_id = DRAGON_ID_FOR_SUIT[permutation[1 + opposite_seen % 2]]
+                    opposite_seen += 1
+                else:
+                    # Unqualified dragon groups are each a different dragon
+                    dragon_id = DRAGON_ID_FOR_SUIT[permutation[plain_dragons_seen % 3]]
+                    plain_dragons_seen += 1
+                req_counts[row, dragon_id] += count
+            elif group_type in ('wind', 'year'):
+                req_counts[row, value_id] += count
+            elif group_type == 'flower':
+                if qualifier != 'not_allowed':
+                    req_counts[row, value_id] += count
+
+    return req_counts
+
+
+def kind_masks(counts: np.ndarray) -> np.ndarray:
+    """
+    Get the set of tile kinds present in count vectors as a bitmask
+
+    Args:
+        counts: Count array whose last axis has NUM_TILE_KINDS entries
+
+    Returns:
+        uint64 array with bit k set where kind k has a nonzero count
+    """
+    present = (np.asarray(counts) > 0).astype(np.uint64)
+    return np.bitwise_or.reduce(present << np.arange(NUM_TILE_KINDS, dtype=np.uint64), axis=-1)
+
+
+def _popcount(masks: np.ndarray) -> np.ndarray:
+    """Count the set bits of each uint64 mask"""
+    return np.unpackbits(masks.view(np.uint8).reshape(len(masks), 8), axis=1).sum(axis=1)
+
+
+# Suit requirements in id order, and which suit-presence masks each allows
+SUIT_REQUIREMENT_NAMES = tuple(SUIT_REQUIREMENT_MASKS)
+REQ_MASK_TABLE = np.zeros((len(SUIT_REQUIREMENT_NAMES), 64), dtype=np.bool_)
+for _req_id, _masks in enumerate(SUIT_REQUIREMENT_MASKS.values()):
+    REQ_MASK_TABLE[_req_id, list(_masks)] = True
+_TILE_MASK_BITS = np.frombuffer(TILE_MASK_BITS, dtype=np.uint8)
+
+
+def validate_suit_requirements_batch(hands: np.ndarray, requirement_ids: np.ndarray) -> np.ndarray:
+    """
+    Check many hands against many suit requirements at once
+
+    Args:
+        hands: Integer array of shape (n_hands, n_tiles) holding tile ids
+        requirement_ids: Indexes into SUIT_REQUIREMENT_NAMES, shape (n_requirements,)
+
+    Returns:
+        Boolean array of shape (n_hands, n_requirements)
+    """
+    masks = np.bitwise_or.reduce(_TILE_MASK_BITS[np.asarray(hands)], axis=1)
+    return REQ_MASK_TABLE[np.asarray(requirement_ids)[None, :], masks[:, None]]
+
+
+# One packed record per pattern; req_idx points at the pattern's projection rows
+PATTERN_RECORD_DTYPE = np.dtype([
+    ('points', 'i2'),
+    ('cat', 'i1'),          # Index into HAND_CATEGORY_CODES
+    ('suit_req', 'i1'),     # Index into PatternTable.suit_requirements
+    ('joker', '?'),
+    ('rule_bits', 'i4'),
+    ('req_idx', 'i4')
+])
+
+# Hand categories in code order: Exposed, Concealed
+HAND_CATEGORY_CODES = ('X', 'C')
+
+# Bit layout of PatternTable.flags: one uint16 per pattern
+FLAG_CATEGORY_SHIFT = 0     # 1 bit: index into HAND_CATEGORY_CODES
+FLAG_JOKER_SHIFT = 1        # 1 bit: jokers allowed
+FLAG_SUIT_REQ_SHIFT = 2     # 4 bits: index into PatternTable.suit_requirements
+FLAG_POINTS_SHIFT = 6       # 3 bits: index into PatternTable.point_values
+_SUIT_REQ_BITS = 4
+_POINTS_BITS = 3
+
+# Component group types in code order
+COMPONENT_TYPES = ('number', 'dragon', 'wind', 'flower', 'year')
+
+# One packed row per pattern component, grouped by pattern
+COMPONENT_DTYPE = np.dtype([
+    ('ptype', 'u1'),        # Index into COMPONENT_TYPES
+    ('val', 'i1'),          # Component value id (see tiles.component_value_id)
+    ('cnt', 'u1'),
+    ('suit', 'i1')          # SUIT A/B/C index, -1 for groups without a suit
+])
+
+
+class PatternTable:
+    """
+    Requirement rows for a set of patterns, shared between patterns with the
+    same template and stacked into one contiguous int8 lookup table. Pattern
+    metadata is kept in one structured array with each category contiguous.
+    """
+
+    def __init__(self, categories: Mapping[str, Mapping[str, Dict]]):
+        """
+        Args:
+            categories: Pattern definitions keyed by category name, then pattern id
+        """
+        self.pattern_ids: List[str] = []
+        self.category_slices: Dict[str, slice] = {}
+        self.suit_requirements: List[str] = []
+
+        # One requirement matrix per distinct (template, suit_map, offsets) projection
+        projections: Dict[Tuple, int] = {}
+        requirements: List[np.ndarray] = []
+        records = []
+        components = []
+        component_offsets = [0]
+        for category_name, patterns in categories.items():
+            first = len(records)
+            for pattern_id, pattern_info in patterns.items():
+                projection = split_template(pattern_info) + (number_offsets(pattern_info),)
+                if projection not in projections:
+                    projections[projection] = len(requirements)
+                    requirements.append(_template_requirements(*projection))
+
+                suit_requirement = pattern_info.get('suit_requirement', 'any')
+                if suit_requirement not in self.suit_requirements:
+                    self.suit_requirements.append(suit_requirement)
+
+                self.pattern_ids.append(pattern_id)
+                template, suit_map = projection[:2]
+                components.extend(
+                    (COMPONENT_TYPES.index(group_type), value_id, count, suit)
+                    for (group_type, value_id, count, _), suit in zip(template, suit_map)
+                )
+                component_offsets.append(len(components))
+                records.append((
+                    pattern_info['points'],
+                    HAND_CATEGORY_CODES.index(pattern_info['category']),
+                    self.suit_requirements.index(suit_requirement),
+                    pattern_info.get('joker_allowed', True),
+                    pattern_info.get('rule_bits', 0),
+                    projections[projection]
+                ))
+            self.category_slices[category_name] = slice(first, len(records))
+        self.records = np.array(records, dtype=PATTERN_RECORD_DTYPE)
+        self._pack_flags()
+        self.components = np.array(components, dtype=COMPONENT_DTYPE)
+        self.component_offsets = np.array(component_offsets, dtype=np.int32)
+
+        # Stack every row into one table; row_starts marks where each projection begins
+        requirements = requirements or [np.zeros((0, NUM_TILE_KINDS), dtype=np.int8)]
+        self.req = np.ascontiguousarray(np.concatenate(requirements), dtype=np.int8)
+        # A hand (jokers included) with fewer tiles than the smallest requirement row
+        # cannot cover any pattern. Rows, not Pattern.total_tiles, set the bound:
+        # year groups and flowers can need fewer tiles than total_tiles counts
+        self.min_total_tiles = int(self.req.sum(axis=1).min()) if len(self.req) else 0
+        self.row_starts = np.cumsum([0] + [len(rows) for rows in requirements[:-1]]).astype(np.intp)
+        self.requirements = np.split(self.req, self.row_starts[1:])
+        self.row_masks = kind_masks(self.req)
+        self._match_cache: 'OrderedDict[Tuple[int, Optional[str]], Tuple[bytes, Tuple[str, ...]]]' = OrderedDict()
+        self._match_lock = threading.Lock()  # Tables are shared between threads
+
+        # Suit-free count signature of each projection: its required counts sorted
+        # largest first. Comparing it with the hand's sorted counts gives a lower
+        # bound on the tiles the hand is missing, whatever suits are used.
+        signatures = [sorted(rows[0][rows[0] > 0].tolist(), reverse=True) if len(rows) else [] for rows in requirements]
+        self.signatures = np.zeros((len(signatures), max(map(len, signatures), default=0)), dtype=np.int8)
+        for projection, signature in enumerate(signatures):
+            self.signatures[projection, :len(signature)] = signature
+
+    def _pack_flags(self):
+        """Pack category, joker use, suit requirement and points of every pattern into self.flags"""
+        self.point_values = sorted(set(self.records['points'].tolist()))
+        if len(self.suit_requirements) > 1 << _SUIT_REQ_BITS or len(self.point_values) > 1 << _POINTS_BITS:
+            raise ValueError("Too many suit requirements or point values to pack into pattern flags")
+
+        point_index = np.searchsorted(self.point_values, self.records['points']).astype(np.uint16)
+        self.flags = (
+            (self.records['cat'].astype(np.uint16) << FLAG_CATEGORY_SHIFT)
+            | (self.records['joker'].astype(np.uint16) << FLAG_JOKER_SHIFT)
+            | (self.records['suit_req'].astype(np.uint16) << FLAG_SUIT_REQ_SHIFT)
+            | (point_index << FLAG_POINTS_SHIFT)
+        ).astype(np.uint16)
+
+    def patterns_with_flags(self, category: Optional[str] = None, joker_allowed: Optional[bool] = None,
+                            suit_requirement: Optional[str] = None) -> np.ndarray:
+        """
+        Filter patterns by their packed flags with one mask-and-compare
+
+        Args:
+            category: Hand category code ('X' or 'C') to keep, or None for any
+            joker_allowed: Joker use to keep, or None for any
+            suit_requirement: Suit requirement to keep, or None for any
+
+        Returns:
+            Indexes into pattern_ids of the matching patterns
+        """
+        mask = 0
+        wanted = 0
+        if category is not None:
+            mask |= 1 << FLAG_CATEGORY_SHIFT
+            wanted |= HAND_CATEGORY_CODES.index(category) << FLAG_CATEGORY_SHIFT
+        if joker_allowed is not None:
+            mask |= 1 << FLAG_JOKER_SHIFT
+            wanted |= int(joker_allowed) << FLAG_JOKER_SHIFT
+        if suit_requirement is not None:
+            if suit_requirement not in self.suit_requirements:
+                return np.zeros(0, dtype=np.intp)
+            mask |= ((1 << _SUIT_REQ_BITS) - 1) << FLAG_SUIT_REQ_SHIFT
+            wanted |= self.suit_requirements.index(suit_requirement) << FLAG_SUIT_REQ_SHIFT
+        return np.flatnonzero(self.flags & np.uint16(mask) == wanted)
+
+    def candidate_patterns(self, hand_counts: np.ndarray) -> np.ndarray:
+        """
+        Screen out patterns by the tile kinds they use
+
+        Every kind a requirement row uses that the hand lacks costs at least one
+        joker, so a pattern is kept only if some row is short of no more kinds
+        than the jokers the pattern lets the hand use.
+
+        Args:
+            hand_counts: int8 tile-count vector of the hand
+
+        Returns:
+            Indexes into pattern_ids of the patterns worth a full match
+        """
+        if not self.pattern_ids:
+            return np.zeros(0, dtype=np.intp)
+        jokers = int(hand_counts[JOKER_ID])
+        missing_kinds = _popcount(self.row_masks & ~kind_masks(hand_counts))
+        fewest_missing = np.minimum.reduceat(missing_kinds, self.row_starts).take(self.records['req_idx'])
+        return np.flatnonzero(fewest_missing <= np.where(self.records['joker'], jokers, 0))
+
+    def get_components(self, pattern_idx: int) -> np.ndarray:
+        """Get the packed components of the pattern at pattern_idx, as a view into self.components"""
+        return self.components[self.component_offsets[pattern_idx]:self.component_offsets[pattern_idx + 1]]
+
+    def __getstate__(self) -> Dict:
+        # The per-projection views are rebuilt on load so req is pickled once;
+        # under protocol 5 its buffer can travel out of band, e.g. through shared memory
+        state = self.__dict__.copy()
+        del state['requirements']
+        del state['_match_cache']
+        del state['_match_lock']
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self.requirements = np.split(self.req, self.row_starts[1:])
+        self._match_cache = OrderedDict()
+        self._match_lock = threading.Lock()
+
+    def match(self, hand_counts: np.ndarray, category: Optional[str] = None) -> List[str]:
+        """
+        Find the patterns a hand completely covers, using jokers where allowed
+
+        Results are kept for the last MATCH_CACHE_SIZE hands, keyed by Zobrist
+        hash and checked against the stored counts so a collision cannot give a
+        wrong answer.
+
+        Args:
+            hand_counts: int8 tile-count vector of the hand
+            category: Only check patterns in this category
+
+        Returns:
+            List of matching pattern ids
+        """
+        hand_counts = np.asarray(hand_counts, dtype=np.int8)
+        key = (hand_hash(hand_counts), category)
+        counts_bytes = hand_counts.tobytes()
+        with self._match_lock:
+            cached = self._match_cache.get(key)
+            if cached is not None and cached[0] == counts_bytes:
+                self._match_cache.move_to_end(key)
+                return list(cached[1])
+
+        matched = self._match_uncached(hand_counts, category)
+        with self._match_lock:
+            self._match_cache[key] = (counts_bytes, tuple(matched))
+            if len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        return matched
+
+    def _match_uncached(self, hand_counts: np.ndarray, category: Optional[str] = None) -> List[str]:
+        """
+        Find the patterns a hand completely covers, using jokers where allowed
+
+        Args:
+            hand_counts: int8 tile-count vector of the hand
+            category: Only check patterns in this category
+
+        Returns:
+            List of matching pattern ids
+        """
+        if not self.pattern_ids or hand_counts.sum() < self.min_total_tiles:
+            return []
+
+        first = 0
+        records = self.records
+        if category is not None:
+            if category not in self.category_slices:
+                return []
+            first = self.category_slices[category].start
+            records = records[self.category_slices[category]]
+
+        jokers = int(hand_counts[JOKER_ID])
+
+        # Drop hands that cannot reach any projection even with every joker
+        hand_signature = np.sort(np.delete(hand_counts, JOKER_ID))[::-1][:self.signatures.shape[1]]
+        lower_bounds = np.maximum(self.signatures - hand_signature, 0).sum(axis=1)
+        if not (lower_bounds <= jokers).take(records['req_idx']).any():
+            return []
+
+        matched = self._match_batch(hand_counts[None, :])[0, first:first + len(records)]
+        return [self.pattern_ids[first + i] for i in np.flatnonzero(matched)]
+
+    def _match_batch(self, hands: np.ndarray) -> np.ndarray:
+        """Match an int8 (n_hands, NUM_TILE_KINDS) batch against every pattern; every match goes through here"""
+        # Tiles each hand is missing for every row, then the fewest over each projection's rows
+        row_deficits = np.maximum(self.req - hands[:, None, :], 0).sum(axis=2, dtype=np.int32)
+        deficits = np.minimum.reduceat(row_deficits, self.row_starts, axis=1).take(self.records['req_idx'], axis=1)
+        return (deficits == 0) | (self.records['joker'] & (deficits <= hands[:, JOKER_ID, None]))
+
+    def match_many(self, hands: np.ndarray) -> np.ndarray:
+        """
+        Find the patterns each of many hands completely covers, using jokers where allowed
+
+        Args:
+            hands: int8 array of shape (n_hands, NUM_TILE_KINDS) with jokers
+                counted at JOKER_ID
+
+        Returns:
+            bool array of shape (n_hands, len(pattern_ids)), True where the hand
+            covers the pattern
+        """
+        hands = np.asarray(hands, dtype=np.int8)
+        if hands.ndim != 2 or hands.shape[1] != NUM_TILE_KINDS:
+            raise ValueError(f"Hands must have shape (n_hands, {NUM_TILE_KINDS})")
+
+        matched = np.zeros((len(hands), len(self.pattern_ids)), dtype=np.bool_)
+        if not self.pattern_ids:
+            return matched
+
+        for first in range(0, len(hands), MATCH_BATCH_SIZE):
+            matched[first:first + MATCH_BATCH_SIZE] = self._match_batch(hands[first:first + MATCH_BATCH_SIZE])
+        return matched
+
+    def score_hands(self, hands: np.ndarray) -> np.ndarray:
+        """
+        Score many hands at once, for simulations that evaluate hands in bulk
+
+        Args:
+            hands: int8 array of shape (n_hands, NUM_TILE_KINDS) with jokers
+                counted at JOKER_ID
+
+        Returns:
+            int32 array with the highest points of any pattern each hand covers,
+            0 for hands that cover none
+        """
+        matched = self.match_many(hands)
+        return np.where(matched, self.records['points'], 0).max(axis=1, initial=0).astype(np.int32)
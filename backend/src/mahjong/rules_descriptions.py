@@ -0,0 +1,95 @@
+"""
+American Mahjong Rules Descriptions
+Human-readable descriptions of the suit requirements, joker rules and hand
+categories, used by the rules help API only. Kept apart from rules_specification so matching and validation
+never load them.
+"""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# Suit Requirements Definitions
+SUIT_REQUIREMENTS: Mapping[str, Any] = MappingProxyType({
+    'any_1_suit': {
+        'description': 'All numbered tiles must be from the same suit',
+        'validation': 'All numbered tiles must be B, C, or D (not mixed)',
+        'examples': ['All Bams', 'All Cracks', 'All Dots']
+    },
+    'any_2_suits': {
+        'description': 'Numbered tiles can be from exactly 2 different suits',
+        'validation': 'Must have tiles from exactly 2 suits (B+C, B+D, C+D)',
+        'examples': ['Bams + Cracks', 'Bams + Dots', 'Cracks + Dots']
+    },
+    'any_3_suits': {
+        'description': 'Numbered tiles can be from all 3 suits',
+        'validation': 'Must have tiles from all 3 suits (B+C+D)',
+        'examples': ['Bams + Cracks + Dots']
+    },
+    'any_1_or_2_suits': {
+        'description': 'Numbered tiles can be from 1 or 2 suits',
+        'validation': 'Can be all one suit OR exactly 2 suits',
+        'examples': ['All Bams', 'Bams + Cracks', 'Cracks + Dots']
+    },
+    'any_2_or_3_suits': {
+        'description': 'Numbered tiles can be from 2 or 3 suits',
+        'validation': 'Must have tiles from 2 or 3 suits (not all one suit)',
+        'examples': ['Bams + Cracks', 'Bams + Cracks + Dots']
+    },
+    'any_1_suit_matching_dragons': {
+        'description': 'All numbered tiles from same suit, dragons must match that suit',
+        'validation': 'One suit + matching dragons (C+R, B+G, D+0)',
+        'examples': ['Cracks + Red Dragons', 'Bams + Green Dragons', 'Dots + White Dragons']
+    },
+    'any_1_suit_opposite_dragons': {
+        'description': 'All numbered tiles from same suit, dragons must NOT match that suit',
+        'validation': 'One suit + opposite dragons (C+G/0, B+R/0, D+R/G)',
+        'examples': ['Cracks + Green/White Dragons', 'Bams + Red/White Dragons']
+    },
+    'any_2_suits_matching_dragons': {
+        'description': 'Numbered tiles from 2 suits, dragons must match one of those suits',
+        'validation': 'Two suits + dragons matching one of those suits',
+        'examples': ['Bams+Cracks + Red Dragons', 'Bams+Dots + Green Dragons']
+    },
+    'any_3_dragons': {
+        'description': 'Must use all 3 types of dragons',
+        'validation': 'Must have Red, Green, and White dragons',
+        'examples': ['R + G + 0']
+    },
+    'any_2_dragons': {
+        'description': 'Must use exactly 2 types of dragons',
+        'validation': 'Must have exactly 2 different dragon types',
+        'examples': ['R + G', 'R + 0', 'G + 0']
+    },
+    'specific_numbers': {
+        'description': 'Can only use the specific numbers shown in the pattern',
+        'validation': 'Numbers must match exactly what is specified',
+        'examples': ['Only 1,2,3,4,5', 'Only 3,6,9', 'Only 1,3,5,7,9']
+    }
+})
+
+# Joker Usage Rules
+JOKER_RULES: Mapping[str, Any] = MappingProxyType({
+    'general': {
+        'max_jokers': 8,
+        'substitution': 'Can substitute for any tile except in Singles and Pairs',
+        'representation': 'Must represent specific tile needed for pattern'
+    },
+    'restrictions': {
+        'singles_and_pairs': 'Jokers cannot be used in Singles and Pairs category',
+        'concealed_hands': 'Jokers allowed in both exposed (X) and concealed (C) hands'
+    }
+})
+
+# Hand Categories
+HAND_CATEGORIES: Mapping[str, Any] = MappingProxyType({
+    'X': {
+        'name': 'Exposed',
+        'description': 'Can have exposed melds',
+        'restrictions': 'None - can be exposed or concealed'
+    },
+    'C': {
+        'name': 'Concealed',
+        'description': 'Must be concealed hand only',
+        'restrictions': 'No exposed melds allowed'
+    }
+})
@@ -3,1257 +3,1648 @@ American Mahjong Rules Specification
 Comprehensive rules and pattern definitions for 2024 American Mahjong
 """
 
-from typing import Dict, List, Any
+from collections.abc import Mapping
+from dataclasses import dataclass, fields
+from enum import IntFlag
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+import pickle
+import sys
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from .tiles import DRAGON_ID_FOR_SUIT, NO_SUIT, NUM_TILE_KINDS, TILE_SUIT, component_value_id, tile_ids
+
+
+class RuleBit(IntFlag):
+    """Kinds of special rule a pattern can carry"""
+    NONE = 0
+    CONSEC2 = 1                 # Any 2 consecutive numbers
+    CONSEC3 = 2                 # Any 3 consecutive numbers
+    CONSEC4 = 4                 # Any 4 consecutive numbers
+    CONSEC5 = 8                 # Any 5 consecutive numbers
+    ANY_NUMBER = 16             # Numbers can be any 1-9
+    ODD = 32                    # Odd numbers only
+    THREE_SIX_NINE = 64         # Numbers 3, 6, 9 only
+    MATCHING_DRAGONS = 128      # Dragons match the suit of the numbers
+    OPPOSITE_DRAGONS = 256      # Dragons do not match the suit of the numbers
+    SAME_NUMBER_AB = 512        # SUIT A and SUIT B use the same numbers
+    WHITE_DRAGON_ZERO = 1024    # Zeros are White Dragons
+    NO_FLOWERS = 2048           # Flowers shown in the pattern are not allowed
+    FIXED_WINDS = 4096          # Winds are exactly as shown
+    ANY_WIND = 8192             # Wind can be any one of N, E, W, S
+    DIFFERENT_NUMBERS = 16384   # Numbers must differ from each other
+
+
+# Special-rule phrases (lowercase) and the rule kind each one sets
+_RULE_PHRASES = (
+    ('any 2 consecutive', RuleBit.CONSEC2),
+    ('any consecutive numbers (12,', RuleBit.CONSEC2),
+    ('any 3 consecutive', RuleBit.CONSEC3),
+    ('consecutive options: 123', RuleBit.CONSEC3),
+    ('any 4 consecutive', RuleBit.CONSEC4),
+    ('any 5 consecutive', RuleBit.CONSEC5),
+    ('any number 1-9', RuleBit.ANY_NUMBER),
+    ('can be any 1-9', RuleBit.ANY_NUMBER),
+    ('any like numbers', RuleBit.ANY_NUMBER),
+    ('odd', RuleBit.ODD),
+    ('3, 6', RuleBit.THREE_SIX_NINE),
+    ('matching dragons', RuleBit.MATCHING_DRAGONS),
+    ('dragons must match', RuleBit.MATCHING_DRAGONS),
+    ('opposite dragon', RuleBit.OPPOSITE_DRAGONS),
+    ('same number', RuleBit.SAME_NUMBER_AB),
+    ('white dragon', RuleBit.WHITE_DRAGON_ZERO),
+    ('no flowers', RuleBit.NO_FLOWERS),
+    ('winds are fixed', RuleBit.FIXED_WINDS),
+    ('wind can be', RuleBit.ANY_WIND),
+    ('must be different', RuleBit.DIFFERENT_NUMBERS),
+)
+
+
+def parse_rule_bits(special_rules: Iterable[str]) -> RuleBit:
+    """Compile free-text special rules into a RuleBit mask"""
+    rule_bits = RuleBit.NONE
+    for rule in special_rules:
+        rule = rule.lower()
+        for phrase, bit in _RULE_PHRASES:
+            if phrase in rule:
+                rule_bits |= bit
+    return rule_bits
+
+
+# Suit-presence mask of a hand: bits 0-2 mark the suits of its numbered tiles,
+# bits 3-5 mark its dragons, each at the index of the suit that dragon matches
+_DRAGON_SHIFT = NO_SUIT
+_ALL_MASKS = range(1 << (2 * _DRAGON_SHIFT))
+
+
+def _tile_mask_bit(tile_id: int) -> int:
+    """Get the suit-presence bit a tile sets, 0 for tiles that set none"""
+    if TILE_SUIT[tile_id] != NO_SUIT:
+        return 1 << TILE_SUIT[tile_id]
+    if tile_id in DRAGON_ID_FOR_SUIT:
+        return 1 << (_DRAGON_SHIFT + DRAGON_ID_FOR_SUIT.index(tile_id))
+    return 0
+
+
+TILE_MASK_BITS = bytes(_tile_mask_bit(tile_id) for tile_id in range(NUM_TILE_KINDS))
+
+
+def _masks_where(rule: Callable[[int, int], bool]) -> frozenset:
+    """Collect every suit-presence mask whose (suits, dragons) halves satisfy a rule"""
+    suit_bits = (1 << _DRAGON_SHIFT) - 1
+    return frozenset(mask for mask in _ALL_MASKS if rule(mask & suit_bits, mask >> _DRAGON_SHIFT))
+
+
+def _suit_count(suits: int) -> int:
+    """Count the set bits of a 3-bit suit or dragon mask"""
+    return bin(suits).count('1')
+
+
+# Allowed suit-presence masks of each suit requirement
+SUIT_REQUIREMENT_MASKS: Mapping[str, frozenset] = MappingProxyType({
+    'any_1_suit': _masks_where(lambda suits, dragons: _suit_count(suits) == 1),
+    'any_2_suits': _masks_where(lambda suits, dragons: _suit_count(suits) == 2),
+    'any_3_suits': _masks_where(lambda suits, dragons: _suit_count(suits) == 3),
+    'any_1_or_2_suits': _masks_where(lambda suits, dragons: _suit_count(suits) in (1, 2)),
+    'any_2_or_3_suits': _masks_where(lambda suits, dragons: _suit_count(suits) in (2, 3)),
+    'any_1_suit_matching_dragons': _masks_where(lambda suits, dragons: _suit_count(suits) == 1 and bool(dragons & suits)),
+    'any_1_suit_opposite_dragons': _masks_where(lambda suits, dragons: _suit_count(suits) == 1 and bool(dragons & ~suits)),
+    'any_2_suits_matching_dragons': _masks_where(lambda suits, dragons: _suit_count(suits) == 2 and bool(dragons & suits)),
+    'any_3_dragons': _masks_where(lambda suits, dragons: _suit_count(dragons) == 3),
+    'any_2_dragons': _masks_where(lambda suits, dragons: _suit_count(dragons) == 2),
+    # The numbers themselves are checked against the pattern, not the suits
+    'specific_numbers': frozenset(_ALL_MASKS)
+})
+
+
+def suit_presence_mask(tiles: Iterable[str]) -> int:
+    """Get the suit-presence mask of a hand (see SUIT_REQUIREMENT_MASKS)"""
+    mask = 0
+    for tile_id in tile_ids(tiles):
+        mask |= TILE_MASK_BITS[tile_id]
+    return mask
+
+
+def validate_suit_requirement(tiles: Iterable[str], requirement: str) -> bool:
+    """
+    Check whether the suits and dragons of a hand meet a suit requirement
+
+    Args:
+        tiles: Tile strings of the hand
+        requirement: Suit requirement name, as in MahjongRules.suit_requirements
+
+    Returns:
+        True if the hand's suit-presence mask is allowed by the requirement
+    """
+    if requirement not in SUIT_REQUIREMENT_MASKS:
+        raise ValueError(f"Unknown suit requirement: {requirement}")
+    return suit_presence_mask(tiles) in SUIT_REQUIREMENT_MASKS[requirement]
+
+
+class _Record:
+    """Read-only dict-style access to record fields, skipping fields that are unset (None)"""
+    __slots__ = ()
+
+    # Properties readable as keys alongside the dataclass fields
+    _DERIVED: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key, None) if key in self.__dataclass_fields__ or key in self._DERIVED else None
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        names = [field.name for field in fields(self)] + list(self._DERIVED)
+        return [name for name in names if getattr(self, name) is not None]
+
+
+@dataclass(frozen=True)
+class Component(_Record):
+    """One tile group of a pattern"""
+    __slots__ = ('type', 'value', 'value_id', 'count', 'suit', 'matching', 'opposite', 'not_allowed', 'special')
+    type: str
+    value: Any
+    value_id: int           # Number minus one, tile id, or ANY_DRAGON_ID (see tiles.component_value_id)
+    count: int
+    suit: Optional[str]
+    matching: Optional[bool]
+    opposite: Optional[bool]
+    not_allowed: Optional[bool]
+    special: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Component':
+        """Build a component from its dict definition"""
+        return cls(
+            type=sys.intern(data['type']),
+            value=data['value'],
+            value_id=component_value_id(data['value']),
+            count=data['count'],
+            suit=_intern_str(data.get('suit')),
+            matching=data.get('matching'),
+            opposite=data.get('opposite'),
+            not_allowed=data.get('not_allowed'),
+            special=data.get('special')
+        )
+
+
+def _intern_str(value: Optional[str]) -> Optional[str]:
+    """Intern an optional string field so equal values share one object"""
+    return sys.intern(value) if value is not None else None
+
+
+# Shared component records and component tuples, keyed by themselves
+_INTERNED: Dict[Any, Any] = {}
+
+
+def _intern(record: Any) -> Any:
+    """Return the shared copy of an equal record so duplicates are stored once"""
+    return _INTERNED.setdefault(record, record)
+
+
+@dataclass(frozen=True)
+class Pattern(_Record):
+    """A winning hand pattern"""
+    # Slots are laid out in this order: the fields read while matching come first so
+    # they share the record's first cache line, and the display text comes last
+    __slots__ = ('points', 'category', 'suit_requirement', 'joker_allowed', 'rule_bits', 'components',
+                 'name', 'pattern', 'description', 'special_rules')
+    _DERIVED = ('total_tiles',)
+    name: str
+    pattern: str
+    description: str
+    points: int
+    category: str
+    suit_requirement: str
+    joker_allowed: bool
+    special_rules: Optional[Tuple[str, ...]]
+    components: Tuple[Component, ...]
+    rule_bits: RuleBit
+
+    @property
+    def count_templates(self) -> 'np.ndarray':
+        """Required tile counts per suit assignment and number offset, as an int8 array"""
+        from .pattern_matcher import count_templates
+        return count_templates(self)
+
+    @property
+    def total_tiles(self) -> int:
+        """
+        Number of tiles in the pattern, summed from the components; a year group
+        counts one tile per digit. This is what /api/get-patterns reports, so a
+        pattern defined short of 14 tiles (consec_FFFF_123_444_444 has 13) says so
+        """
+        return sum(
+            component.count * (len(component.value) if component.type == 'year' else 1)
+            for component in self.components
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Pattern':
+        """Build a pattern from its dict definition"""
+        special_rules = data.get('special_rules')
+        components = _intern(tuple(_intern(Component.from_dict(component)) for component in data['components']))
+
+        # Dragon and flower flags on the components carry the same rules as the text
+        rule_bits = parse_rule_bits(special_rules or ())
+        if any(component.matching for component in components):
+            rule_bits |= RuleBit.MATCHING_DRAGONS
+        if any(component.opposite for component in components):
+            rule_bits |= RuleBit.OPPOSITE_DRAGONS
+        if any(component.not_allowed for component in components):
+            rule_bits |= RuleBit.NO_FLOWERS
+
+        pattern = cls(
+            name=data['name'],
+            pattern=data['pattern'],
+            description=data['description'],
+            points=data['points'],
+            category=sys.intern(data['category']),
+            suit_requirement=sys.intern(data['suit_requirement']),
+            joker_allowed=data['joker_allowed'],
+            special_rules=tuple(special_rules) if special_rules is not None else None,
+            components=components,
+            rule_bits=rule_bits
+        )
+
+        # The components must account for every tile written in the pattern
+        shown_tiles = len(pattern.pattern.replace(' ', ''))
+        if pattern.total_tiles != shown_tiles:
+            raise ValueError(
+                f"Pattern '{pattern.name}' components have {pattern.total_tiles} tiles "
+                f"but the pattern shows {shown_tiles}"
+            )
+        return pattern
+
+
+# Tile Definitions, as tile ids (tiles.TILE_NAMES gives the display string of each id)
+TILE_DEFINITIONS: Mapping[str, Any] = MappingProxyType({
+    'numbered_tiles': {
+        'bams': tile_ids(f"{i}B" for i in range(1, 10)),      # 1B-9B (Bamboo)
+        'cracks': tile_ids(f"{i}C" for i in range(1, 10)),     # 1C-9C (Characters)
+        'dots': tile_ids(f"{i}D" for i in range(1, 10))        # 1D-9D (Circles)
+    },
+    'honor_tiles': {
+        'winds': tile_ids(['E', 'S', 'W', 'N']),                 # East, South, West, North
+        'dragons': tile_ids(['R', 'G', '0']),                    # Red, Green, White Dragons
+        'flowers': tile_ids(['F']),                               # Flowers (Jokers)
+        'year_tiles': tile_ids(['2024'])                         # Year-specific tiles
+    }
+})
+
+# Dragon Associations (Traditional)
+DRAGON_ASSOCIATIONS: Mapping[str, Any] = MappingProxyType({
+    'C': 'R',  # Cracks/Characters match Red Dragon
+    'B': 'G',  # Bams/Bamboo match Green Dragon
+    'D': '0'   # Dots/Circles match White Dragon
+})
+
 
 class MahjongRules:
     """Comprehensive 2024 American Mahjong rules specification"""
+
+    # Rule tables shared with the module-level constants
+    tile_definitions = TILE_DEFINITIONS
+    dragon_associations = DRAGON_ASSOCIATIONS
+
+    # Shared instance; the rules are static so every MahjongRules() returns the same object
+    _instance: Optional['MahjongRules'] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __reduce__(self):
+        # Workers rebuild the shared instance from the data file instead of unpickling a copy
+        return (MahjongRules, ())
+
+    @property
+    def suit_requirements(self) -> Mapping[str, Any]:
+        """Descriptions of every suit requirement, loaded on first use"""
+        from .rules_descriptions import SUIT_REQUIREMENTS
+        return SUIT_REQUIREMENTS
+
+    @property
+    def joker_rules(self) -> Mapping[str, Any]:
+        """Descriptions of the joker rules, loaded on first use"""
+        from .rules_descriptions import JOKER_RULES
+        return JOKER_RULES
+
+    @property
+    def hand_categories(self) -> Mapping[str, Any]:
+        """Descriptions of the exposed and concealed hand categories, loaded on first use"""
+        from .rules_descriptions import HAND_CATEGORIES
+        return HAND_CATEGORIES
+
+    @property
+    def year_patterns(self) -> Mapping[int, Mapping[str, Dict[str, Pattern]]]:
+        """Pattern definitions by year; categories are built on first access"""
+        return YEAR_PATTERNS
     
-    def __init__(self):
-        # Tile Definitions
-        self.tile_definitions = {
-            'numbered_tiles': {
-                'bams': [f"{i}B" for i in range(1, 10)],      # 1B-9B (Bamboo)
-                'cracks': [f"{i}C" for i in range(1, 10)],     # 1C-9C (Characters)
-                'dots': [f"{i}D" for i in range(1, 10)]        # 1D-9D (Circles)
-            },
-            'honor_tiles': {
-                'winds': ['E', 'S', 'W', 'N'],                 # East, South, West, North
-                'dragons': ['R', 'G', '0'],                    # Red, Green, White Dragons
-                'flowers': ['F'],                               # Flowers (Jokers)
-                'year_tiles': ['2024']                         # Year-specific tiles
-            }
-        }
-        
-        # Dragon Associations (Traditional)
-        self.dragon_associations = {
-            'C': 'R',  # Cracks/Characters match Red Dragon
-            'B': 'G',  # Bams/Bamboo match Green Dragon  
-            'D': '0'   # Dots/Circles match White Dragon
-        }
-        
-        # Suit Requirements Definitions
-        self.suit_requirements = {
-            'any_1_suit': {
-                'description': 'All numbered tiles must be from the same suit',
-                'validation': 'All numbered tiles must be B, C, or D (not mixed)',
-                'examples': ['All Bams', 'All Cracks', 'All Dots']
-            },
-            'any_2_suits': {
-                'description': 'Numbered tiles can be from exactly 2 different suits',
-                'validation': 'Must have tiles from exactly 2 suits (B+C, B+D, C+D)',
-                'examples': ['Bams + Cracks', 'Bams + Dots', 'Cracks + Dots']
-            },
-            'any_3_suits': {
-                'description': 'Numbered tiles can be from all 3 suits',
-                'validation': 'Must have tiles from all 3 suits (B+C+D)',
-                'examples': ['Bams + Cracks + Dots']
-            },
-            'any_1_or_2_suits': {
-                'description': 'Numbered tiles can be from 1 or 2 suits',
-                'validation': 'Can be all one suit OR exactly 2 suits',
-                'examples': ['All Bams', 'Bams + Cracks', 'Cracks + Dots']
-            },
-            'any_2_or_3_suits': {
-                'description': 'Numbered tiles can be from 2 or 3 suits',
-                'validation': 'Must have tiles from 2 or 3 suits (not all one suit)',
-                'examples': ['Bams + Cracks', 'Bams + Cracks + Dots']
-            },
-            'any_1_suit_matching_dragons': {
-                'description': 'All numbered tiles from same suit, dragons must match that suit',
-                'validation': 'One suit + matching dragons (C+R, B+G, D+0)',
-                'examples': ['Cracks + Red Dragons', 'Bams + Green Dragons', 'Dots + White Dragons']
-            },
-            'any_1_suit_opposite_dragons': {
-                'description': 'All numbered tiles from same suit, dragons must NOT match that suit',
-                'validation': 'One suit + opposite dragons (C+G/0, B+R/0, D+R/G)',
-                'examples': ['Cracks + Green/White Dragons', 'Bams + Red/White Dragons']
-            },
-            'any_2_suits_matching_dragons': {
-                'description': 'Numbered tiles from 2 suits, dragons must match one of those suits',
-                'validation': 'Two suits + dragons matching one of those suits',
-                'examples': ['Bams+Cracks + Red Dragons', 'Bams+Dots + Green Dragons']
-            },
-            'any_3_dragons': {
-                'description': 'Must use all 3 types of dragons',
-                'validation': 'Must have Red, Green, and White dragons',
-                'examples': ['R + G + 0']
-            },
-            'any_2_dragons': {
-                'description': 'Must use exactly 2 types of dragons',
-                'validation': 'Must have exactly 2 different dragon types',
-                'examples': ['R + G', 'R + 0', 'G + 0']
-            },
-            'specific_numbers': {
-                'description': 'Can only use the specific numbers shown in the pattern',
-                'validation': 'Numbers must match exactly what is specified',
-                'examples': ['Only 1,2,3,4,5', 'Only 3,6,9', 'Only 1,3,5,7,9']
-            }
-        }
-        
-        # Joker Usage Rules
-        self.joker_rules = {
-            'general': {
-                'max_jokers': 8,
-                'substitution': 'Can substitute for any tile except in Singles and Pairs',
-                'representation': 'Must represent specific tile needed for pattern'
-            },
-            'restrictions': {
-                'singles_and_pairs': 'Jokers cannot be used in Singles and Pairs category',
-                'concealed_hands': 'Jokers allowed in both exposed (X) and concealed (C) hands'
-            }
-        }
-        
-        # Hand Categories
-        self.hand_categories = {
-            'X': {
-                'name': 'Exposed',
-                'description': 'Can have exposed melds',
-                'restrictions': 'None - can be exposed or concealed'
-            },
-            'C': {
-                'name': 'Concealed',
-                'description': 'Must be concealed hand only',
-                'restrictions': 'No exposed melds allowed'
-            }
-        }
-        
-        # 2024 Pattern Definitions - Complete Implementation
-        self.year_patterns = {
-            2024: {
-                '2024_patterns': {
-                    '2024_222_000_2222_4444': {
-                        'name': '2024 222 000 2222 4444',
-                        'pattern': '222 000 2222 4444',
-                        'description': 'SUIT A, SUIT B (different suits)',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_2_suits',
-                        'joker_allowed': True,
-                        'special_rules': ['All zeros must be White Dragons'],
-                        'components': [
-                            {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
-                            {'type': 'dragon', 'value': '0', 'count': 3, 'special': 'white_dragon'},
-                            {'type': 'number', 'value': 2, 'count': 4, 'suit': 'B'},
-                            {'type': 'number', 'value': 4, 'count': 4, 'suit': 'B'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2024_FFFF_2222_0000_24': {
-                        'name': '2024 FFFF 2222 0000 24',
-                        'pattern': 'FFFF 2222 0000 24',
-                        'description': 'SUIT A and SUIT B (any suits)',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_2_suits',
-                        'joker_allowed': True,
-                        'special_rules': ['0000 must be White Dragons', '24 means one 2-tile and one 4-tile'],
-                        'components': [
-                            {'type': 'flower', 'value': 'F', 'count': 4},
-                            {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
-                            {'type': 'dragon', 'value': '0', 'count': 4, 'special': 'white_dragon'},
-                            {'type': 'number', 'value': 2, 'count': 1, 'suit': 'B'},
-                            {'type': 'number', 'value': 4, 'count': 1, 'suit': 'B'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2024_FF_2024_2222_2222': {
-                        'name': '2024 FF 2024 2222 2222 (Option A)',
-                        'pattern': 'FF 2024 2222 2222',
-                        'description': 'Three different suits allowed',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_3_suits',
-                        'joker_allowed': True,
-                        'special_rules': ['In 2024, the 0 must be White Dragon'],
-                        'components': [
-                            {'type': 'flower', 'value': 'F', 'count': 2},
-                            {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'},
-                            {'type': 'number', 'value': 2, 'count': 4, 'suit': 'B'},
-                            {'type': 'number', 'value': 2, 'count': 4, 'suit': 'C'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2024_FF_2024_4444_4444': {
-                        'name': '2024 FF 2024 4444 4444 (Option B)',
-                        'pattern': 'FF 2024 4444 4444',
-                        'description': 'Three different suits allowed',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_3_suits',
-                        'joker_allowed': True,
-                        'special_rules': ['In 2024, the 0 must be White Dragon'],
-                        'components': [
-                            {'type': 'flower', 'value': 'F', 'count': 2},
-                            {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'},
-                            {'type': 'number', 'value': 4, 'count': 4, 'suit': 'B'},
-                            {'type': 'number', 'value': 4, 'count': 4, 'suit': 'C'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2024_NN_EEE_2024_WWW_SS': {
-                        'name': '2024 NN EEE 2024 WWW SS',
-                        'pattern': 'NN EEE 2024 WWW SS',
-                        'description': 'SUIT A can be any suit',
-                        'points': 30,
-                        'category': 'X',
-                        'suit_requirement': 'any_1_suit',
-                        'joker_allowed': True,
-                        'special_rules': ['In 2024, the 0 must be White Dragon', 'Winds are fixed'],
-                        'components': [
-                            {'type': 'wind', 'value': 'N', 'count': 2},
-                            {'type': 'wind', 'value': 'E', 'count': 3},
-                            {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'},
-                            {'type': 'wind', 'value': 'W', 'count': 3},
-                            {'type': 'wind', 'value': 'S', 'count': 2}
-                        ],
-                        'total_tiles': 14
-                    }
-                },
-                
-                '2468_patterns': {
-                    '2468_222_444_6666_8888_same': {
-                        'name': '2468 222 444 6666 8888 (All Same Suit)',
-                        'pattern': '222 444 6666 8888',
-                        'description': 'ALL MUST BE SUIT A',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_1_suit',
-                        'joker_allowed': True,
-                        'components': [
-                            {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
-                            {'type': 'number', 'value': 4, 'count': 3, 'suit': 'A'},
-                            {'type': 'number', 'value': 6, 'count': 4, 'suit': 'A'},
-                            {'type': 'number', 'value': 8, 'count': 4, 'suit': 'A'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2468_222_444_6666_8888_two': {
-                        'name': '2468 222 444 6666 8888 (Two Suits)',
-                        'pattern': '222 444 6666 8888',
-                        'description': 'SUIT A and SUIT B',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_2_suits',
-                        'joker_allowed': True,
-                        'components': [
-                            {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
-                            {'type': 'number', 'value': 4, 'count': 3, 'suit': 'A'},
-                            {'type': 'number', 'value': 6, 'count': 4, 'suit': 'B'},
-                            {'type': 'number', 'value': 8, 'count': 4, 'suit': 'B'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2468_22_444_44_666_8888': {
-                        'name': '2468 22 444 44 666 8888',
-                        'pattern': '22 444 44 666 8888',
-                        'description': 'Three suits allowed',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_3_suits',
-                        'joker_allowed': True,
-                        'components': [
-                            {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                            {'type': 'number', 'value': 4, 'count': 3, 'suit': 'A'},
-                            {'type': 'number', 'value': 4, 'count': 2, 'suit': 'B'},
-                            {'type': 'number', 'value': 6, 'count': 3, 'suit': 'B'},
-                            {'type': 'number', 'value': 8, 'count': 4, 'suit': 'C'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2468_22_44_666_888_DDDD': {
-                        'name': '2468 22 44 666 888 DDDD',
-                        'pattern': '22 44 666 888 DDDD',
-                        'description': 'ALL MUST BE SUIT A WITH MATCHING DRAGON',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_1_suit_matching_dragons',
-                        'joker_allowed': True,
-                        'components': [
-                            {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                            {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
-                            {'type': 'number', 'value': 6, 'count': 3, 'suit': 'A'},
-                            {'type': 'number', 'value': 8, 'count': 3, 'suit': 'A'},
-                            {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2468_FFFF_4444_6666_24': {
-                        'name': '2468 FFFF 4444 6666 24',
-                        'pattern': 'FFFF 4444 6666 24',
-                        'description': 'Three suits allowed',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_3_suits',
-                        'joker_allowed': True,
-                        'special_rules': ['24 means one 2-tile and one 4-tile'],
-                        'components': [
-                            {'type': 'flower', 'value': 'F', 'count': 4},
-                            {'type': 'number', 'value': 4, 'count': 4, 'suit': 'A'},
-                            {'type': 'number', 'value': 6, 'count': 4, 'suit': 'B'},
-                            {'type': 'number', 'value': 2, 'count': 1, 'suit': 'C'},
-                            {'type': 'number', 'value': 4, 'count': 1, 'suit': 'C'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2468_FFFF_6666_8888_48': {
-                        'name': '2468 FFFF 6666 8888 48',
-                        'pattern': 'FFFF 6666 8888 48',
-                        'description': 'Three suits allowed',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_3_suits',
-                        'joker_allowed': True,
-                        'special_rules': ['48 means one 4-tile and one 8-tile'],
-                        'components': [
-                            {'type': 'flower', 'value': 'F', 'count': 4},
-                            {'type': 'number', 'value': 6, 'count': 4, 'suit': 'A'},
-                            {'type': 'number', 'value': 8, 'count': 4, 'suit': 'B'},
-                            {'type': 'number', 'value': 4, 'count': 1, 'suit': 'C'},
-                            {'type': 'number', 'value': 8, 'count': 1, 'suit': 'C'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2468_FF_2222_44_66_8888_same': {
-                        'name': '2468 FF 2222 44 66 8888 (All Same)',
-                        'pattern': 'FF 2222 44 66 8888',
-                        'description': 'ALL SUIT A',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_1_suit',
-                        'joker_allowed': True,
-                        'components': [
-                            {'type': 'flower', 'value': 'F', 'count': 2},
-                            {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
-                            {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
-                            {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
-                            {'type': 'number', 'value': 8, 'count': 4, 'suit': 'A'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2468_FF_2222_44_66_8888_mixed': {
-                        'name': '2468 FF 2222 44 66 8888 (Mixed)',
-                        'pattern': 'FF 2222 44 66 8888',
-                        'description': 'Two suits allowed',
-                        'points': 25,
-                        'category': 'X',
-                        'suit_requirement': 'any_2_suits',
-                        'joker_allowed': True,
-                        'components': [
-                            {'type': 'flower', 'value': 'F', 'count': 2},
-                            {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
-                            {'type': 'number', 'value': 4, 'count': 2, 'suit': 'B'},
-                            {'type': 'number', 'value': 6, 'count': 2, 'suit': 'B'},
-                            {'type': 'number', 'value': 8, 'count': 4, 'suit': 'A'}
-                        ],
-                        'total_tiles': 14
-                    },
-                    '2468_FF_222_44_666_88_88': {
-                        'name': '2468 FF 222 44 666 88 88',
-                        'pattern': 'FF 222 44 666 88 88',
-                        'description': 'Three suits allowed',
-                        'points': 35,
-                        'category': 'X',
-                        'suit_requirement': 'any_3_suits',
-                        'joker_allowed': True,
-                        'components': [
-                            {'type': 'flower', 'value': 'F', 'count': 2},
-                            {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
-                            {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
-                            {'type': 'number', 'value': 6, 'count': 3, 'suit': 'A'},
-                            {'type': 'number', 'value': 8, 'count': 2, 'suit': 'B'},
-                            {'type': 'number', 'value': 8, 'count': 2, 'suit': 'C'}
-                        ],
-                        'total_tiles': 14
-                                         }
-                 },
-                 
-                 'any_like_numbers_patterns': {
-                     'like_FFFF_111_1111_111': {
-                         'name': 'Any Like Numbers FFFF 111 1111 111',
-                         'pattern': 'FFFF 111 1111 111',
-                         'description': 'Three suits allowed',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can use any number 1-9 (all same number)'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 4},
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 1, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'like_11_DDD_11_DDD_1111': {
-                         'name': 'Any Like Numbers 11 DDD 11 DDD 1111',
-                         'pattern': '11 DDD 11 DDD 1111',
-                         'description': 'Three suits with matching dragons',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits_matching_dragons',
-                         'joker_allowed': True,
-                         'special_rules': ['Can use any number 1-9'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'dragon', 'value': 'D', 'count': 3, 'matching': True},
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'B'},
-                             {'type': 'dragon', 'value': 'D', 'count': 3, 'matching': True},
-                             {'type': 'number', 'value': 1, 'count': 4, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'like_FF_1111_NEWS_1111': {
-                         'name': 'Any Like Numbers FF 1111 NEWS 1111',
-                         'pattern': 'FF 1111 NEWS 1111',
-                         'description': 'Two suits allowed',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can use any number 1-9', 'NEWS means N-E-W-S (one of each wind)'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
-                             {'type': 'wind', 'value': 'N', 'count': 1},
-                             {'type': 'wind', 'value': 'E', 'count': 1},
-                             {'type': 'wind', 'value': 'W', 'count': 1},
-                             {'type': 'wind', 'value': 'S', 'count': 1},
-                             {'type': 'number', 'value': 1, 'count': 4, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     }
-                 },
-                 
-                 'addition_hands_patterns': {
-                     'addition_FF_1111_6666_7777': {
-                         'name': 'Addition FF 1111 6666 7777',
-                         'pattern': 'FF 1111 6666 7777',
-                         'description': 'ALL SUIT A',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Logic: 1111 + 6666 = 7777'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 7, 'count': 4, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'addition_FF_2222_5555_7777': {
-                         'name': 'Addition FF 2222 5555 7777',
-                         'pattern': 'FF 2222 5555 7777',
-                         'description': 'ALL SUIT A',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Logic: 2222 + 5555 = 7777'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 7, 'count': 4, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'addition_FF_3333_4444_7777': {
-                         'name': 'Addition FF 3333 4444 7777',
-                         'pattern': 'FF 3333 4444 7777',
-                         'description': 'ALL SUIT A',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Logic: 3333 + 4444 = 7777'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 4, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 7, 'count': 4, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     }
-                 },
-                 
-                 'quint_patterns': {
-                     'quint_FF_11111_22_33333': {
-                         'name': 'Quint FF 11111 22 33333',
-                         'pattern': 'FF 11111 22 33333',
-                         'description': 'ALL SUIT A, NUMBERS CAN BE ANY CONSECUTIVE NUMBERS',
-                         'points': 40,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Consecutive Options: 123, 234, 345, 456, 567, 678, 789'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 1, 'count': 5, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 5, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'quint_11111_NNNN_88888': {
-                         'name': 'Quint 11111 NNNN 88888',
-                         'pattern': '11111 NNNN 88888',
-                         'description': 'Two suits allowed',
-                         'points': 40,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': False,
-                         'special_rules': ['First number can be any 1-9', 'Second number must be different from first', 'Wind can be N, S, E, or W (all four same)'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 5, 'suit': 'A'},
-                             {'type': 'wind', 'value': 'N', 'count': 4},
-                             {'type': 'number', 'value': 8, 'count': 5, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'quint_11_22222_11_22222': {
-                         'name': 'Quint 11 22222 11 22222',
-                         'pattern': '11 22222 11 22222',
-                         'description': 'Two suits allowed',
-                         'points': 45,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': False,
-                         'special_rules': ['Can be any consecutive numbers (12, 23, 34, 45, 56, 67, 78, 89)', 'SUIT A and SUIT B must use same numbers'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 5, 'suit': 'A'},
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'B'},
-                             {'type': 'number', 'value': 2, 'count': 5, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'quint_FFFFF_DDDD_11111': {
-                         'name': 'Quint FFFFF DDDD 11111',
-                         'pattern': 'FFFFF DDDD 11111',
-                         'description': 'Two suits allowed',
-                         'points': 40,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Number can be any 1-9', 'Dragons must match SUIT A'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 5},
-                             {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True},
-                             {'type': 'number', 'value': 1, 'count': 5, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     }
-                 },
-                 
-                 'consecutive_run_patterns': {
-                     'consec_111_22_3333_44_555': {
-                         'name': 'Consecutive 111 22 3333 44 555 (Fixed Numbers)',
-                         'pattern': '111 22 3333 44 555',
-                         'description': 'ALL SUIT A',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Must use these exact number sequences only'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 3, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_11_222_DDDD_333_44': {
-                         'name': 'Consecutive 11 222 DDDD 333 44',
-                         'pattern': '11 222 DDDD 333 44',
-                         'description': 'SUIT A + SUIT B dragons',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit_opposite_dragons',
-                         'joker_allowed': True,
-                         'special_rules': ['SUIT A can be any 4 consecutive numbers (1234, 2345, 3456, 4567, 5678, 6789)'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
-                             {'type': 'dragon', 'value': 'D', 'count': 4, 'opposite': True},
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_FF_1111_2222_3333_same': {
-                         'name': 'Consecutive FF 1111 2222 3333 (Same Suit)',
-                         'pattern': 'FF 1111 2222 3333',
-                         'description': 'ALL SUIT A',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 3 consecutive numbers (123, 234, 345, 456, 567, 678, 789)'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_FF_1111_2222_3333_diff': {
-                         'name': 'Consecutive FF 1111 2222 3333 (Different Suits)',
-                         'pattern': 'FF 1111 2222 3333',
-                         'description': 'Three different suits allowed',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 3 consecutive numbers'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_1_22_3333_1_22_3333': {
-                         'name': 'Consecutive 1 22 3333 1 22 3333',
-                         'pattern': '1 22 3333 1 22 3333',
-                         'description': 'Two suits allowed',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 3 consecutive numbers, SUIT A and B must use same numbers'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 1, 'count': 1, 'suit': 'B'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'B'},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_11_22_333_444_DDDD': {
-                         'name': 'Consecutive 11 22 333 444 DDDD',
-                         'pattern': '11 22 333 444 DDDD',
-                         'description': 'ALL SUIT A, INCLUDING SUIT A MATCHING DRAGONS',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit_matching_dragons',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 4 consecutive numbers (1234, 2345, 3456, 4567, 5678, 6789)'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 4, 'count': 3, 'suit': 'A'},
-                             {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_FFFF_123_444_444': {
-                         'name': 'Consecutive FFFF 123 444 444',
-                         'pattern': 'FFFF 123 444 444',
-                         'description': 'Three suits allowed',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 4 consecutive numbers, SUIT A must be first 3 numbers, SUIT B and C must be the 4th number'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 4},
-                             {'type': 'number', 'value': 1, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 4, 'count': 3, 'suit': 'B'},
-                             {'type': 'number', 'value': 4, 'count': 3, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_111_222_3333_4444_same': {
-                         'name': 'Consecutive 111 222 3333 4444 (Same Suit)',
-                         'pattern': '111 222 3333 4444',
-                         'description': 'ALL SUIT A',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 4 consecutive numbers'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 4, 'count': 4, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_111_222_3333_4444_two': {
-                         'name': 'Consecutive 111 222 3333 4444 (Two Suits)',
-                         'pattern': '111 222 3333 4444',
-                         'description': 'Two suits allowed',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 4 consecutive numbers'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 4, 'count': 4, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'consec_111_222_111_222_33': {
-                         'name': 'Consecutive 111 222 111 222 33',
-                         'pattern': '111 222 111 222 33',
-                         'description': 'Three suits allowed',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 3 consecutive numbers, SUIT A and B must use same numbers'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'B'},
-                             {'type': 'number', 'value': 2, 'count': 3, 'suit': 'B'},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     }
-                 },
-                 
-                 '13579_patterns': {
-                     '13579_111_33_5555_77_999_same': {
-                         'name': '13579 111 33 5555 77 999 (Same Suit)',
-                         'pattern': '111 33 5555 77 999',
-                         'description': 'ALL SUIT A',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Must use odd numbers 1,3,5,7,9'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 7, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 9, 'count': 3, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '13579_111_33_5555_77_999_mixed': {
-                         'name': '13579 111 33 5555 77 999 (Mixed Suits)',
-                         'pattern': '111 33 5555 77 999',
-                         'description': 'Three suits allowed',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Must use odd numbers 1,3,5,7,9'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 7, 'count': 2, 'suit': 'C'},
-                             {'type': 'number', 'value': 9, 'count': 3, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '13579_111_333_3333_5555': {
-                         'name': '13579 111 333 3333 5555',
-                         'pattern': '111 333 3333 5555',
-                         'description': 'Two suits allowed',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Must use consecutive odd numbers'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 5, 'count': 4, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '13579_FF_11_333_5555_DDD': {
-                         'name': '13579 FF 11 333 5555 DDD',
-                         'pattern': 'FF 11 333 5555 DDD',
-                         'description': 'ALL SUIT A, WITH MATCHING SUIT A DRAGONS',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit_matching_dragons',
-                         'joker_allowed': True,
-                         'special_rules': ['Must use odd numbers with matching dragons'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 4, 'suit': 'A'},
-                             {'type': 'dragon', 'value': 'D', 'count': 3, 'matching': True}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '13579_11_33_55_7777_9999': {
-                         'name': '13579 11 33 55 7777 9999',
-                         'pattern': '11 33 55 7777 9999',
-                         'description': 'Three suits allowed',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Must use all odd numbers 1,3,5,7,9'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 7, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 9, 'count': 4, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '13579_FFFF_3333_5555_15': {
-                         'name': '13579 FFFF 3333 5555 15',
-                         'pattern': 'FFFF 3333 5555 15',
-                         'description': 'Three suits allowed',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['15 means one 1-tile and one 5-tile'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 4},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 1, 'count': 1, 'suit': 'C'},
-                             {'type': 'number', 'value': 5, 'count': 1, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     }
-                 },
-                 
-                 'winds_dragons_patterns': {
-                     'winds_NNNN_EEE_WWW_SSSS': {
-                         'name': 'Winds NNNN EEE WWW SSSS',
-                         'pattern': 'NNNN EEE WWW SSSS',
-                         'description': 'All four winds in specified groupings',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'components': [
-                             {'type': 'wind', 'value': 'N', 'count': 4},
-                             {'type': 'wind', 'value': 'E', 'count': 3},
-                             {'type': 'wind', 'value': 'W', 'count': 3},
-                             {'type': 'wind', 'value': 'S', 'count': 4}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'winds_FFFF_DDD_DDDD_DDD': {
-                         'name': 'Winds FFFF DDD DDDD DDD',
-                         'pattern': 'FFFF DDD DDDD DDD',
-                         'description': 'Three different dragon suits',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_dragons',
-                         'joker_allowed': True,
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 4},
-                             {'type': 'dragon', 'value': 'D', 'count': 3},
-                             {'type': 'dragon', 'value': 'D', 'count': 4},
-                             {'type': 'dragon', 'value': 'D', 'count': 3}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'winds_NNN_SSS_1111_2222': {
-                         'name': 'Winds NNN SSS 1111 2222',
-                         'pattern': 'NNN SSS 1111 2222',
-                         'description': 'Two suits allowed',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 2 consecutive numbers'],
-                         'components': [
-                             {'type': 'wind', 'value': 'N', 'count': 3},
-                             {'type': 'wind', 'value': 'S', 'count': 3},
-                             {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 4, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'winds_FF_NN_EEE_WWW_SSSS': {
-                         'name': 'Winds FF NN EEE WWW SSSS',
-                         'pattern': 'FF NN EEE WWW SSSS',
-                         'description': 'Mixed winds with flowers',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'wind', 'value': 'N', 'count': 2},
-                             {'type': 'wind', 'value': 'E', 'count': 3},
-                             {'type': 'wind', 'value': 'W', 'count': 3},
-                             {'type': 'wind', 'value': 'S', 'count': 4}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'winds_NNNN_11_22_33_SSSS': {
-                         'name': 'Winds NNNN 11 22 33 SSSS',
-                         'pattern': 'NNNN 11 22 33 SSSS',
-                         'description': 'ALL SUIT A',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any 3 consecutive numbers'],
-                         'components': [
-                             {'type': 'wind', 'value': 'N', 'count': 4},
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
-                             {'type': 'wind', 'value': 'S', 'count': 4}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'winds_FF_DDDD_NEWS_DDDD': {
-                         'name': 'Winds FF DDDD NEWS DDDD',
-                         'pattern': 'FF DDDD NEWS DDDD',
-                         'description': 'Two different dragon suits',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_dragons',
-                         'joker_allowed': True,
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'dragon', 'value': 'D', 'count': 4},
-                             {'type': 'wind', 'value': 'N', 'count': 1},
-                             {'type': 'wind', 'value': 'E', 'count': 1},
-                             {'type': 'wind', 'value': 'W', 'count': 1},
-                             {'type': 'wind', 'value': 'S', 'count': 1},
-                             {'type': 'dragon', 'value': 'D', 'count': 4}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'winds_NNN_EW_SSS_111_111': {
-                         'name': 'Winds NNN EW SSS 111 111',
-                         'pattern': 'NNN EW SSS 111 111',
-                         'description': 'Two suits allowed',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be any like numbers 1-9, SUIT A and B must be same number'],
-                         'components': [
-                             {'type': 'wind', 'value': 'N', 'count': 3},
-                             {'type': 'wind', 'value': 'E', 'count': 1},
-                             {'type': 'wind', 'value': 'W', 'count': 1},
-                             {'type': 'wind', 'value': 'S', 'count': 3},
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 1, 'count': 3, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     }
-                 },
-                 
-                 '369_patterns': {
-                     '369_333_666_6666_9999': {
-                         'name': '369 333 666 6666 9999',
-                         'pattern': '333 666 6666 9999',
-                         'description': 'Two/Three Suits',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_or_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Must use numbers 3, 6, 9'],
-                         'components': [
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 9, 'count': 4, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '369_FF_3_66_999_333_333': {
-                         'name': '369 FF 3 66 999 333 333',
-                         'pattern': 'FF 3 66 999 333 333',
-                         'description': 'Three suits allowed',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Like pungs of 3, 6, or 9'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 3, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 9, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'B'},
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '369_FF_3333_6666_9999': {
-                         'name': '369 FF 3333 6666 9999',
-                         'pattern': 'FF 3333 6666 9999',
-                         'description': 'ALL SUIT A or Three different suits',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_or_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Can be all same suit or three different suits'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2},
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 4, 'suit': 'B'},
-                             {'type': 'number', 'value': 9, 'count': 4, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '369_333_DDDD_333_DDDD': {
-                         'name': '369 333 DDDD 333 DDDD',
-                         'pattern': '333 DDDD 333 DDDD',
-                         'description': 'Two suits with matching dragons',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_2_suits_matching_dragons',
-                         'joker_allowed': True,
-                         'special_rules': ['Pungs of 3, 6, or 9 with matching dragons, SUIT A and B numbers must be same'],
-                         'components': [
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
-                             {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True},
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'B'},
-                             {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '369_3333_66_66_66_9999': {
-                         'name': '369 3333 66 66 66 9999',
-                         'pattern': '3333 66 66 66 9999',
-                         'description': 'Three suits allowed',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['3s and 9s must match (same suit)'],
-                         'components': [
-                             {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 2, 'suit': 'B'},
-                             {'type': 'number', 'value': 6, 'count': 2, 'suit': 'C'},
-                             {'type': 'number', 'value': 9, 'count': 4, 'suit': 'A'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '369_FFFF_33_66_999_DDD': {
-                         'name': '369 FFFF 33 66 999 DDD',
-                         'pattern': 'FFFF 33 66 999 DDD',
-                         'description': 'Numbers any 1 suit, any opposite dragon',
-                         'points': 25,
-                         'category': 'X',
-                         'suit_requirement': 'any_1_suit_opposite_dragons',
-                         'joker_allowed': True,
-                         'special_rules': ['Numbers any 1 suit, any opposite dragon'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 4},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 9, 'count': 3, 'suit': 'A'},
-                             {'type': 'dragon', 'value': 'D', 'count': 3, 'opposite': True}
-                         ],
-                         'total_tiles': 14
-                     },
-                     '369_333_666_333_666_99': {
-                         'name': '369 333 666 333 666 99',
-                         'pattern': '333 666 333 666 99',
-                         'description': 'Three suits allowed',
-                         'points': 30,
-                         'category': 'X',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': True,
-                         'special_rules': ['Must use numbers 3, 6, 9'],
-                         'components': [
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 3, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 3, 'suit': 'B'},
-                             {'type': 'number', 'value': 6, 'count': 3, 'suit': 'B'},
-                             {'type': 'number', 'value': 9, 'count': 2, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     }
-                 },
-                 
-                 'singles_and_pairs_patterns': {
-                     'singles_FF_22_46_88_22_46_88': {
-                         'name': 'Singles FF 22 46 88 22 46 88',
-                         'pattern': 'FF 22 46 88 22 46 88',
-                         'description': 'Two suits allowed',
-                         'points': 50,
-                         'category': 'C',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': False,
-                         'special_rules': ['Specific numbers 2, 4, 6, 8 only', 'NO FLOWERS ALLOWED despite "FF" notation'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2, 'not_allowed': True},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 4, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 8, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'B'},
-                             {'type': 'number', 'value': 4, 'count': 1, 'suit': 'B'},
-                             {'type': 'number', 'value': 6, 'count': 1, 'suit': 'B'},
-                             {'type': 'number', 'value': 8, 'count': 2, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'singles_FF_11_33_55_55_77_99': {
-                         'name': 'Singles FF 11 33 55 55 77 99',
-                         'pattern': 'FF 11 33 55 55 77 99',
-                         'description': 'Two suits allowed',
-                         'points': 50,
-                         'category': 'C',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': False,
-                         'special_rules': ['Odd numbers only', 'NO FLOWERS ALLOWED despite "FF" notation'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2, 'not_allowed': True},
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 2, 'suit': 'B'},
-                             {'type': 'number', 'value': 7, 'count': 2, 'suit': 'B'},
-                             {'type': 'number', 'value': 9, 'count': 2, 'suit': 'B'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'singles_112_11223_112233': {
-                         'name': 'Singles 112 11223 112233',
-                         'pattern': '112 11223 112233',
-                         'description': 'Three suits required',
-                         'points': 50,
-                         'category': 'C',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': False,
-                         'special_rules': ['Specific number patterns only'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 1, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 1, 'suit': 'A'},
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'B'},
-                             {'type': 'number', 'value': 1, 'count': 1, 'suit': 'B'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'B'},
-                             {'type': 'number', 'value': 3, 'count': 1, 'suit': 'B'},
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'C'},
-                             {'type': 'number', 'value': 1, 'count': 1, 'suit': 'C'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'C'},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'singles_FF_33_66_99_369_369': {
-                         'name': 'Singles FF 33 66 99 369 369',
-                         'pattern': 'FF 33 66 99 369 369',
-                         'description': 'Three suits allowed',
-                         'points': 50,
-                         'category': 'C',
-                         'suit_requirement': 'any_3_suits',
-                         'joker_allowed': False,
-                         'special_rules': ['Must use 3, 6, 9 pattern', 'NO FLOWERS ALLOWED despite "FF" notation'],
-                         'components': [
-                             {'type': 'flower', 'value': 'F', 'count': 2, 'not_allowed': True},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 9, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 1, 'suit': 'B'},
-                             {'type': 'number', 'value': 6, 'count': 1, 'suit': 'B'},
-                             {'type': 'number', 'value': 9, 'count': 1, 'suit': 'B'},
-                             {'type': 'number', 'value': 3, 'count': 1, 'suit': 'C'},
-                             {'type': 'number', 'value': 6, 'count': 1, 'suit': 'C'},
-                             {'type': 'number', 'value': 9, 'count': 1, 'suit': 'C'}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'singles_11_22_33_44_55_DD_DD': {
-                         'name': 'Singles 11 22 33 44 55 DD DD',
-                         'pattern': '11 22 33 44 55 DD DD',
-                         'description': 'SUIT A + two different dragon suits',
-                         'points': 50,
-                         'category': 'C',
-                         'suit_requirement': 'any_1_suit_opposite_dragons',
-                         'joker_allowed': False,
-                         'special_rules': ['Can be any 5 consecutive numbers (12345, 23456, 34567, 45678, 56789)'],
-                         'components': [
-                             {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
-                             {'type': 'number', 'value': 5, 'count': 2, 'suit': 'A'},
-                             {'type': 'dragon', 'value': 'D', 'count': 2, 'opposite': True},
-                             {'type': 'dragon', 'value': 'D', 'count': 2, 'opposite': True}
-                         ],
-                         'total_tiles': 14
-                     },
-                     'singles_2024_NN_EW_SS_2024': {
-                         'name': 'Singles 2024 NN EW SS 2024',
-                         'pattern': '2024 NN EW SS 2024',
-                         'description': 'Two suits allowed',
-                         'points': 75,
-                         'category': 'C',
-                         'suit_requirement': 'any_2_suits',
-                         'joker_allowed': False,
-                         'special_rules': ['In both 2024s, the 0 must be White Dragon'],
-                         'components': [
-                             {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'},
-                             {'type': 'wind', 'value': 'N', 'count': 2},
-                             {'type': 'wind', 'value': 'E', 'count': 1},
-                             {'type': 'wind', 'value': 'W', 'count': 1},
-                             {'type': 'wind', 'value': 'S', 'count': 2},
-                             {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'}
-                         ],
-                         'total_tiles': 14
-                     }
-                 }
-             }
-         }
-    
-    def get_pattern_by_id(self, pattern_id: str, year: int = 2024) -> Dict[str, Any]:
+    def get_pattern_by_id(self, pattern_id: str, year: int = 2024) -> Optional[Pattern]:
         """Get a specific pattern by its ID"""
-        year_patterns = self.year_patterns.get(year, {})
-        for category in year_patterns.values():
-            if pattern_id in category:
-                return category[pattern_id]
-        return None
+        return get_pattern_by_id(pattern_id, year)
     
-    def get_all_patterns(self, year: int = 2024) -> Dict[str, Dict[str, Any]]:
-        """Get all patterns for a specific year"""
-        year_patterns = self.year_patterns.get(year, {})
-        all_patterns = {}
-        for category_name, category_patterns in year_patterns.items():
-            all_patterns.update(category_patterns)
-        return all_patterns
+    def get_all_patterns(self, year: int = 2024) -> Mapping[str, Pattern]:
+        """Get all patterns for a specific year (the returned dict is shared; do not modify it)"""
+        return get_all_patterns(year)
     
-    def get_patterns_by_category(self, category: str, year: int = 2024) -> Dict[str, Dict[str, Any]]:
+    def get_patterns_by_category(self, category: str, year: int = 2024) -> Mapping[str, Pattern]:
         """Get all patterns in a specific category"""
-        year_patterns = self.year_patterns.get(year, {})
-        category_key = f"{category}_patterns"
-        return year_patterns.get(category_key, {})
+        return get_patterns_by_category(category, year)
     
+    def get_patterns_for_suit_requirement(self, requirement: str, year: int = 2024) -> Mapping[str, Pattern]:
+        """Get all patterns with a specific suit requirement"""
+        return get_patterns_for_suit_requirement(requirement, year)
+
+    def get_patterns_for_hand_category(self, category: str, year: int = 2024) -> Mapping[str, Pattern]:
+        """Get all exposed ('X') or concealed ('C') patterns"""
+        return get_patterns_for_hand_category(category, year)
+
+    def get_patterns_by_joker_allowed(self, joker_allowed: bool, year: int = 2024) -> Mapping[str, Pattern]:
+        """Get all patterns that do or do not allow jokers"""
+        return get_patterns_by_joker_allowed(joker_allowed, year)
+
+    def get_patterns_by_tile_count(self, total_tiles: int, year: int = 2024) -> Mapping[str, Pattern]:
+        """Get all patterns made of exactly this many tiles"""
+        return get_patterns_by_tile_count(total_tiles, year)
+
+    def get_pattern_table(self, year: int = 2024) -> 'PatternTable':
+        """Get the stacked count templates of every pattern for a year"""
+        return get_pattern_table(year)
+
+    def match_hand(self, hand_vec: 'np.ndarray', year: int = 2024) -> List[str]:
+        """Get the ids of all patterns a tile-count vector completely covers"""
+        return match_hand(hand_vec, year)
+
     def validate_suit_requirement(self, tiles: List[str], requirement: str) -> bool:
         """Validate if tiles meet a specific suit requirement"""
-        # Implementation would go here
-        pass
+        return validate_suit_requirement(tiles, requirement)
     
-    def get_suit_requirement_info(self, requirement: str) -> Dict[str, Any]:
+    def get_suit_requirement_info(self, requirement: str) -> Mapping[str, Any]:
         """Get detailed information about a suit requirement"""
-        return self.suit_requirements.get(requirement, {})
+        from .rules_descriptions import SUIT_REQUIREMENTS
+        return SUIT_REQUIREMENTS.get(requirement, _EMPTY)
+
+
+def _build_2024_patterns() -> Dict[str, Dict[str, Any]]:
+    """2024 year-tile hands"""
+    return {
+        '2024_222_000_2222_4444': {
+            'name': '2024 222 000 2222 4444',
+            'pattern': '222 000 2222 4444',
+            'description': 'SUIT A, SUIT B (different suits)',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['All zeros must be White Dragons'],
+            'components': [
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
+                {'type': 'dragon', 'value': '0', 'count': 3, 'special': 'white_dragon'},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 4, 'count': 4, 'suit': 'B'}
+            ]
+        },
+        '2024_FFFF_2222_0000_24': {
+            'name': '2024 FFFF 2222 0000 24',
+            'pattern': 'FFFF 2222 0000 24',
+            'description': 'SUIT A and SUIT B (any suits)',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['0000 must be White Dragons', '24 means one 2-tile and one 4-tile'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 4},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
+                {'type': 'dragon', 'value': '0', 'count': 4, 'special': 'white_dragon'},
+                {'type': 'number', 'value': 2, 'count': 1, 'suit': 'B'},
+                {'type': 'number', 'value': 4, 'count': 1, 'suit': 'B'}
+            ]
+        },
+        '2024_FF_2024_2222_2222': {
+            'name': '2024 FF 2024 2222 2222 (Option A)',
+            'pattern': 'FF 2024 2222 2222',
+            'description': 'Three different suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['In 2024, the 0 must be White Dragon'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'C'}
+            ]
+        },
+        '2024_FF_2024_4444_4444': {
+            'name': '2024 FF 2024 4444 4444 (Option B)',
+            'pattern': 'FF 2024 4444 4444',
+            'description': 'Three different suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['In 2024, the 0 must be White Dragon'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'},
+                {'type': 'number', 'value': 4, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 4, 'count': 4, 'suit': 'C'}
+            ]
+        },
+        '2024_NN_EEE_2024_WWW_SS': {
+            'name': '2024 NN EEE 2024 WWW SS',
+            'pattern': 'NN EEE 2024 WWW SS',
+            'description': 'SUIT A can be any suit',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['In 2024, the 0 must be White Dragon', 'Winds are fixed'],
+            'components': [
+                {'type': 'wind', 'value': 'N', 'count': 2},
+                {'type': 'wind', 'value': 'E', 'count': 3},
+                {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'},
+                {'type': 'wind', 'value': 'W', 'count': 3},
+                {'type': 'wind', 'value': 'S', 'count': 2}
+            ]
+        }
+    }
+
+
+def _build_2468_patterns() -> Dict[str, Dict[str, Any]]:
+    """Even-number (2468) hands"""
+    return {
+        '2468_222_444_6666_8888_same': {
+            'name': '2468 222 444 6666 8888 (All Same Suit)',
+            'pattern': '222 444 6666 8888',
+            'description': 'ALL MUST BE SUIT A',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 8, 'count': 4, 'suit': 'A'}
+            ]
+        },
+        '2468_222_444_6666_8888_two': {
+            'name': '2468 222 444 6666 8888 (Two Suits)',
+            'pattern': '222 444 6666 8888',
+            'description': 'SUIT A and SUIT B',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 8, 'count': 4, 'suit': 'B'}
+            ]
+        },
+        '2468_22_444_44_666_8888': {
+            'name': '2468 22 444 44 666 8888',
+            'pattern': '22 444 44 666 8888',
+            'description': 'Three suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 6, 'count': 3, 'suit': 'B'},
+                {'type': 'number', 'value': 8, 'count': 4, 'suit': 'C'}
+            ]
+        },
+        '2468_22_44_666_888_DDDD': {
+            'name': '2468 22 44 666 888 DDDD',
+            'pattern': '22 44 666 888 DDDD',
+            'description': 'ALL MUST BE SUIT A WITH MATCHING DRAGON',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit_matching_dragons',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 8, 'count': 3, 'suit': 'A'},
+                {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True}
+            ]
+        },
+        '2468_FFFF_4444_6666_24': {
+            'name': '2468 FFFF 4444 6666 24',
+            'pattern': 'FFFF 4444 6666 24',
+            'description': 'Three suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['24 means one 2-tile and one 4-tile'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 4},
+                {'type': 'number', 'value': 4, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 2, 'count': 1, 'suit': 'C'},
+                {'type': 'number', 'value': 4, 'count': 1, 'suit': 'C'}
+            ]
+        },
+        '2468_FFFF_6666_8888_48': {
+            'name': '2468 FFFF 6666 8888 48',
+            'pattern': 'FFFF 6666 8888 48',
+            'description': 'Three suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['48 means one 4-tile and one 8-tile'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 4},
+                {'type': 'number', 'value': 6, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 8, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 4, 'count': 1, 'suit': 'C'},
+                {'type': 'number', 'value': 8, 'count': 1, 'suit': 'C'}
+            ]
+        },
+        '2468_FF_2222_44_66_8888_same': {
+            'name': '2468 FF 2222 44 66 8888 (All Same)',
+            'pattern': 'FF 2222 44 66 8888',
+            'description': 'ALL SUIT A',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 8, 'count': 4, 'suit': 'A'}
+            ]
+        },
+        '2468_FF_2222_44_66_8888_mixed': {
+            'name': '2468 FF 2222 44 66 8888 (Mixed)',
+            'pattern': 'FF 2222 44 66 8888',
+            'description': 'Two suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 6, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 8, 'count': 4, 'suit': 'A'}
+            ]
+        },
+        '2468_FF_222_44_666_88_88': {
+            'name': '2468 FF 222 44 666 88 88',
+            'pattern': 'FF 222 44 666 88 88',
+            'description': 'Three suits allowed',
+            'points': 35,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 8, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 8, 'count': 2, 'suit': 'C'}
+            ]
+                             }
+    }
+
+
+def _build_any_like_numbers_patterns() -> Dict[str, Dict[str, Any]]:
+    """Any like numbers hands"""
+    return {
+        'like_FFFF_111_1111_111': {
+            'name': 'Any Like Numbers FFFF 111 1111 111',
+            'pattern': 'FFFF 111 1111 111',
+            'description': 'Three suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can use any number 1-9 (all same number)'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 4},
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 1, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'C'}
+            ]
+        },
+        'like_11_DDD_11_DDD_1111': {
+            'name': 'Any Like Numbers 11 DDD 11 DDD 1111',
+            'pattern': '11 DDD 11 DDD 1111',
+            'description': 'Three suits with matching dragons',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits_matching_dragons',
+            'joker_allowed': True,
+            'special_rules': ['Can use any number 1-9'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'dragon', 'value': 'D', 'count': 3, 'matching': True},
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'B'},
+                {'type': 'dragon', 'value': 'D', 'count': 3, 'matching': True},
+                {'type': 'number', 'value': 1, 'count': 4, 'suit': 'C'}
+            ]
+        },
+        'like_FF_1111_NEWS_1111': {
+            'name': 'Any Like Numbers FF 1111 NEWS 1111',
+            'pattern': 'FF 1111 NEWS 1111',
+            'description': 'Two suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can use any number 1-9', 'NEWS means N-E-W-S (one of each wind)'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
+                {'type': 'wind', 'value': 'N', 'count': 1},
+                {'type': 'wind', 'value': 'E', 'count': 1},
+                {'type': 'wind', 'value': 'W', 'count': 1},
+                {'type': 'wind', 'value': 'S', 'count': 1},
+                {'type': 'number', 'value': 1, 'count': 4, 'suit': 'B'}
+            ]
+        }
+    }
+
+
+def _build_addition_hands_patterns() -> Dict[str, Dict[str, Any]]:
+    """Addition hands"""
+    return {
+        'addition_FF_1111_6666_7777': {
+            'name': 'Addition FF 1111 6666 7777',
+            'pattern': 'FF 1111 6666 7777',
+            'description': 'ALL SUIT A',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Logic: 1111 + 6666 = 7777'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 7, 'count': 4, 'suit': 'A'}
+            ]
+        },
+        'addition_FF_2222_5555_7777': {
+            'name': 'Addition FF 2222 5555 7777',
+            'pattern': 'FF 2222 5555 7777',
+            'description': 'ALL SUIT A',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Logic: 2222 + 5555 = 7777'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 7, 'count': 4, 'suit': 'A'}
+            ]
+        },
+        'addition_FF_3333_4444_7777': {
+            'name': 'Addition FF 3333 4444 7777',
+            'pattern': 'FF 3333 4444 7777',
+            'description': 'ALL SUIT A',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Logic: 3333 + 4444 = 7777'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 7, 'count': 4, 'suit': 'A'}
+            ]
+        }
+    }
+
+
+def _build_quint_patterns() -> Dict[str, Dict[str, Any]]:
+    """Quint hands"""
+    return {
+        'quint_FF_11111_22_33333': {
+            'name': 'Quint FF 11111 22 33333',
+            'pattern': 'FF 11111 22 33333',
+            'description': 'ALL SUIT A, NUMBERS CAN BE ANY CONSECUTIVE NUMBERS',
+            'points': 40,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Consecutive Options: 123, 234, 345, 456, 567, 678, 789'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 1, 'count': 5, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 5, 'suit': 'A'}
+            ]
+        },
+        'quint_11111_NNNN_88888': {
+            'name': 'Quint 11111 NNNN 88888',
+            'pattern': '11111 NNNN 88888',
+            'description': 'Two suits allowed',
+            'points': 40,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': False,
+            'special_rules': ['First number can be any 1-9', 'Second number must be different from first', 'Wind can be N, S, E, or W (all four same)'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 5, 'suit': 'A'},
+                {'type': 'wind', 'value': 'N', 'count': 4},
+                {'type': 'number', 'value': 8, 'count': 5, 'suit': 'B'}
+            ]
+        },
+        'quint_11_22222_11_22222': {
+            'name': 'Quint 11 22222 11 22222',
+            'pattern': '11 22222 11 22222',
+            'description': 'Two suits allowed',
+            'points': 45,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': False,
+            'special_rules': ['Can be any consecutive numbers (12, 23, 34, 45, 56, 67, 78, 89)', 'SUIT A and SUIT B must use same numbers'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 5, 'suit': 'A'},
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 2, 'count': 5, 'suit': 'B'}
+            ]
+        },
+        'quint_FFFFF_DDDD_11111': {
+            'name': 'Quint FFFFF DDDD 11111',
+            'pattern': 'FFFFF DDDD 11111',
+            'description': 'Two suits allowed',
+            'points': 40,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['Number can be any 1-9', 'Dragons must match SUIT A'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 5},
+                {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True},
+                {'type': 'number', 'value': 1, 'count': 5, 'suit': 'B'}
+            ]
+        }
+    }
+
+
+def _build_consecutive_run_patterns() -> Dict[str, Dict[str, Any]]:
+    """Consecutive run hands"""
+    return {
+        'consec_111_22_3333_44_555': {
+            'name': 'Consecutive 111 22 3333 44 555 (Fixed Numbers)',
+            'pattern': '111 22 3333 44 555',
+            'description': 'ALL SUIT A',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Must use these exact number sequences only'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 3, 'suit': 'A'}
+            ]
+        },
+        'consec_11_222_DDDD_333_44': {
+            'name': 'Consecutive 11 222 DDDD 333 44',
+            'pattern': '11 222 DDDD 333 44',
+            'description': 'SUIT A + SUIT B dragons',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit_opposite_dragons',
+            'joker_allowed': True,
+            'special_rules': ['SUIT A can be any 4 consecutive numbers (1234, 2345, 3456, 4567, 5678, 6789)'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
+                {'type': 'dragon', 'value': 'D', 'count': 4, 'opposite': True},
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'}
+            ]
+        },
+        'consec_FF_1111_2222_3333_same': {
+            'name': 'Consecutive FF 1111 2222 3333 (Same Suit)',
+            'pattern': 'FF 1111 2222 3333',
+            'description': 'ALL SUIT A',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 3 consecutive numbers (123, 234, 345, 456, 567, 678, 789)'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'}
+            ]
+        },
+        'consec_FF_1111_2222_3333_diff': {
+            'name': 'Consecutive FF 1111 2222 3333 (Different Suits)',
+            'pattern': 'FF 1111 2222 3333',
+            'description': 'Three different suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 3 consecutive numbers'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'C'}
+            ]
+        },
+        'consec_1_22_3333_1_22_3333': {
+            'name': 'Consecutive 1 22 3333 1 22 3333',
+            'pattern': '1 22 3333 1 22 3333',
+            'description': 'Two suits allowed',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 3 consecutive numbers, SUIT A and B must use same numbers'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 1, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 1, 'count': 1, 'suit': 'B'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'B'}
+            ]
+        },
+        'consec_11_22_333_444_DDDD': {
+            'name': 'Consecutive 11 22 333 444 DDDD',
+            'pattern': '11 22 333 444 DDDD',
+            'description': 'ALL SUIT A, INCLUDING SUIT A MATCHING DRAGONS',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit_matching_dragons',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 4 consecutive numbers (1234, 2345, 3456, 4567, 5678, 6789)'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 3, 'suit': 'A'},
+                {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True}
+            ]
+        },
+        'consec_FFFF_123_444_444': {
+            'name': 'Consecutive FFFF 123 444 444',
+            'pattern': 'FFFF 123 444 444',
+            'description': 'Three suits allowed',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 4 consecutive numbers, SUIT A must be first 3 numbers, SUIT B and C must be the 4th number'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 4},
+                {'type': 'number', 'value': 1, 'count': 1, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 1, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 1, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 3, 'suit': 'B'},
+                {'type': 'number', 'value': 4, 'count': 3, 'suit': 'C'}
+            ]
+        },
+        'consec_111_222_3333_4444_same': {
+            'name': 'Consecutive 111 222 3333 4444 (Same Suit)',
+            'pattern': '111 222 3333 4444',
+            'description': 'ALL SUIT A',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 4 consecutive numbers'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 4, 'suit': 'A'}
+            ]
+        },
+        'consec_111_222_3333_4444_two': {
+            'name': 'Consecutive 111 222 3333 4444 (Two Suits)',
+            'pattern': '111 222 3333 4444',
+            'description': 'Two suits allowed',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 4 consecutive numbers'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 4, 'count': 4, 'suit': 'B'}
+            ]
+        },
+        'consec_111_222_111_222_33': {
+            'name': 'Consecutive 111 222 111 222 33',
+            'pattern': '111 222 111 222 33',
+            'description': 'Three suits allowed',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 3 consecutive numbers, SUIT A and B must use same numbers'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'B'},
+                {'type': 'number', 'value': 2, 'count': 3, 'suit': 'B'},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'C'}
+            ]
+        }
+    }
+
+
+def _build_13579_patterns() -> Dict[str, Dict[str, Any]]:
+    """Odd-number (13579) hands"""
+    return {
+        '13579_111_33_5555_77_999_same': {
+            'name': '13579 111 33 5555 77 999 (Same Suit)',
+            'pattern': '111 33 5555 77 999',
+            'description': 'ALL SUIT A',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Must use odd numbers 1,3,5,7,9'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 7, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 9, 'count': 3, 'suit': 'A'}
+            ]
+        },
+        '13579_111_33_5555_77_999_mixed': {
+            'name': '13579 111 33 5555 77 999 (Mixed Suits)',
+            'pattern': '111 33 5555 77 999',
+            'description': 'Three suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Must use odd numbers 1,3,5,7,9'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 7, 'count': 2, 'suit': 'C'},
+                {'type': 'number', 'value': 9, 'count': 3, 'suit': 'C'}
+            ]
+        },
+        '13579_111_333_3333_5555': {
+            'name': '13579 111 333 3333 5555',
+            'pattern': '111 333 3333 5555',
+            'description': 'Two suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['Must use consecutive odd numbers'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 5, 'count': 4, 'suit': 'B'}
+            ]
+        },
+        '13579_FF_11_333_5555_DDD': {
+            'name': '13579 FF 11 333 5555 DDD',
+            'pattern': 'FF 11 333 5555 DDD',
+            'description': 'ALL SUIT A, WITH MATCHING SUIT A DRAGONS',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit_matching_dragons',
+            'joker_allowed': True,
+            'special_rules': ['Must use odd numbers with matching dragons'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 4, 'suit': 'A'},
+                {'type': 'dragon', 'value': 'D', 'count': 3, 'matching': True}
+            ]
+        },
+        '13579_11_33_55_7777_9999': {
+            'name': '13579 11 33 55 7777 9999',
+            'pattern': '11 33 55 7777 9999',
+            'description': 'Three suits allowed',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Must use all odd numbers 1,3,5,7,9'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 7, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 9, 'count': 4, 'suit': 'C'}
+            ]
+        },
+        '13579_FFFF_3333_5555_15': {
+            'name': '13579 FFFF 3333 5555 15',
+            'pattern': 'FFFF 3333 5555 15',
+            'description': 'Three suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['15 means one 1-tile and one 5-tile'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 4},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 1, 'count': 1, 'suit': 'C'},
+                {'type': 'number', 'value': 5, 'count': 1, 'suit': 'C'}
+            ]
+        }
+    }
+
+
+def _build_winds_dragons_patterns() -> Dict[str, Dict[str, Any]]:
+    """Winds and dragons hands"""
+    return {
+        'winds_NNNN_EEE_WWW_SSSS': {
+            'name': 'Winds NNNN EEE WWW SSSS',
+            'pattern': 'NNNN EEE WWW SSSS',
+            'description': 'All four winds in specified groupings',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'wind', 'value': 'N', 'count': 4},
+                {'type': 'wind', 'value': 'E', 'count': 3},
+                {'type': 'wind', 'value': 'W', 'count': 3},
+                {'type': 'wind', 'value': 'S', 'count': 4}
+            ]
+        },
+        'winds_FFFF_DDD_DDDD_DDD': {
+            'name': 'Winds FFFF DDD DDDD DDD',
+            'pattern': 'FFFF DDD DDDD DDD',
+            'description': 'Three different dragon suits',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_dragons',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 4},
+                {'type': 'dragon', 'value': 'D', 'count': 3},
+                {'type': 'dragon', 'value': 'D', 'count': 4},
+                {'type': 'dragon', 'value': 'D', 'count': 3}
+            ]
+        },
+        'winds_NNN_SSS_1111_2222': {
+            'name': 'Winds NNN SSS 1111 2222',
+            'pattern': 'NNN SSS 1111 2222',
+            'description': 'Two suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 2 consecutive numbers'],
+            'components': [
+                {'type': 'wind', 'value': 'N', 'count': 3},
+                {'type': 'wind', 'value': 'S', 'count': 3},
+                {'type': 'number', 'value': 1, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 4, 'suit': 'B'}
+            ]
+        },
+        'winds_FF_NN_EEE_WWW_SSSS': {
+            'name': 'Winds FF NN EEE WWW SSSS',
+            'pattern': 'FF NN EEE WWW SSSS',
+            'description': 'Mixed winds with flowers',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'wind', 'value': 'N', 'count': 2},
+                {'type': 'wind', 'value': 'E', 'count': 3},
+                {'type': 'wind', 'value': 'W', 'count': 3},
+                {'type': 'wind', 'value': 'S', 'count': 4}
+            ]
+        },
+        'winds_NNNN_11_22_33_SSSS': {
+            'name': 'Winds NNNN 11 22 33 SSSS',
+            'pattern': 'NNNN 11 22 33 SSSS',
+            'description': 'ALL SUIT A',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit',
+            'joker_allowed': True,
+            'special_rules': ['Can be any 3 consecutive numbers'],
+            'components': [
+                {'type': 'wind', 'value': 'N', 'count': 4},
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
+                {'type': 'wind', 'value': 'S', 'count': 4}
+            ]
+        },
+        'winds_FF_DDDD_NEWS_DDDD': {
+            'name': 'Winds FF DDDD NEWS DDDD',
+            'pattern': 'FF DDDD NEWS DDDD',
+            'description': 'Two different dragon suits',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_dragons',
+            'joker_allowed': True,
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'dragon', 'value': 'D', 'count': 4},
+                {'type': 'wind', 'value': 'N', 'count': 1},
+                {'type': 'wind', 'value': 'E', 'count': 1},
+                {'type': 'wind', 'value': 'W', 'count': 1},
+                {'type': 'wind', 'value': 'S', 'count': 1},
+                {'type': 'dragon', 'value': 'D', 'count': 4}
+            ]
+        },
+        'winds_NNN_EW_SSS_111_111': {
+            'name': 'Winds NNN EW SSS 111 111',
+            'pattern': 'NNN EW SSS 111 111',
+            'description': 'Two suits allowed',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can be any like numbers 1-9, SUIT A and B must be same number'],
+            'components': [
+                {'type': 'wind', 'value': 'N', 'count': 3},
+                {'type': 'wind', 'value': 'E', 'count': 1},
+                {'type': 'wind', 'value': 'W', 'count': 1},
+                {'type': 'wind', 'value': 'S', 'count': 3},
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 1, 'count': 3, 'suit': 'B'}
+            ]
+        }
+    }
+
+
+def _build_369_patterns() -> Dict[str, Dict[str, Any]]:
+    """369 hands"""
+    return {
+        '369_333_666_6666_9999': {
+            'name': '369 333 666 6666 9999',
+            'pattern': '333 666 6666 9999',
+            'description': 'Two/Three Suits',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_or_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Must use numbers 3, 6, 9'],
+            'components': [
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 9, 'count': 4, 'suit': 'B'}
+            ]
+        },
+        '369_FF_3_66_999_333_333': {
+            'name': '369 FF 3 66 999 333 333',
+            'pattern': 'FF 3 66 999 333 333',
+            'description': 'Three suits allowed',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Like pungs of 3, 6, or 9'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 3, 'count': 1, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 9, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'B'},
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'C'}
+            ]
+        },
+        '369_FF_3333_6666_9999': {
+            'name': '369 FF 3333 6666 9999',
+            'pattern': 'FF 3333 6666 9999',
+            'description': 'ALL SUIT A or Three different suits',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_or_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Can be all same suit or three different suits'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2},
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 4, 'suit': 'B'},
+                {'type': 'number', 'value': 9, 'count': 4, 'suit': 'C'}
+            ]
+        },
+        '369_333_DDDD_333_DDDD': {
+            'name': '369 333 DDDD 333 DDDD',
+            'pattern': '333 DDDD 333 DDDD',
+            'description': 'Two suits with matching dragons',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_2_suits_matching_dragons',
+            'joker_allowed': True,
+            'special_rules': ['Pungs of 3, 6, or 9 with matching dragons, SUIT A and B numbers must be same'],
+            'components': [
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
+                {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True},
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'B'},
+                {'type': 'dragon', 'value': 'D', 'count': 4, 'matching': True}
+            ]
+        },
+        '369_3333_66_66_66_9999': {
+            'name': '369 3333 66 66 66 9999',
+            'pattern': '3333 66 66 66 9999',
+            'description': 'Three suits allowed',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['3s and 9s must match (same suit)'],
+            'components': [
+                {'type': 'number', 'value': 3, 'count': 4, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 6, 'count': 2, 'suit': 'C'},
+                {'type': 'number', 'value': 9, 'count': 4, 'suit': 'A'}
+            ]
+        },
+        '369_FFFF_33_66_999_DDD': {
+            'name': '369 FFFF 33 66 999 DDD',
+            'pattern': 'FFFF 33 66 999 DDD',
+            'description': 'Numbers any 1 suit, any opposite dragon',
+            'points': 25,
+            'category': 'X',
+            'suit_requirement': 'any_1_suit_opposite_dragons',
+            'joker_allowed': True,
+            'special_rules': ['Numbers any 1 suit, any opposite dragon'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 4},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 9, 'count': 3, 'suit': 'A'},
+                {'type': 'dragon', 'value': 'D', 'count': 3, 'opposite': True}
+            ]
+        },
+        '369_333_666_333_666_99': {
+            'name': '369 333 666 333 666 99',
+            'pattern': '333 666 333 666 99',
+            'description': 'Three suits allowed',
+            'points': 30,
+            'category': 'X',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': True,
+            'special_rules': ['Must use numbers 3, 6, 9'],
+            'components': [
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 3, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 3, 'suit': 'B'},
+                {'type': 'number', 'value': 6, 'count': 3, 'suit': 'B'},
+                {'type': 'number', 'value': 9, 'count': 2, 'suit': 'C'}
+            ]
+        }
+    }
+
+
+def _build_singles_and_pairs_patterns() -> Dict[str, Dict[str, Any]]:
+    """Singles and pairs hands"""
+    return {
+        'singles_FF_22_46_88_22_46_88': {
+            'name': 'Singles FF 22 46 88 22 46 88',
+            'pattern': 'FF 22 46 88 22 46 88',
+            'description': 'Two suits allowed',
+            'points': 50,
+            'category': 'C',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': False,
+            'special_rules': ['Specific numbers 2, 4, 6, 8 only', 'NO FLOWERS ALLOWED despite "FF" notation'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2, 'not_allowed': True},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 1, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 1, 'suit': 'A'},
+                {'type': 'number', 'value': 8, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 4, 'count': 1, 'suit': 'B'},
+                {'type': 'number', 'value': 6, 'count': 1, 'suit': 'B'},
+                {'type': 'number', 'value': 8, 'count': 2, 'suit': 'B'}
+            ]
+        },
+        'singles_FF_11_33_55_55_77_99': {
+            'name': 'Singles FF 11 33 55 55 77 99',
+            'pattern': 'FF 11 33 55 55 77 99',
+            'description': 'Two suits allowed',
+            'points': 50,
+            'category': 'C',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': False,
+            'special_rules': ['Odd numbers only', 'NO FLOWERS ALLOWED despite "FF" notation'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2, 'not_allowed': True},
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 7, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 9, 'count': 2, 'suit': 'B'}
+            ]
+        },
+        'singles_112_11223_112233': {
+            'name': 'Singles 112 11223 112233',
+            'pattern': '112 11223 112233',
+            'description': 'Three suits required',
+            'points': 50,
+            'category': 'C',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': False,
+            'special_rules': ['Specific number patterns only'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 1, 'suit': 'A'},
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'B'},
+                {'type': 'number', 'value': 3, 'count': 1, 'suit': 'B'},
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'C'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'C'},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'C'}
+            ]
+        },
+        'singles_FF_33_66_99_369_369': {
+            'name': 'Singles FF 33 66 99 369 369',
+            'pattern': 'FF 33 66 99 369 369',
+            'description': 'Three suits allowed',
+            'points': 50,
+            'category': 'C',
+            'suit_requirement': 'any_3_suits',
+            'joker_allowed': False,
+            'special_rules': ['Must use 3, 6, 9 pattern', 'NO FLOWERS ALLOWED despite "FF" notation'],
+            'components': [
+                {'type': 'flower', 'value': 'F', 'count': 2, 'not_allowed': True},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 6, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 9, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 1, 'suit': 'B'},
+                {'type': 'number', 'value': 6, 'count': 1, 'suit': 'B'},
+                {'type': 'number', 'value': 9, 'count': 1, 'suit': 'B'},
+                {'type': 'number', 'value': 3, 'count': 1, 'suit': 'C'},
+                {'type': 'number', 'value': 6, 'count': 1, 'suit': 'C'},
+                {'type': 'number', 'value': 9, 'count': 1, 'suit': 'C'}
+            ]
+        },
+        'singles_11_22_33_44_55_DD_DD': {
+            'name': 'Singles 11 22 33 44 55 DD DD',
+            'pattern': '11 22 33 44 55 DD DD',
+            'description': 'SUIT A + two different dragon suits',
+            'points': 50,
+            'category': 'C',
+            'suit_requirement': 'any_1_suit_opposite_dragons',
+            'joker_allowed': False,
+            'special_rules': ['Can be any 5 consecutive numbers (12345, 23456, 34567, 45678, 56789)'],
+            'components': [
+                {'type': 'number', 'value': 1, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 2, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 3, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 4, 'count': 2, 'suit': 'A'},
+                {'type': 'number', 'value': 5, 'count': 2, 'suit': 'A'},
+                {'type': 'dragon', 'value': 'D', 'count': 2, 'opposite': True},
+                {'type': 'dragon', 'value': 'D', 'count': 2, 'opposite': True}
+            ]
+        },
+        'singles_2024_NN_EW_SS_2024': {
+            'name': 'Singles 2024 NN EW SS 2024',
+            'pattern': '2024 NN EW SS 2024',
+            'description': 'Two suits allowed',
+            'points': 75,
+            'category': 'C',
+            'suit_requirement': 'any_2_suits',
+            'joker_allowed': False,
+            'special_rules': ['In both 2024s, the 0 must be White Dragon'],
+            'components': [
+                {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'},
+                {'type': 'wind', 'value': 'N', 'count': 2},
+                {'type': 'wind', 'value': 'E', 'count': 1},
+                {'type': 'wind', 'value': 'W', 'count': 1},
+                {'type': 'wind', 'value': 'S', 'count': 2},
+                {'type': 'year', 'value': '2024', 'count': 1, 'special': 'white_dragon_0'}
+            ]
+        }
+    }
+
+
+# Category builders in display order, keyed by category name
+_CATEGORY_BUILDERS = {
+    '2024_patterns': _build_2024_patterns,
+    '2468_patterns': _build_2468_patterns,
+    'any_like_numbers_patterns': _build_any_like_numbers_patterns,
+    'addition_hands_patterns': _build_addition_hands_patterns,
+    'quint_patterns': _build_quint_patterns,
+    'consecutive_run_patterns': _build_consecutive_run_patterns,
+    '13579_patterns': _build_13579_patterns,
+    'winds_dragons_patterns': _build_winds_dragons_patterns,
+    '369_patterns': _build_369_patterns,
+    'singles_and_pairs_patterns': _build_singles_and_pairs_patterns,
+}
+
+
+# Pickled output of build_pattern_data; regenerate with tools/build_patterns.py
+PATTERN_DATA_FILE = Path(__file__).resolve().parent / 'data' / 'patterns_2024.pkl'
+
+
+def build_pattern_data() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Run every category builder, giving the pattern literals keyed by category name"""
+    return {name: builder() for name, builder in _CATEGORY_BUILDERS.items()}
+
+
+@cache
+def _load_pattern_data() -> Optional[Dict[str, Dict[str, Dict[str, Any]]]]:
+    """Load the pickled pattern literals, or None if the data file is missing"""
+    try:
+        with open(PATTERN_DATA_FILE, 'rb') as data_file:
+            return pickle.load(data_file)
+    except FileNotFoundError:
+        return None
+
+
+@cache
+def _category(name: str) -> Dict[str, Pattern]:
+    """Build a pattern category once, freeze its patterns and reuse it afterwards"""
+    pattern_data = _load_pattern_data()
+    category = pattern_data[name] if pattern_data is not None else _CATEGORY_BUILDERS[name]()
+    # Unpickled ids are fresh strings; interning them shares one object with
+    # every id written as a literal in the calling code
+    return {
+        sys.intern(pattern_id): Pattern.from_dict(pattern_info)
+        for pattern_id, pattern_info in category.items()
+    }
+
+
+class _LazyCategories(Mapping):
+    """Read-only mapping of category name to patterns that builds each category on first access"""
+
+    def __init__(self, builders: Dict[str, Callable[[], Dict[str, Dict[str, Any]]]]):
+        self._builders = builders
+
+    def __getitem__(self, name: str) -> Dict[str, Pattern]:
+        if name not in self._builders:
+            raise KeyError(name)
+        return _category(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def __len__(self) -> int:
+        return len(self._builders)
+
+
+# Rule descriptions served lazily from rules_descriptions
+_DESCRIPTION_NAMES = ('SUIT_REQUIREMENTS', 'JOKER_RULES', 'HAND_CATEGORIES')
+
+
+def __getattr__(name: str) -> Any:
+    """Build pattern categories, the shared MahjongRules and the rule descriptions on first module
+    attribute access (PEP 562)"""
+    if name in _CATEGORY_BUILDERS:
+        value = _category(name)
+    elif name == 'mahjong_rules':
+        value = MahjongRules()
+    elif name in _DESCRIPTION_NAMES:
+        from . import rules_descriptions
+        value = getattr(rules_descriptions, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+# Pattern definitions by year; categories are built on first access
+YEAR_PATTERNS: Mapping[int, Mapping[str, Dict[str, Pattern]]] = MappingProxyType({
+    2024: _LazyCategories(_CATEGORY_BUILDERS)
+})
+
+# Shared read-only result for lookups that find nothing, so a miss allocates no dict
+_EMPTY: Mapping[Any, Any] = MappingProxyType({})
+
+# Per-year lookups, filled on first use for years in YEAR_PATTERNS
+_ALL_PATTERNS: Dict[int, Dict[str, Pattern]] = {}
+_CATEGORY_PATTERNS: Dict[Tuple[int, str], Dict[str, Pattern]] = {}
+_INDEXES: Dict[int, Dict[str, Dict[Any, Dict[str, Pattern]]]] = {}
+_PATTERN_TABLES: Dict[int, 'PatternTable'] = {}
+
+
+def get_pattern_by_id(pattern_id: str, year: int = 2024) -> Optional[Pattern]:
+    """Get a specific pattern by its ID; ids are unique across categories, so one flat lookup finds it"""
+    return get_all_patterns(year).get(pattern_id)
+
+
+def get_all_patterns(year: int = 2024) -> Mapping[str, Pattern]:
+    """Get all patterns for a specific year (the returned dict is shared; do not modify it)"""
+    if year in _ALL_PATTERNS:
+        return _ALL_PATTERNS[year]
+    if year not in YEAR_PATTERNS:
+        return _EMPTY
+
+    all_patterns = {}
+    for category_patterns in YEAR_PATTERNS[year].values():
+        all_patterns.update(category_patterns)
+
+    _ALL_PATTERNS[year] = all_patterns
+    return all_patterns
+
+
+def get_patterns_by_category(category: str, year: int = 2024) -> Mapping[str, Pattern]:
+    """Get all patterns in a specific category"""
+    if (year, category) in _CATEGORY_PATTERNS:
+        return _CATEGORY_PATTERNS[year, category]
+
+    patterns = YEAR_PATTERNS.get(year, _EMPTY).get(f"{category}_patterns", _EMPTY)
+    if patterns is not _EMPTY:
+        _CATEGORY_PATTERNS[year, category] = patterns
+    return patterns
+
+
+def get_patterns_for_suit_requirement(requirement: str, year: int = 2024) -> Mapping[str, Pattern]:
+    """Get all patterns with a specific suit requirement"""
+    return _get_index(year)['suit_requirement'].get(requirement, _EMPTY)
+
+
+def get_patterns_for_hand_category(category: str, year: int = 2024) -> Mapping[str, Pattern]:
+    """Get all exposed ('X') or concealed ('C') patterns"""
+    return _get_index(year)['category'].get(category, _EMPTY)
+
+
+def get_patterns_by_joker_allowed(joker_allowed: bool, year: int = 2024) -> Mapping[str, Pattern]:
+    """Get all patterns that do or do not allow jokers"""
+    return _get_index(year)['joker_allowed'].get(joker_allowed, _EMPTY)
+
+
+def get_patterns_by_tile_count(total_tiles: int, year: int = 2024) -> Mapping[str, Pattern]:
+    """Get all patterns made of exactly this many tiles"""
+    return _get_index(year)['total_tiles'].get(total_tiles, _EMPTY)
+
+
+def _get_index(year: int) -> Dict[str, Dict[Any, Dict[str, Pattern]]]:
+    """Build the inverted pattern indexes for a year on first use"""
+    if year in _INDEXES:
+        return _INDEXES[year]
+
+    index = {'suit_requirement': {}, 'category': {}, 'joker_allowed': {}, 'total_tiles': {}}
+    for pattern_id, pattern in get_all_patterns(year).items():
+        for field_name, patterns_by_value in index.items():
+            patterns_by_value.setdefault(pattern[field_name], {})[pattern_id] = pattern
+
+    if year in YEAR_PATTERNS:
+        _INDEXES[year] = index
+    return index
+
+
+def get_pattern_table(year: int = 2024) -> 'PatternTable':
+    """Get the stacked count templates of every pattern for a year"""
+    if year not in _PATTERN_TABLES:
+        from .pattern_matcher import PatternTable
+        table = PatternTable(YEAR_PATTERNS.get(year, _EMPTY))
+        if year not in YEAR_PATTERNS:
+            return table
+        _PATTERN_TABLES[year] = table
+    return _PATTERN_TABLES[year]
+
 
-# Global instance
-mahjong_rules = MahjongRules() 
\ No newline at end of file
+def match_hand(hand_vec: 'np.ndarray', year: int = 2024) -> List[str]:
+    """Get the ids of all patterns a tile-count vector completely covers"""
+    return get_pattern_table(year).match(hand_vec)
@@ -3,14 +3,391 @@ American Mahjong Tile Calculator
 Provides recommendations for discards and draws based on American Mahjong hand analysis.
 """
 
-from collections import Counter, defaultdict
-from typing import List, Dict, Tuple
+from bisect import bisect_right
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+import heapq
+from typing import Collection, Iterable, List, Dict, Optional, Sequence, Tuple, Union
 import logging
+import threading
+from types import MappingProxyType
+import numpy as np
+
+from .jit import NUMBA_AVAILABLE, njit, prange
+from .rules_specification import YEAR_PATTERNS
+from .tiles import (
+    FLOWER_ID, LANE_BITS, LANE_LOW_BITS, NO_SUIT, NUM_NUMBERED, NUM_TILE_KINDS, SUIT_LETTERS, TILE_ID, TILE_NAMES, TILE_RANK,
+    TILE_SUIT, YEAR_ID, hand_counts, tile_ids
+)
 
 logger = logging.getLogger(__name__)
 
+# Honor tile groups; White Dragon is '0', so West wind 'W' is only a wind
+_DRAGONS = frozenset(('R', 'G', '0'))
+_WINDS = frozenset(('E', 'S', 'W', 'N'))
+
+# Special tiles that are often valuable to draw
+_SPECIAL_DRAW_TILES = frozenset(('R', 'G', '0', 'F', '2024'))
+
+# Numbers of the 2024 2468, 13579 and 369 patterns
+_EVEN_NUMBERS = frozenset((2, 4, 6, 8))
+_ODD_NUMBERS = frozenset((1, 3, 5, 7, 9))
+_THREE_SIX_NINE = frozenset((3, 6, 9))
+
+# Recommendations kept for repeated hands, shared by every calculator. An entry
+# is a small dict (two advice strings and the draw list) plus its key, about
+# 2 KB, so the cache stays within a few MB, the same size as the evaluations
+RECOMMENDATION_CACHE_SIZE = 4096
+
+# hand_structure fields the recommendations read
+_STRUCTURE_FIELDS = ('num_suits', 'flower_tiles', 'dragon_tiles', 'year_tiles')
+
+# Score change by how many copies of the tile the hand holds; four or more share the last entry
+_DISCARD_FREQUENCY = np.array([0, -3, 2, 8, 8], dtype=np.float64)
+_DRAW_FREQUENCY = np.array([0, 3, 6, 10, 0], dtype=np.float64)
+
+def _tile_mask(tiles: Iterable[str]) -> int:
+    """Get the bitset of a group of tiles, one bit per tile id at the low bit of its LANE_BITS lane"""
+    mask = 0
+    for tile in tiles:
+        mask |= 1 << (LANE_BITS * TILE_ID[tile])
+    return mask
+
+def _mask_tiles(mask: int) -> List[str]:
+    """Get the tile names of the ids set in a bitset, in id order"""
+    names = []
+    while mask:
+        low_bit = mask & -mask
+        names.append(TILE_NAMES[(low_bit.bit_length() - 1) // LANE_BITS])
+        mask ^= low_bit
+    return names
+
+# Bitsets of numbered tiles by rank, for shifting held tiles onto their same-suit neighbours
+_RANK_1_MASK = _tile_mask(f"1{suit}" for suit in SUIT_LETTERS)
+_RANK_9_MASK = _tile_mask(f"9{suit}" for suit in SUIT_LETTERS)
+_NUMBERED_MASK = LANE_LOW_BITS & ((1 << (LANE_BITS * NUM_NUMBERED)) - 1)
+
+_SPECIAL_MASK = _tile_mask(_SPECIAL_DRAW_TILES)
+
+# Numbered tiles for the 2024 patterns
+_YEAR_2024_MASK = _tile_mask(f"{number}{suit}" for number in _EVEN_NUMBERS | _ODD_NUMBERS | _THREE_SIX_NINE
+                             for suit in SUIT_LETTERS)
+
+def _mask_vector(mask: int) -> np.ndarray:
+    """Get a bitset (see _tile_mask) as a bool vector indexed by tile id"""
+    return np.array([mask >> (LANE_BITS * tile_id) & 1 for tile_id in range(NUM_TILE_KINDS)], dtype=np.bool_)
+
+# The bitsets above as bool vectors, for scoring hands in bulk
+_SPECIAL_VECTOR = _mask_vector(_SPECIAL_MASK)
+_YEAR_2024_VECTOR = _mask_vector(_YEAR_2024_MASK)
+
+def _same_suit_tiles(offsets: Tuple[int, ...]) -> Tuple[Tuple[str, ...], ...]:
+    """Get, for every tile id, the names of the numbered tiles of its suit at the given rank offsets"""
+    return tuple(
+        tuple(TILE_NAMES[tile_id + offset] for offset in offsets if 1 <= TILE_RANK[tile_id] + offset <= 9)
+        if TILE_RANK[tile_id] else ()
+        for tile_id in range(NUM_TILE_KINDS)
+    )
+
+# Same-suit neighbour names of every tile id, empty for tiles without a suit
+_ADJACENT_TILES = _same_suit_tiles((-1, 1))
+_TWO_AWAY_TILES = _same_suit_tiles((-2, 2))
+
+# Sequence scores of a numbered tile by 2 * adjacent neighbours held + any tile two away held
+_SEQUENCE_POTENTIAL = np.array([0, 1, 3, 3, 6, 6], dtype=np.float64)
+_SEQUENCE_HELP = np.array([0.5, 0.5, 2, 2, 5, 5], dtype=np.float64)
+
+# Shared read-only stand-in for a missing hand_structure, so lookups don't build
+# a fresh dict per call
+_NO_STRUCTURE = MappingProxyType({})
+
+# Tile categories; jokers and blanks share the blanks category
+CATEGORY_NUMBERED, CATEGORY_WIND, CATEGORY_DRAGON, CATEGORY_FLOWER, CATEGORY_YEAR, CATEGORY_BLANK = range(6)
+
+# tile_values key of each category
+_CATEGORY_VALUE_KEYS = ('numbered', 'winds', 'dragons', 'flowers', 'year_tiles', 'blanks')
+
+# Why the best discard should go, by category
+_LOWEST_POTENTIAL = "Discard {tile} - This tile has the lowest potential for improving your hand"
+_DISCARD_REASONS = (
+    _LOWEST_POTENTIAL,
+    "Discard {tile} - Wind tiles are valuable but this one doesn't fit your current pattern",
+    "Discard {tile} - Dragon tiles are valuable but this one doesn't fit your hand structure",
+    "Discard {tile} - While flowers are valuable, this one doesn't fit your current strategy",
+    "Discard {tile} - Year tiles are valuable but this one doesn't fit your hand structure",
+    _LOWEST_POTENTIAL,
+)
+
+# Hand strength context, one line per hand_value tier; the thresholds are the
+# lower bounds of every tier past the first
+_HAND_VALUE_THRESHOLDS = (25, 35, 50)
+_HAND_VALUE_REASONS = (
+    "Your hand needs work - focus on building basic structure",
+    "Your hand is developing - focus on building sequences and pairs",
+    "Your hand is strong - focus on completing your best patterns",
+    "Your hand is excellent - focus on completing high-value patterns",
+)
+
+def _classify_tiles(dragons: Collection[str], winds: Collection[str]) -> bytes:
+    """
+    Classify every tile id once, so scoring branches on a small int instead of string tests
+
+    Args:
+        dragons: Dragon tile names
+        winds: Wind tile names
+
+    Returns:
+        Category of each tile id, one byte per id
+    """
+    categories = bytearray(NUM_TILE_KINDS)
+    for tile_id, tile in enumerate(TILE_NAMES):
+        if tile_id == FLOWER_ID:
+            categories[tile_id] = CATEGORY_FLOWER
+        elif tile_id == YEAR_ID:
+            categories[tile_id] = CATEGORY_YEAR
+        elif tile in dragons:
+            categories[tile_id] = CATEGORY_DRAGON
+        elif tile in winds:
+            categories[tile_id] = CATEGORY_WIND
+        elif TILE_SUIT[tile_id] != NO_SUIT:
+            categories[tile_id] = CATEGORY_NUMBERED
+        else:
+            categories[tile_id] = CATEGORY_BLANK
+    return bytes(categories)
+
+def _suit_shifts(present: np.ndarray, offset: int) -> np.ndarray:
+    """Get, for every numbered tile, whether the tile offset ranks away in its suit is present
+
+    Args:
+        present: Bool presence of the numbered tiles, shape (..., 3, 9)
+        offset: Rank offset, negative for lower ranks
+
+    Returns:
+        Bool array of the same shape, False where the offset falls outside the suit
+    """
+    shifted = np.zeros_like(present)
+    if offset > 0:
+        shifted[..., :-offset] = present[..., offset:]
+    else:
+        shifted[..., -offset:] = present[..., :offset]
+    return shifted
+
+@lru_cache(maxsize=None)
+def _year_value(tile_id: int, year: int) -> float:
+    """Get the year-specific pattern value of a tile id"""
+    score = 0.0
+    
+    # Example year-specific logic for 2024
+    if year == 2024:
+        # 2024 patterns favor certain tiles
+        category = TileCalculator._TILE_CATEGORY[tile_id]
+        if category == CATEGORY_YEAR:
+            score += 5  # Year tile is very valuable
+        elif category == CATEGORY_DRAGON:  # Dragons
+            score += 2
+        elif category == CATEGORY_FLOWER:  # Flowers
+            score += 3
+        elif category == CATEGORY_NUMBERED:  # Numbered tiles
+            number = TILE_RANK[tile_id]
+            if number in _EVEN_NUMBERS:  # Even numbers for 2468 patterns
+                score += 1
+            if number in _ODD_NUMBERS:  # Odd numbers for 13579 patterns
+                score += 1
+            if number in _THREE_SIX_NINE:  # 369 patterns
+                score += 1
+    
+    return score
+
+@lru_cache(maxsize=None)
+def _year_values(year: int) -> np.ndarray:
+    """Get the read-only vector of year-specific values indexed by tile id"""
+    values = np.array([_year_value(tile_id, year) for tile_id in range(NUM_TILE_KINDS)])
+    values.flags.writeable = False
+    return values
+
+def _score_arrays(counts: np.ndarray, base_values: np.ndarray, year_values: np.ndarray,
+                  suit_structure: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score every tile id for discarding and drawing with whole-array arithmetic
+
+    Works on one hand or a stack of hands; leading dimensions of the arguments
+    broadcast together.
+
+    Args:
+        counts: int8 tile-count vectors of the hands, shape (..., NUM_TILE_KINDS)
+        base_values: Base value of each tile id
+        year_values: Year-specific value of each tile id, shape (..., NUM_TILE_KINDS)
+        suit_structure: Hand structure value of a numbered tile of each suit, shape (..., 3)
+
+    Returns:
+        Tuple of float64 discard scores and draw scores, indexed by tile id in the last axis
+    """
+    frequency = np.minimum(counts, len(_DISCARD_FREQUENCY) - 1)
+    
+    # Same-suit neighbours of each numbered tile
+    present = counts[..., :NUM_NUMBERED].reshape(counts.shape[:-1] + (len(SUIT_LETTERS), 9)) > 0
+    adjacent = _suit_shifts(present, -1).astype(np.int8) + _suit_shifts(present, 1)
+    neighbours = (2 * adjacent + (_suit_shifts(present, -2) | _suit_shifts(present, 2)))
+    neighbours = neighbours.reshape(counts.shape[:-1] + (NUM_NUMBERED,))
+    sequence_potential = np.zeros(counts.shape)
+    sequence_potential[..., :NUM_NUMBERED] = _SEQUENCE_POTENTIAL[neighbours]
+    sequence_help = np.zeros(counts.shape)
+    sequence_help[..., :NUM_NUMBERED] = _SEQUENCE_HELP[neighbours]
+    
+    structure_value = np.zeros(np.broadcast_shapes(counts.shape, np.shape(suit_structure)[:-1] + (NUM_TILE_KINDS,)))
+    structure_value[..., :NUM_NUMBERED] = np.repeat(suit_structure, 9, axis=-1)
+    
+    discard_scores = base_values + _DISCARD_FREQUENCY[frequency] + sequence_potential + year_values + structure_value
+    draw_scores = base_values + _DRAW_FREQUENCY[frequency] + sequence_help + year_values + structure_value
+    return discard_scores, draw_scores
+
+@njit(cache=True, boundscheck=False)
+def _score_kernel(counts, base_values, year_values, suit_structure, discard_out, draw_out):
+    """Compiled version of _score_arrays writing one tile id at a time into discard_out and draw_out"""
+    for tile_id in range(counts.shape[0]):
+        frequency = min(counts[tile_id], 4)
+        sequence_potential = 0.0
+        sequence_help = 0.0
+        structure_value = 0.0
+        if tile_id < NUM_NUMBERED:
+            # Same-suit neighbours; the rank guards keep them inside the suit
+            rank = tile_id % 9
+            adjacent = 0
+            if rank > 0 and counts[tile_id - 1] > 0:
+                adjacent += 1
+            if rank < 8 and counts[tile_id + 1] > 0:
+                adjacent += 1
+            two_away = 0
+            if (rank > 1 and counts[tile_id - 2] > 0) or (rank < 7 and counts[tile_id + 2] > 0):
+                two_away = 1
+            sequence_potential = _SEQUENCE_POTENTIAL[2 * adjacent + two_away]
+            sequence_help = _SEQUENCE_HELP[2 * adjacent + two_away]
+            structure_value = suit_structure[tile_id // 9]
+        discard_out[tile_id] = (base_values[tile_id] + _DISCARD_FREQUENCY[frequency] + sequence_potential
+                                + year_values[tile_id] + structure_value)
+        draw_out[tile_id] = (base_values[tile_id] + _DRAW_FREQUENCY[frequency] + sequence_help
+                             + year_values[tile_id] + structure_value)
+
+def _recommend_arrays(hands: np.ndarray, base_values: np.ndarray, year_values: np.ndarray, is_2024: np.ndarray,
+                      dragon_ids: np.ndarray, num_draws: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the best discard and draws of many hands with whole-array arithmetic
+
+    Args:
+        hands: int8 tile counts, shape (n_hands, NUM_TILE_KINDS)
+        base_values: Base value of each tile id
+        year_values: Year-specific value of each tile id for each hand
+        is_2024: Whether each hand is played under 2024 rules
+        dragon_ids: Tile id of the dragon matching each suit
+        num_draws: Number of draws to recommend per hand
+
+    Returns:
+        Tuple of best discard ids and (n_hands, num_draws) draw ids, as for
+        TileCalculator.get_recommendations_batch
+    """
+    n_hands = len(hands)
+    
+    # Hand structure as HandEvaluator derives it from the numbered tiles
+    suit_counts = hands[:, :NUM_NUMBERED].reshape(n_hands, len(SUIT_LETTERS), 9).sum(axis=2)
+    suits_used = suit_counts > 0
+    num_suits = suits_used.sum(axis=1, keepdims=True)
+    suit_structure = (2.0 * ((num_suits == 1) & suits_used) + ((num_suits > 1) & (suit_counts >= 4))
+                      + (hands[:, dragon_ids] > 0))
+    
+    discard_scores, draw_scores = _score_arrays(hands, base_values, year_values, suit_structure)
+    
+    # Discard the lowest-scoring tile each hand holds
+    held = hands > 0
+    best_discards = np.argmin(np.where(held, discard_scores, np.inf), axis=1)
+    best_discards[~held.any(axis=1)] = -1
+    
+    # Draw from the helpful tiles: singles, same-suit neighbours of held
+    # numbered tiles, and missing special and year tiles; empty hands get none
+    candidates = hands == 1
+    present = held[:, :NUM_NUMBERED].reshape(n_hands, len(SUIT_LETTERS), 9)
+    neighbours = _suit_shifts(present, -1) | _suit_shifts(present, 1)
+    candidates[:, :NUM_NUMBERED] |= neighbours.reshape(n_hands, NUM_NUMBERED)
+    candidates |= _SPECIAL_VECTOR & ~held
+    candidates |= is_2024[:, None] & _YEAR_2024_VECTOR & ~held
+    candidates &= held.any(axis=1, keepdims=True)
+    order = np.argsort(-np.where(candidates, draw_scores, -np.inf), axis=1, kind='stable')[:, :num_draws]
+    best_draws = np.where(np.take_along_axis(candidates, order, axis=1), order, -1)
+    
+    return best_discards, best_draws
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def _recommend_kernel(hands, base_values, year_values, is_2024, dragon_ids, special, year_tiles,
+                      best_discards, best_draws):
+    """Parallel version of _recommend_arrays writing into best_discards and best_draws (pre-filled with -1)"""
+    n_suits = dragon_ids.shape[0]
+    for hand in prange(hands.shape[0]):
+        counts = hands[hand]
+        
+        # Hand structure as HandEvaluator derives it from the numbered tiles
+        suit_counts = np.zeros(n_suits, dtype=np.int64)
+        for suit in range(n_suits):
+            for tile_id in range(suit * 9, suit * 9 + 9):
+                suit_counts[suit] += counts[tile_id]
+        num_suits = 0
+        for suit in range(n_suits):
+            if suit_counts[suit] > 0:
+                num_suits += 1
+        suit_structure = np.zeros(n_suits)
+        for suit in range(n_suits):
+            if num_suits == 1 and suit_counts[suit] > 0:
+                suit_structure[suit] += 2
+            if num_suits > 1 and suit_counts[suit] >= 4:
+                suit_structure[suit] += 1
+            if counts[dragon_ids[suit]] > 0:
+                suit_structure[suit] += 1
+        
+        discard_scores = np.empty(counts.shape[0])
+        draw_scores = np.empty(counts.shape[0])
+        _score_kernel(counts, base_values, year_values[hand], suit_structure, discard_scores, draw_scores)
+        
+        # Discard the lowest-scoring tile the hand holds, the lowest id on ties
+        best_discards[hand] = -1
+        for tile_id in range(counts.shape[0]):
+            if counts[tile_id] > 0 and (best_discards[hand] < 0
+                                        or discard_scores[tile_id] < discard_scores[best_discards[hand]]):
+                best_discards[hand] = tile_id
+        if best_discards[hand] < 0:
+            continue  # Empty hands get no draws
+        
+        # Helpful draw candidates
+        candidates = np.zeros(counts.shape[0], dtype=np.bool_)
+        for tile_id in range(counts.shape[0]):
+            if counts[tile_id] == 1:
+                candidates[tile_id] = True
+            elif counts[tile_id] == 0 and (special[tile_id] or (is_2024[hand] and year_tiles[tile_id])):
+                candidates[tile_id] = True
+            if tile_id < NUM_NUMBERED:
+                rank = tile_id % 9
+                if (rank > 0 and counts[tile_id - 1] > 0) or (rank < 8 and counts[tile_id + 1] > 0):
+                    candidates[tile_id] = True
+        
+        # Highest draw scores first, the lowest id on ties
+        for slot in range(best_draws.shape[1]):
+            best = -1
+            for tile_id in range(counts.shape[0]):
+                if candidates[tile_id] and (best < 0 or draw_scores[tile_id] > draw_scores[best]):
+                    best = tile_id
+            if best < 0:
+                break
+            best_draws[hand, slot] = best
+            candidates[best] = False
+
 class TileCalculator:
     """Calculates optimal discards and draws for American Mahjong hands"""
+
+    # Category of every tile id
+    _TILE_CATEGORY = _classify_tiles(_DRAGONS, _WINDS)
+    
+    # Results of get_recommendations by _recommendation_key, least recently used first
+    _recommendation_cache: 'OrderedDict[Tuple, Dict]' = OrderedDict()
+    
+    # Guards _recommendation_cache, which Flask's worker threads share
+    _recommendation_lock = threading.Lock()
     
     def __init__(self):
         # Tile values for American Mahjong scoring
@@ -47,6 +424,18 @@ class TileCalculator:
             'B': 'G',  # Bams/Bamboo match Green Dragon
             'D': '0'   # Dots/Circles match White Dragon
         }
+        
+        # Base value of every tile id, so scoring indexes a table instead of
+        # walking the tile-type branches
+        self._base_value = tuple(self.tile_values[_CATEGORY_VALUE_KEYS[category]] for category in self._TILE_CATEGORY)
+        self._base_values = np.array(self._base_value, dtype=np.float64)
+        
+        # Year value of every tile id for each year with patterns; other years
+        # are built on first use
+        self._year_bonus = {year: _year_values(year) for year in YEAR_PATTERNS}
+        
+        # Settings the recommendations depend on, part of every cache key
+        self._settings_key = (self._base_value, tuple(self.dragon_associations.items()))
     
     def get_recommendations(self, tiles: List[str], hand_analysis: Dict, year: int = 2024) -> Dict:
         """
@@ -60,120 +449,221 @@ class TileCalculator:
         Returns:
             Dictionary with discard and draw recommendations
         """
-        try:
-            # Find best discard
-            best_discard = self._find_best_discard(tiles, hand_analysis, year)
-            
-            # Find best draws
-            best_draws = self._find_best_draws(tiles, hand_analysis, year)
-            
-            # Generate reasoning
-            reasoning = self._generate_reasoning(tiles, best_discard, best_draws, hand_analysis, year)
-            
-            # Generate strategic advice
-            strategic_advice = self._generate_strategic_advice(tiles, hand_analysis, year)
-            
-            return {
-                "best_discard": best_discard,
-                "best_draws": best_draws,
-                "reasoning": reasoning,
-                "strategic_advice": strategic_advice
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating recommendations: {str(e)}")
+        # Check the tiles up front rather than catching failures from the scoring;
+        # hands of any length are scored as before
+        tiles_to_win = hand_analysis.get('tiles_to_win', ())
+        unknown = [tile for tile in (*tiles, *tiles_to_win) if tile not in TILE_ID]
+        if unknown:
+            logger.error(f"Error generating recommendations: unknown tiles {unknown}")
             return {
                 "best_discard": None,
                 "best_draws": [],
                 "reasoning": "Unable to generate recommendations",
                 "strategic_advice": "Unable to generate strategic advice"
             }
+        
+        # Reuse the result for a hand seen before; the caller gets its own copy
+        key = self._recommendation_key(tiles, hand_analysis, year)
+        with self._recommendation_lock:
+            cached = self._recommendation_cache.get(key)
+            if cached is not None:
+                self._recommendation_cache.move_to_end(key)
+        if cached is not None:
+            return {**cached, "best_draws": list(cached["best_draws"])}
+        
+        # Count the hand once; scoring and the advice both read the counts
+        counts = hand_counts(tiles)
+        
+        # Score every tile kind once for both searches
+        scores = self._score_tiles(tiles, hand_analysis, year, counts)
+        
+        # Find best discard
+        best_discard = self._find_best_discard(tiles, hand_analysis, year, scores)
+        
+        # Find best draws
+        best_draws = self._find_best_draws(tiles, hand_analysis, year, scores)
+        
+        # Generate reasoning
+        reasoning = self._generate_reasoning(tiles, best_discard, best_draws, hand_analysis, year)
+        
+        # Generate strategic advice
+        strategic_advice = self._generate_strategic_advice(tiles, hand_analysis, year, counts)
+        
+        recommendations = {
+            "best_discard": best_discard,
+            "best_draws": best_draws,
+            "reasoning": reasoning,
+            "strategic_advice": strategic_advice
+        }
+        with self._recommendation_lock:
+            self._recommendation_cache[key] = {**recommendations, "best_draws": list(best_draws)}
+            if len(self._recommendation_cache) > RECOMMENDATION_CACHE_SIZE:
+                self._recommendation_cache.popitem(last=False)
+        return recommendations
+    
+    def get_recommendations_batch(self, hands: np.ndarray, years: Union[int, Sequence[int], np.ndarray] = 2024,
+                                  num_draws: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the best discard and draws for many hands at once, for simulations that play hands in bulk
+
+        Scores match get_recommendations given the hand structure HandEvaluator
+        reports for each hand. Draw candidates are the helpful tiles only, since
+        tiles_to_win needs a full hand evaluation, and ties go to the lower tile id.
+
+        Args:
+            hands: int8 array of shape (n_hands, NUM_TILE_KINDS) of tile counts
+            years: American Mahjong rules year of every hand, or one year for all
+            num_draws: Number of draws to recommend per hand
+
+        Returns:
+            Tuple of the best discard tile id of each hand (-1 for an empty hand)
+            and an (n_hands, num_draws) array of draw tile ids, best first, padded with -1
+        """
+        hands = np.ascontiguousarray(hands, dtype=np.int8)
+        if hands.ndim != 2 or hands.shape[1] != NUM_TILE_KINDS:
+            raise ValueError(f"Hands must have shape (n_hands, {NUM_TILE_KINDS})")
+        n_hands = len(hands)
+        years = np.broadcast_to(np.asarray(years), (n_hands,))
+        unique_years, year_index = np.unique(years, return_inverse=True)
+        year_values = np.array([self._year_table(int(year)) for year in unique_years]).reshape(-1, NUM_TILE_KINDS)
+        year_values = year_values[year_index]
+        is_2024 = years == 2024
+        dragon_ids = np.array([TILE_ID[self.dragon_associations[suit]] for suit in SUIT_LETTERS], dtype=np.intp)
+        num_draws = min(num_draws, NUM_TILE_KINDS)
+        
+        if NUMBA_AVAILABLE:
+            # Hands are independent, so the kernel spreads them across cores
+            best_discards = np.empty(n_hands, dtype=np.intp)
+            best_draws = np.full((n_hands, num_draws), -1, dtype=np.intp)
+            _recommend_kernel(hands, self._base_values, year_values, is_2024, dragon_ids,
+                              _SPECIAL_VECTOR, _YEAR_2024_VECTOR, best_discards, best_draws)
+            return best_discards, best_draws
+        return _recommend_arrays(hands, self._base_values, year_values, is_2024, dragon_ids, num_draws)
+    
+    def _recommendation_key(self, tiles: List[str], hand_analysis: Dict, year: int) -> Tuple:
+        """
+        Get the cache key of a get_recommendations call
+
+        Covers everything the recommendations read: the tiles in order (discard
+        ties go to the first in the hand), the year, the calculator settings and
+        the hand_analysis fields used.
+        """
+        hand_structure = hand_analysis.get('hand_structure', _NO_STRUCTURE)
+        return (
+            tuple(tiles), year, self._settings_key,
+            hand_analysis.get('hand_value', 0),
+            tuple(hand_analysis.get('tiles_to_win', ())),
+            tuple(hand_structure.get(field, 0) for field in _STRUCTURE_FIELDS),
+            tuple(hand_structure.get('suits_used', ())),
+        )
+    
+    def _score_tiles(self, tiles: List[str], hand_analysis: Dict, year: int,
+                     counts: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Score every tile kind for discarding and drawing at once
+
+        Computes the same sums as _calculate_discard_score and _calculate_draw_score
+        with array arithmetic over the tile-id universe instead of a call per tile.
+
+        Args:
+            tiles: Current hand
+            hand_analysis: Analysis from HandEvaluator
+            year: American Mahjong rules year
+            counts: hand_counts(tiles), when the caller already has it
+
+        Returns:
+            Tuple of float64 discard scores and draw scores, indexed by tile id
+        """
+        if counts is None:
+            counts = hand_counts(tiles)
+        year_value = self._year_table(year)
+        
+        # Hand structure only depends on the suit of a numbered tile
+        hand_structure = hand_analysis.get('hand_structure', _NO_STRUCTURE)
+        num_suits = hand_structure.get('num_suits', 0)
+        suits_used = hand_structure.get('suits_used', ())
+        suit_counts = counts[:NUM_NUMBERED].reshape(len(SUIT_LETTERS), 9).sum(axis=1)
+        suit_structure = np.zeros(len(SUIT_LETTERS))
+        for suit_index, suit in enumerate(SUIT_LETTERS):
+            if num_suits == 1 and suit in suits_used:
+                suit_structure[suit_index] += 2
+            if num_suits > 1 and suit_counts[suit_index] >= 4:
+                suit_structure[suit_index] += 1
+            matching_dragon = self.dragon_associations.get(suit)
+            if counts[TILE_ID[matching_dragon]]:
+                suit_structure[suit_index] += 1
+        
+        if NUMBA_AVAILABLE:
+            discard_scores = np.empty(NUM_TILE_KINDS)
+            draw_scores = np.empty(NUM_TILE_KINDS)
+            _score_kernel(counts, self._base_values, year_value, suit_structure, discard_scores, draw_scores)
+            return discard_scores, draw_scores
+        return _score_arrays(counts, self._base_values, year_value, suit_structure)
     
-    def _find_best_discard(self, tiles: List[str], hand_analysis: Dict, year: int) -> str:
-        """Find the best tile to discard from the current hand"""
+    def _find_best_discard(self, tiles: List[str], hand_analysis: Dict, year: int,
+                           scores: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> str:
+        """
+        Find the best tile to discard from the current hand
+
+        scores is the result of _score_tiles for this hand, when the caller
+        already has it.
+        """
         if not tiles:
             return None
         
-        # Score each tile for discard value
-        discard_scores = {}
-        
-        for tile in tiles:
-            score = self._calculate_discard_score(tile, tiles, hand_analysis, year)
-            discard_scores[tile] = score
+        # Score each distinct tile for discard value; copies score the same, and
+        # keeping first-seen order leaves ties with the first in the hand
+        if scores is None:
+            scores = self._score_tiles(tiles, hand_analysis, year)
+        distinct_tiles = list(dict.fromkeys(tiles))
+        hand_scores = scores[0][np.frombuffer(tile_ids(distinct_tiles), dtype=np.uint8)]
         
         # Find tile with lowest score (worst tile to keep)
-        worst_tile = min(discard_scores.keys(), key=lambda t: discard_scores[t])
+        worst_tile = distinct_tiles[int(np.argmin(hand_scores))]
         
         return worst_tile
     
-    def _calculate_discard_score(self, tile: str, all_tiles: List[str], hand_analysis: Dict, year: int) -> float:
-        """Calculate how good it would be to discard this tile (lower = better to discard)"""
-        score = 0.0
-        
-        # Base tile value
-        if tile == 'F':
-            score += self.tile_values['flowers']
-        elif tile == '2024':
-            score += self.tile_values['year_tiles']
-        elif tile in ['R', 'G', '0']:
-            score += self.tile_values['dragons']
-        elif tile in ['E', 'S', 'W', 'N']:
-            score += self.tile_values['winds']
-        elif tile.endswith(('B', 'C', 'D')):
-            score += self.tile_values['numbered']
-        else:
-            score += self.tile_values['blanks']
-        
+    def _calculate_discard_score(self, tile: str, all_tiles: List[str], hand_analysis: Dict, year: int,
+                                 tile_counts: Optional[Counter] = None) -> float:
+        """
+        Calculate how good it would be to discard this tile (lower = better to discard)
+
+        tile_counts is Counter(all_tiles); callers scoring many tiles pass it in
+        so it is built once per hand.
+        """
         # Consider tile frequency
-        tile_counts = Counter(all_tiles)
+        if tile_counts is None:
+            tile_counts = Counter(all_tiles)
         count = tile_counts[tile]
         
+        frequency_value = 0
         if count == 1:
-            score -= 3  # Single tiles are easier to discard
+            frequency_value = -3  # Single tiles are easier to discard
         elif count == 2:
-            score += 2  # Pairs are valuable
+            frequency_value = 2  # Pairs are valuable
         elif count >= 3:
-            score += 8  # Triplets are very valuable
-        
-        # Consider potential sequences
-        sequence_value = self._calculate_sequence_potential(tile, all_tiles)
-        score += sequence_value
-        
-        # Consider year-specific patterns
-        year_value = self._calculate_year_specific_value(tile, all_tiles, year)
-        score += year_value
-        
-        # Consider hand structure
-        structure_value = self._calculate_structure_value(tile, all_tiles, hand_analysis)
-        score += structure_value
-        
-        return score
+            frequency_value = 8  # Triplets are very valuable
+        
+        # Base tile value, frequency, potential sequences (the counts double as a
+        # hashed membership set), year-specific patterns and hand structure, summed
+        # in one expression
+        return (self._base_value[TILE_ID[tile]]
+                + frequency_value
+                + self._calculate_sequence_potential(tile, tile_counts)
+                + self._calculate_year_specific_value(tile, all_tiles, year)
+                + self._calculate_structure_value(tile, tile_counts, hand_analysis))
     
-    def _calculate_sequence_potential(self, tile: str, all_tiles: List[str]) -> float:
-        """Calculate how valuable a tile is for forming sequences"""
-        if not tile.endswith(('B', 'C', 'D')):
+    def _calculate_sequence_potential(self, tile: str, all_tiles: Collection[str]) -> float:
+        """Calculate how valuable a tile is for forming sequences (all_tiles is best a set or Counter)"""
+        tile_id = TILE_ID[tile]
+        if TILE_SUIT[tile_id] == NO_SUIT:
             return 0  # Only numbered tiles can form sequences
         
-        number = int(tile[0])
-        suit = tile[-1]
-        
-        # Check for adjacent tiles
-        adjacent_tiles = []
-        if number > 1:
-            adjacent_tiles.append(f"{number-1}{suit}")
-        if number < 9:
-            adjacent_tiles.append(f"{number+1}{suit}")
+        # Count how many adjacent tiles exist
+        adjacent_count = sum(1 for t in _ADJACENT_TILES[tile_id] if t in all_tiles)
         
         # Check for tiles 2 away (for 123, 234, etc.)
-        two_away_tiles = []
-        if number > 2:
-            two_away_tiles.append(f"{number-2}{suit}")
-        if number < 8:
-            two_away_tiles.append(f"{number+2}{suit}")
-        
-        # Count how many adjacent tiles exist
-        adjacent_count = sum(1 for t in adjacent_tiles if t in all_tiles)
-        two_away_count = sum(1 for t in two_away_tiles if t in all_tiles)
+        two_away_count = sum(1 for t in _TWO_AWAY_TILES[tile_id] if t in all_tiles)
         
         # Score based on sequence potential
         if adjacent_count == 2:
@@ -186,196 +676,146 @@ class TileCalculator:
             return 0
     
     def _calculate_year_specific_value(self, tile: str, all_tiles: List[str], year: int) -> float:
-        """Calculate value based on year-specific patterns"""
-        score = 0.0
-        
-        # Example year-specific logic for 2024
-        if year == 2024:
-            # 2024 patterns favor certain tiles
-            if tile == '2024':
-                score += 5  # Year tile is very valuable
-            if tile in ['R', 'G', '0']:  # Dragons
-                score += 2
-            if tile == 'F':  # Flowers
-                score += 3
-            if tile.endswith(('B', 'C', 'D')):  # Numbered tiles
-                number = int(tile[0])
-                if number in [2, 4, 6, 8]:  # Even numbers for 2468 patterns
-                    score += 1
-                if number in [1, 3, 5, 7, 9]:  # Odd numbers for 13579 patterns
-                    score += 1
-                if number in [3, 6, 9]:  # 369 patterns
-                    score += 1
-        
-        return score
+        """Calculate value based on year-specific patterns; it depends only on the tile and the year"""
+        return float(self._year_table(year)[TILE_ID[tile]])
     
-    def _calculate_structure_value(self, tile: str, all_tiles: List[str], hand_analysis: Dict) -> float:
-        """Calculate value based on current hand structure"""
+    def _year_table(self, year: int) -> np.ndarray:
+        """Get the year value of every tile id for a year"""
+        year_bonus = self._year_bonus.get(year)
+        return _year_values(year) if year_bonus is None else year_bonus
+    
+    def _calculate_structure_value(self, tile: str, tile_counts: Counter, hand_analysis: Dict) -> float:
+        """
+        Calculate value based on current hand structure
+
+        tile_counts is the hand's Counter shared with the caller, so the suit
+        count only visits each distinct tile once.
+        """
         score = 0.0
         
         # Get hand structure info
-        hand_structure = hand_analysis.get('hand_structure', {})
+        hand_structure = hand_analysis.get('hand_structure', _NO_STRUCTURE)
         num_suits = hand_structure.get('num_suits', 0)
-        suits_used = hand_structure.get('suits_used', [])
+        suits_used = hand_structure.get('suits_used', ())
+        
+        suit_index = TILE_SUIT[TILE_ID[tile]]
+        if suit_index == NO_SUIT:
+            return score  # Only numbered tiles depend on the hand's suits
+        suit = SUIT_LETTERS[suit_index]
         
         # If we have a single suit, favor keeping tiles in that suit
-        if num_suits == 1 and tile.endswith(('B', 'C', 'D')):
-            suit = tile[-1]
+        if num_suits == 1:
             if suit in suits_used:
                 score += 2  # Keep tiles in the same suit
         
         # If we have multiple suits, consider which to focus on
-        if num_suits > 1 and tile.endswith(('B', 'C', 'D')):
-            suit = tile[-1]
+        if num_suits > 1:
             # Check if this suit has more tiles
-            suit_count = sum(1 for t in all_tiles if t.endswith(suit))
+            suit_count = sum(n for t, n in tile_counts.items() if TILE_SUIT[TILE_ID[t]] == suit_index)
             if suit_count >= 4:  # If this suit has many tiles, keep it
                 score += 1
         
         # Consider dragon associations
-        if tile.endswith(('B', 'C', 'D')):
-            suit = tile[-1]
-            matching_dragon = self.dragon_associations.get(suit)
-            if matching_dragon in all_tiles:
-                score += 1  # Keep tiles that match existing dragons
+        matching_dragon = self.dragon_associations.get(suit)
+        if matching_dragon in tile_counts:
+            score += 1  # Keep tiles that match existing dragons
         
         return score
     
-    def _find_best_draws(self, tiles: List[str], hand_analysis: Dict, year: int) -> List[str]:
-        """Find the best tiles to draw to improve the hand"""
-        # Get tiles that would help complete the hand
-        tiles_to_win = hand_analysis.get('tiles_to_win', [])
+    def _find_best_draws(self, tiles: List[str], hand_analysis: Dict, year: int,
+                         scores: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> List[str]:
+        """
+        Find the best tiles to draw to improve the hand
+
+        scores is the result of _score_tiles for this hand, when the caller
+        already has it.
+        """
+        # Nothing to build on without a hand, so skip finding and scoring candidates
+        if not tiles:
+            return []
         
-        # Add additional helpful tiles based on hand structure
-        helpful_tiles = self._find_helpful_tiles(tiles, hand_analysis, year)
+        # Get tiles that would help complete the hand
+        tiles_to_win = hand_analysis.get('tiles_to_win', ())
         
-        # Combine and prioritize
-        all_helpful = list(set(tiles_to_win + helpful_tiles))
+        # Add additional helpful tiles based on hand structure; OR-ing the bitsets
+        # drops the duplicates
+        all_helpful = _mask_tiles(_tile_mask(tiles_to_win) | self._helpful_mask(tiles, year))
         
         # Score each helpful tile
-        draw_scores = {}
-        for tile in all_helpful:
-            score = self._calculate_draw_score(tile, tiles, hand_analysis, year)
-            draw_scores[tile] = score
-        
-        # Return top 8 most helpful tiles
-        sorted_tiles = sorted(draw_scores.keys(), key=lambda t: draw_scores[t], reverse=True)
-        return sorted_tiles[:8]
+        if scores is None:
+            scores = self._score_tiles(tiles, hand_analysis, year)
+        draw_scores = scores[1][[TILE_ID[tile] for tile in all_helpful]].tolist()
+        
+        # Return top 8 most helpful tiles; the scores line up with the candidates,
+        # so the key is a plain list index, and ties keep candidate order
+        order = heapq.nlargest(8, range(len(all_helpful)), key=draw_scores.__getitem__)
+        return [all_helpful[i] for i in order]
     
     def _find_helpful_tiles(self, tiles: List[str], hand_analysis: Dict, year: int) -> List[str]:
         """Find tiles that would help improve the hand"""
-        helpful_tiles = []
-        
-        # Find tiles that could form pairs with existing singles
-        tile_counts = Counter(tiles)
-        singles = [tile for tile, count in tile_counts.items() if count == 1]
-        
-        for single in singles:
-            helpful_tiles.append(single)  # Another of the same tile
-        
-        # Find tiles that could form sequences
-        for tile in tiles:
-            if tile.endswith(('B', 'C', 'D')):
-                number = int(tile[0])
-                suit = tile[-1]
-                
-                # Add tiles that could form sequences
-                if number > 1:
-                    helpful_tiles.append(f"{number-1}{suit}")
-                if number < 9:
-                    helpful_tiles.append(f"{number+1}{suit}")
+        return _mask_tiles(self._helpful_mask(tiles, year))
+    
+    def _helpful_mask(self, tiles: List[str], year: int) -> int:
+        """Get the bitset (see _tile_mask) of the tiles that would help improve the hand"""
+        # Bits of the held tiles, and of the singles, where another of the same tile forms a pair
+        held = helpful = 0
+        for tile_id, count in enumerate(hand_counts(tiles).tolist()):
+            if count:
+                held |= 1 << (LANE_BITS * tile_id)
+                if count == 1:
+                    helpful |= 1 << (LANE_BITS * tile_id)
+        
+        # Tiles that could form sequences: the same-suit neighbours of every held numbered tile
+        numbered = held & _NUMBERED_MASK
+        helpful |= (numbered & ~_RANK_1_MASK) >> LANE_BITS
+        helpful |= (numbered & ~_RANK_9_MASK) << LANE_BITS
         
         # Add special tiles that are often valuable
-        special_tiles = ['R', 'G', '0', 'F', '2024']
-        for tile in special_tiles:
-            if tile not in tiles:
-                helpful_tiles.append(tile)
+        helpful |= _SPECIAL_MASK & ~held
         
         # Add tiles that could help with year-specific patterns
         if year == 2024:
-            # Add tiles for 2468 patterns
-            for number in [2, 4, 6, 8]:
-                for suit in ['B', 'C', 'D']:
-                    tile = f"{number}{suit}"
-                    if tile not in tiles:
-                        helpful_tiles.append(tile)
-            
-            # Add tiles for 13579 patterns
-            for number in [1, 3, 5, 7, 9]:
-                for suit in ['B', 'C', 'D']:
-                    tile = f"{number}{suit}"
-                    if tile not in tiles:
-                        helpful_tiles.append(tile)
-            
-            # Add tiles for 369 patterns
-            for number in [3, 6, 9]:
-                for suit in ['B', 'C', 'D']:
-                    tile = f"{number}{suit}"
-                    if tile not in tiles:
-                        helpful_tiles.append(tile)
-        
-        return list(set(helpful_tiles))
-    
-    def _calculate_draw_score(self, tile: str, current_tiles: List[str], hand_analysis: Dict, year: int) -> float:
-        """Calculate how valuable it would be to draw this tile"""
-        score = 0.0
-        
-        # Base value
-        if tile == 'F':
-            score += 8  # Flowers are very valuable
-        elif tile == '2024':
-            score += 10  # Year tiles are very valuable
-        elif tile in ['R', 'G', '0']:
-            score += 6  # Dragons are very valuable
-        elif tile in ['E', 'S', 'W', 'N']:
-            score += 4  # Winds are valuable
-        elif tile.endswith(('B', 'C', 'D')):
-            score += 2  # Numbered tiles
-        else:
-            score += 1  # Other tiles
+            helpful |= _YEAR_2024_MASK & ~held
         
+        return helpful
+    
+    def _calculate_draw_score(self, tile: str, current_tiles: List[str], hand_analysis: Dict, year: int,
+                              tile_counts: Optional[Counter] = None) -> float:
+        """
+        Calculate how valuable it would be to draw this tile
+
+        tile_counts is Counter(current_tiles); callers scoring many tiles pass it
+        in so it is built once per hand.
+        """
         # Check if it would form a pair
-        tile_counts = Counter(current_tiles)
-        if tile in tile_counts:
-            count = tile_counts[tile]
-            if count == 1:
-                score += 3  # Would form a pair
-            elif count == 2:
-                score += 6  # Would form a triplet
-            elif count == 3:
-                score += 10  # Would form a quad
-        
-        # Check if it would help form sequences
-        sequence_help = self._calculate_sequence_help(tile, current_tiles)
-        score += sequence_help
-        
-        # Year-specific bonus
-        year_bonus = self._calculate_year_specific_value(tile, current_tiles, year)
-        score += year_bonus
-        
-        # Hand structure bonus
-        structure_bonus = self._calculate_structure_value(tile, current_tiles, hand_analysis)
-        score += structure_bonus
+        if tile_counts is None:
+            tile_counts = Counter(current_tiles)
+        count = tile_counts[tile]
         
-        return score
+        frequency_bonus = 0
+        if count == 1:
+            frequency_bonus = 3  # Would form a pair
+        elif count == 2:
+            frequency_bonus = 6  # Would form a triplet
+        elif count == 3:
+            frequency_bonus = 10  # Would form a quad
+        
+        # Base value (the same table as discards), frequency, sequence help,
+        # year-specific bonus and hand structure bonus, summed in one expression
+        return (self._base_value[TILE_ID[tile]]
+                + frequency_bonus
+                + self._calculate_sequence_help(tile, tile_counts)
+                + self._calculate_year_specific_value(tile, current_tiles, year)
+                + self._calculate_structure_value(tile, tile_counts, hand_analysis))
     
-    def _calculate_sequence_help(self, tile: str, current_tiles: List[str]) -> float:
-        """Calculate how much a tile would help form sequences"""
-        if not tile.endswith(('B', 'C', 'D')):
+    def _calculate_sequence_help(self, tile: str, current_tiles: Collection[str]) -> float:
+        """Calculate how much a tile would help form sequences (current_tiles is best a set or Counter)"""
+        tile_id = TILE_ID[tile]
+        if not TILE_RANK[tile_id]:
             return 0
         
-        number = int(tile[0])
-        suit = tile[-1]
-        
-        # Check for existing adjacent tiles
-        adjacent_tiles = []
-        if number > 1:
-            adjacent_tiles.append(f"{number-1}{suit}")
-        if number < 9:
-            adjacent_tiles.append(f"{number+1}{suit}")
-        
-        # Count how many adjacent tiles exist
-        adjacent_count = sum(1 for t in adjacent_tiles if t in current_tiles)
+        # Count how many existing adjacent tiles of the same suit exist
+        adjacent_count = sum(1 for t in _ADJACENT_TILES[tile_id] if t in current_tiles)
         
         if adjacent_count == 2:
             return 5  # Would complete a sequence
@@ -390,16 +830,8 @@ class TileCalculator:
         
         if best_discard:
             # Explain why this tile should be discarded
-            if best_discard == 'F':
-                reasoning_parts.append(f"Discard {best_discard} - While flowers are valuable, this one doesn't fit your current strategy")
-            elif best_discard == '2024':
-                reasoning_parts.append(f"Discard {best_discard} - Year tiles are valuable but this one doesn't fit your hand structure")
-            elif best_discard in ['R', 'G', '0']:
-                reasoning_parts.append(f"Discard {best_discard} - Dragon tiles are valuable but this one doesn't fit your hand structure")
-            elif best_discard in ['E', 'S', 'W', 'N']:
-                reasoning_parts.append(f"Discard {best_discard} - Wind tiles are valuable but this one doesn't fit your current pattern")
-            else:
-                reasoning_parts.append(f"Discard {best_discard} - This tile has the lowest potential for improving your hand")
+            category = self._TILE_CATEGORY[TILE_ID[best_discard]]
+            reasoning_parts.append(_DISCARD_REASONS[category].format(tile=best_discard))
         
         # Explain draw recommendations
         if best_draws:
@@ -408,26 +840,24 @@ class TileCalculator:
         
         # Add hand strength context
         hand_value = hand_analysis.get('hand_value', 0)
-        if hand_value >= 50:
-            reasoning_parts.append("Your hand is excellent - focus on completing high-value patterns")
-        elif hand_value >= 35:
-            reasoning_parts.append("Your hand is strong - focus on completing your best patterns")
-        elif hand_value >= 25:
-            reasoning_parts.append("Your hand is developing - focus on building sequences and pairs")
-        else:
-            reasoning_parts.append("Your hand needs work - focus on building basic structure")
+        reasoning_parts.append(_HAND_VALUE_REASONS[bisect_right(_HAND_VALUE_THRESHOLDS, hand_value)])
         
         # Add year-specific advice
         reasoning_parts.append(f"Remember that {year} rules may favor certain patterns - check the official card for specific hands")
         
         return " ".join(reasoning_parts)
     
-    def _generate_strategic_advice(self, tiles: List[str], hand_analysis: Dict, year: int) -> str:
-        """Generate strategic advice based on hand analysis"""
+    def _generate_strategic_advice(self, tiles: List[str], hand_analysis: Dict, year: int,
+                                   counts: Optional[np.ndarray] = None) -> str:
+        """
+        Generate strategic advice based on hand analysis
+
+        counts is hand_counts(tiles), shared with scoring when the caller has it.
+        """
         advice_parts = []
         
         # Get hand structure
-        hand_structure = hand_analysis.get('hand_structure', {})
+        hand_structure = hand_analysis.get('hand_structure', _NO_STRUCTURE)
         num_suits = hand_structure.get('num_suits', 0)
         flower_count = hand_structure.get('flower_tiles', 0)
         dragon_count = hand_structure.get('dragon_tiles', 0)
@@ -459,18 +889,20 @@ class TileCalculator:
         
         # Pattern-specific advice for 2024
         if year == 2024:
-            numbered_tiles = [tile for tile in tiles if tile.endswith(('B', 'C', 'D'))]
-            numbers = [int(tile[0]) for tile in numbered_tiles]
+            if counts is None:
+                counts = hand_counts(tiles)
+            # Numbered tiles per rank across the suits; index 0 is rank 1
+            rank_counts = counts[:NUM_NUMBERED].reshape(len(SUIT_LETTERS), 9).sum(axis=0)
             
-            even_count = sum(1 for n in numbers if n % 2 == 0)
-            odd_count = sum(1 for n in numbers if n % 2 == 1)
+            even_count = int(rank_counts[1::2].sum())
+            odd_count = int(rank_counts[::2].sum())
             
             if even_count >= 6:
                 advice_parts.append("You have many even numbers - consider 2468 patterns")
             if odd_count >= 6:
                 advice_parts.append("You have many odd numbers - consider 13579 patterns")
             
-            if any(n in [3, 6, 9] for n in numbers):
+            if rank_counts[2::3].any():
                 advice_parts.append("You have 3, 6, or 9 tiles - consider 369 patterns")
         
         return " ".join(advice_parts) 
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+American Mahjong Tile Encoding
+Maps tile strings to small integer ids so hands can be handled as fixed-length
+count vectors instead of lists of strings.
+"""
+
+from typing import Iterable, Union
+import numpy as np
+
+# Suit letters in id order: Bams, Cracks, Dots
+SUIT_LETTERS = ('B', 'C', 'D')
+
+# Every tile kind in id order
+TILE_NAMES = tuple(
+    [f"{i}{suit}" for suit in SUIT_LETTERS for i in range(1, 10)]  # 0-26 numbered tiles
+    + ['E', 'S', 'W', 'N']                                         # 27-30 winds
+    + ['R', 'G', '0']                                              # 31-33 dragons
+    + ['F', '2024', 'J']                                           # 34 flower, 35 year, 36 joker
+    + [f"B{i}" for i in range(1, 7)]                               # 37-42 blanks
+)
+NUM_TILE_KINDS = len(TILE_NAMES)
+NUM_NUMBERED = len(SUIT_LETTERS) * 9  # Numbered tiles take the first ids
+
+TILE_ID = {name: tile_id for tile_id, name in enumerate(TILE_NAMES)}
+
+# Suit index (position in SUIT_LETTERS) and face number of each tile id;
+# tiles without a suit get NO_SUIT and number 0
+NO_SUIT = len(SUIT_LETTERS)
+TILE_SUIT = bytes(tile_id // 9 if tile_id < 27 else NO_SUIT for tile_id in range(NUM_TILE_KINDS))
+TILE_RANK = bytes(tile_id % 9 + 1 if tile_id < 27 else 0 for tile_id in range(NUM_TILE_KINDS))
+
+FLOWER_ID = TILE_ID['F']
+YEAR_ID = TILE_ID['2024']
+JOKER_ID = TILE_ID['J']
+
+# Dragon that matches each suit (Cracks-Red, Bams-Green, Dots-White)
+DRAGON_FOR_SUIT = {'B': 'G', 'C': 'R', 'D': '0'}
+DRAGON_ID_FOR_SUIT = bytes(TILE_ID[DRAGON_FOR_SUIT[suit]] for suit in SUIT_LETTERS)  # Indexed by suit index
+
+# Tile ids of every dragon (Red, Green, White)
+DRAGON_IDS = range(TILE_ID['R'], TILE_ID['0'] + 1)
+
+# Value id of a pattern dragon group that can be any dragon ('D')
+ANY_DRAGON_ID = NUM_TILE_KINDS
+
+# Tile bitsets give each tile id a LANE_BITS-wide lane of one int and set its
+# low bit; LANE_LOW_BITS has the low bit of every lane
+LANE_BITS = 4
+LANE_LOW_BITS = sum(1 << (LANE_BITS * tile_id) for tile_id in range(NUM_TILE_KINDS))
+
+
+def number_id(number: int, suit: str) -> int:
+    """Get the tile id of a numbered tile"""
+    return SUIT_LETTERS.index(suit) * 9 + number - 1
+
+
+def component_value_id(value: Union[int, str]) -> int:
+    """Get the small-int id of a pattern component value: numbers 1-9 map to 0-8, tiles to their tile id"""
+    if isinstance(value, int):
+        return value - 1
+    if value == 'D':
+        return ANY_DRAGON_ID
+    return TILE_ID[value]
+
+
+def tile_ids(tiles: Iterable[str]) -> bytes:
+    """Convert a list of tile strings into their tile ids, one byte per tile"""
+    return bytes(TILE_ID[tile] for tile in tiles)
+
+
+def hand_counts(tiles: Iterable[str]) -> np.ndarray:
+    """Convert a list of tile strings into an int8 count vector indexed by tile id"""
+    ids = [TILE_ID[tile] for tile in tiles]
+    return np.bincount(ids, minlength=NUM_TILE_KINDS).astype(np.int8)
+
@@ -3,39 +3,46 @@ Tests for American Mahjong Hand Evaluator
 Tests the comprehensive implementation of American Mahjong rules and patterns.
 """
 
+import random
+import sys
 import unittest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+import numpy as np
+from src.mahjong import hand_evaluator
 from src.mahjong.hand_evaluator import HandEvaluator
-from src.mahjong.tile_calculator import TileCalculator
+from src.mahjong.tile_calculator import (
+    CATEGORY_BLANK, CATEGORY_DRAGON, CATEGORY_NUMBERED, CATEGORY_WIND, TileCalculator, _SPECIAL_VECTOR,
+    _YEAR_2024_VECTOR, _recommend_arrays, _recommend_kernel, _score_arrays, _score_kernel, _year_values
+)
+from src.mahjong.tiles import TILE_ID, TILE_NAMES, hand_counts
+
+# One suit run with the winds and a flower, shared read-only by many tests
+FULL_HAND = ("1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F")
 
 class TestHandEvaluator(unittest.TestCase):
     """Test cases for HandEvaluator"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.evaluator = HandEvaluator()
-        self.calculator = TileCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the tests, which don't modify them"""
+        cls.evaluator = HandEvaluator()
+        cls.calculator = TileCalculator()
     
     def test_valid_tiles(self):
         """Test that all valid tiles are recognized"""
-        # Test numbered tiles
-        for suit in ['B', 'C', 'D']:
-            for number in range(1, 10):
-                tile = f"{number}{suit}"
-                self.assertIn(tile, self.evaluator.valid_tiles['bams' if suit == 'B' else 'cracks' if suit == 'C' else 'dots'])
-        
-        # Test winds
-        for wind in ['E', 'S', 'W', 'N']:
-            self.assertIn(wind, self.evaluator.valid_tiles['winds'])
-        
-        # Test dragons
-        for dragon in ['R', 'G', '0']:
-            self.assertIn(dragon, self.evaluator.valid_tiles['dragons'])
+        valid_tiles = self.evaluator.valid_tiles
         
-        # Test flowers
-        self.assertIn('F', self.evaluator.valid_tiles['flowers'])
-        
-        # Test year tiles
-        self.assertIn('2024', self.evaluator.valid_tiles['year_tiles'])
+        # Test numbered tiles
+        for suit, category in [('B', 'bams'), ('C', 'cracks'), ('D', 'dots')]:
+            self.assertLessEqual({f"{number}{suit}" for number in range(1, 10)}, set(valid_tiles[category]))
+        
+        # Test winds, dragons, flowers and year tiles
+        self.assertLessEqual({'E', 'S', 'W', 'N'}, set(valid_tiles['winds']))
+        self.assertLessEqual({'R', 'G', '0'}, set(valid_tiles['dragons']))
+        self.assertIn('F', valid_tiles['flowers'])
+        self.assertIn('2024', valid_tiles['year_tiles'])
     
     def test_dragon_associations(self):
         """Test dragon associations"""
@@ -98,7 +105,14 @@ class TestHandEvaluator(unittest.TestCase):
         # Test three suit requirement
         three_suit_tiles = ["1B", "2B", "3B", "1C", "2C", "3C", "1D", "2D", "3D", "4B", "5B", "6B", "7B", "8B"]
         self.assertTrue(self.evaluator._check_suit_requirements(three_suit_tiles, 'any_3_suits', {}))
-    
+
+    def test_dragon_count_requirements(self):
+        """Test dragon count requirements count every dragon tile and nothing else"""
+        tiles = ["1B", "2B", "R", "G", "0", "E"]
+        self.assertTrue(self.evaluator._check_suit_requirements(tiles, 'any_3_dragons', {}))
+        self.assertTrue(self.evaluator._check_suit_requirements(tiles[:4], 'any_2_dragons', {}))
+        self.assertFalse(self.evaluator._check_suit_requirements(["1B", "2B", "R", "E", "N", "F"], 'any_2_dragons', {}))
+
     def test_matching_dragons(self):
         """Test matching dragon requirements"""
         # Test matching dragons with Cracks
@@ -124,7 +138,15 @@ class TestHandEvaluator(unittest.TestCase):
         # Test 5 consecutive numbers
         consecutive_tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "1B", "2B", "3B", "4B", "5B"]
         self.assertTrue(self.evaluator._check_suit_requirements(consecutive_tiles, 'any_5_consec_opposite_dragons', {}))
-    
+
+        # Repeated numbers don't break a run
+        repeated_tiles = ["3C", "4C", "4D", "4B", "5C", "6C", "7C", "E", "E", "F"]
+        self.assertTrue(self.evaluator._check_suit_requirements(repeated_tiles, 'any_5_consec_opposite_dragons', {}))
+
+        # Four in a row is not enough
+        short_tiles = ["1B", "2B", "3B", "4B", "6B", "7B", "8B", "9B"]
+        self.assertFalse(self.evaluator._check_suit_requirements(short_tiles, 'any_5_consec_opposite_dragons', {}))
+
     def test_specific_numbers(self):
         """Test specific number requirements"""
         # Test specific numbers [1, 2, 3]
@@ -156,7 +178,7 @@ class TestHandEvaluator(unittest.TestCase):
     
     def test_hand_structure_analysis(self):
         """Test hand structure analysis"""
-        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F"]
+        tiles = FULL_HAND
         structure = self.evaluator._analyze_hand_structure(tiles)
         
         self.assertEqual(structure['numbered_tiles'], 9)
@@ -166,7 +188,23 @@ class TestHandEvaluator(unittest.TestCase):
         self.assertEqual(structure['year_tiles'], 0)
         self.assertEqual(structure['num_suits'], 1)
         self.assertEqual(structure['suits_used'], ['B'])
-    
+
+    def test_hand_structure_groups(self):
+        """Test hand structure counts, suit order and groups in first-seen order"""
+        tiles = ["7D", "R", "2B", "7D", "J", "2024", "0", "R", "2B", "2B", "S", "F", "J"]
+        structure = self.evaluator._analyze_hand_structure(tiles)
+
+        self.assertEqual(structure['numbered_tiles'], 5)
+        self.assertEqual(structure['wind_tiles'], 1)
+        self.assertEqual(structure['dragon_tiles'], 3)
+        self.assertEqual(structure['joker_tiles'], 2)
+        self.assertEqual(structure['year_tiles'], 1)
+        self.assertEqual(structure['suits_used'], ['B', 'D'])
+        self.assertEqual(structure['num_suits'], 2)
+        self.assertEqual(structure['pairs'], ["7D", "R", "J"])
+        self.assertEqual(structure['triplets'], ["2B"])
+        self.assertEqual(structure['quads'], [])
+
     def test_find_potential_sequences(self):
         """Test sequence finding"""
         tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "1C", "2C", "3C", "4C", "5C"]
@@ -174,11 +212,18 @@ class TestHandEvaluator(unittest.TestCase):
         
         # Should find sequences like 1B-2B-3B, 2B-3B-4B, etc.
         self.assertGreater(len(sequences), 0)
+
+    def test_find_potential_sequences_with_duplicates(self):
+        """Test repeated tiles don't hide a run, and each run is reported once per suit"""
+        tiles = ["3D", "1B", "2B", "2B", "3B", "3B", "4D", "5D", "7C", "9C"]
+        sequences = self.evaluator._find_potential_sequences(tiles)
+
+        self.assertEqual(sequences, [["1B", "2B", "3B"], ["3D", "4D", "5D"]])
     
     def test_evaluate_hand_basic(self):
         """Test basic hand evaluation"""
         # A simple hand with some potential
-        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F"]
+        tiles = FULL_HAND
         
         analysis = self.evaluator.evaluate_hand(tiles, 2024)
         
@@ -204,17 +249,60 @@ class TestHandEvaluator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.evaluator.evaluate_hand(["1B"] * 13 + ["INVALID"], 2024)
 
+    def test_evaluate_hand_cached(self):
+        """Test repeated evaluations reuse the result without sharing it"""
+        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "F"]
+        first = self.evaluator.evaluate_hand(tiles, 2024)
+        first['hand_structure']['suits_used'].append('X')
+        first['tiles_to_win'].clear()
+
+        second = HandEvaluator().evaluate_hand(list(tiles), 2024)
+        self.assertEqual(second['hand_structure']['suits_used'], ['B'])
+        self.assertGreater(len(second['tiles_to_win']), 0)
+        self.assertIn((tuple(tiles), 2024), HandEvaluator._evaluation_cache)
+
+    def test_evaluation_cache_threads(self):
+        """Test threads sharing a small evaluation cache all get correct results while it evicts"""
+        hands = [list(FULL_HAND[:13]), list(FULL_HAND[1:]), list(FULL_HAND[:13])[::-1], list(FULL_HAND[1:])[::-1]]
+        expected = [self.evaluator.evaluate_hand(hand, 2024) for hand in hands]
+
+        def evaluate_all(_):
+            return [HandEvaluator().evaluate_hand(hand, 2024) for hand in hands * 25]
+
+        # Switch threads as often as possible so they interleave inside the cache updates
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with mock.patch.object(hand_evaluator, 'EVALUATION_CACHE_SIZE', len(hands) - 1):
+                with ThreadPoolExecutor(max_workers=8) as pool:
+                    for results in pool.map(evaluate_all, range(8)):
+                        self.assertEqual(results, expected * 25)
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+    def test_parsed_patterns_cached(self):
+        """Test pattern matching parses each pattern once and reuses the components"""
+        pattern_info = {'pattern': "FF 222 44 666 8888", 'suit_requirement': 'any'}
+        tiles = ["F", "F", "2B", "2B", "2B", "4B", "4B", "6B", "6B", "6B", "8B", "8B", "8B", "8B"]
+        self.assertTrue(self.evaluator._check_pattern_match(tiles, pattern_info, 2024))
+
+        components = HandEvaluator._parsed_patterns[("FF 222 44 666 8888", 2024)]
+        self.assertEqual(list(components), self.evaluator._parse_pattern("FF 222 44 666 8888", 2024))
+        self.evaluator._check_pattern_match(tiles, pattern_info, 2024)
+        self.assertIs(HandEvaluator._parsed_patterns[("FF 222 44 666 8888", 2024)], components)
+
 class TestTileCalculator(unittest.TestCase):
     """Test cases for TileCalculator"""
     
-    def setUp(self):
-        """Set up test fixtures"""
-        self.calculator = TileCalculator()
-        self.evaluator = HandEvaluator()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by the tests, which don't modify them"""
+        cls.calculator = TileCalculator()
+        cls.evaluator = HandEvaluator()
     
     def test_calculate_discard_score(self):
         """Test discard score calculation"""
-        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F"]
+        tiles = FULL_HAND
         hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
         
         # Test scoring for different tile types
@@ -229,7 +317,7 @@ class TestTileCalculator(unittest.TestCase):
     
     def test_calculate_draw_score(self):
         """Test draw score calculation"""
-        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F"]
+        tiles = FULL_HAND
         hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
         
         # Test scoring for different tile types
@@ -243,7 +331,7 @@ class TestTileCalculator(unittest.TestCase):
     
     def test_find_best_discard(self):
         """Test finding best discard"""
-        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F"]
+        tiles = FULL_HAND
         hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
         
         best_discard = self.calculator._find_best_discard(tiles, hand_analysis, 2024)
@@ -253,7 +341,7 @@ class TestTileCalculator(unittest.TestCase):
     
     def test_find_best_draws(self):
         """Test finding best draws"""
-        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F"]
+        tiles = FULL_HAND
         hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
         
         best_draws = self.calculator._find_best_draws(tiles, hand_analysis, 2024)
@@ -264,7 +352,7 @@ class TestTileCalculator(unittest.TestCase):
     
     def test_get_recommendations(self):
         """Test getting full recommendations"""
-        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F"]
+        tiles = FULL_HAND
         hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
         
         recommendations = self.calculator.get_recommendations(tiles, hand_analysis, 2024)
@@ -274,9 +362,163 @@ class TestTileCalculator(unittest.TestCase):
         self.assertIn('reasoning', recommendations)
         self.assertIn('strategic_advice', recommendations)
     
+    def test_recommendations_cached(self):
+        """Test repeated hands reuse the cached recommendations without sharing mutable results"""
+        tiles = ["1B", "2B", "2B", "4C", "5C", "R", "R", "R", "E", "S", "F", "2024", "J"]
+        hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
+        key = self.calculator._recommendation_key(tiles, hand_analysis, 2024)
+
+        first = self.calculator.get_recommendations(tiles, hand_analysis, 2024)
+        self.assertIn(key, TileCalculator._recommendation_cache)
+        first["best_draws"].clear()
+        second = TileCalculator().get_recommendations(tiles, hand_analysis, 2024)
+        self.assertTrue(second["best_draws"])
+        self.assertEqual(second["best_discard"], first["best_discard"])
+        self.assertNotEqual(self.calculator._recommendation_key(tiles, {**hand_analysis, 'hand_value': -1}, 2024), key)
+
+    def test_recommendations_invalid_hand(self):
+        """Test hands or winning tiles with unknown tiles get the empty recommendations"""
+        for tiles, tiles_to_win in ((["1B"] * 12 + ["INVALID"], []), (["1B"] * 13, ["3B", "INVALID"])):
+            recommendations = self.calculator.get_recommendations(tiles, {'tiles_to_win': tiles_to_win}, 2024)
+            self.assertIsNone(recommendations['best_discard'])
+            self.assertEqual(recommendations['best_draws'], [])
+            self.assertEqual(recommendations['reasoning'], "Unable to generate recommendations")
+
+    def test_recommendations_any_hand_length(self):
+        """Test empty and long hands are scored rather than rejected"""
+        empty = self.calculator.get_recommendations([], {'tiles_to_win': ["3B"]}, 2024)
+        self.assertIsNone(empty['best_discard'])
+        self.assertNotEqual(empty['reasoning'], "Unable to generate recommendations")
+
+        long_hand = self.calculator.get_recommendations(["1B"] * 5 + ["2C"] * 5 + ["E"] * 5 + ["F"] * 3,
+                                                        {'tiles_to_win': ["3B"]}, 2024)
+        self.assertIn(long_hand['best_discard'], ("1B", "2C", "E", "F"))
+        self.assertTrue(long_hand['best_draws'])
+
+    def test_shared_tile_counts(self):
+        """Test scores with precomputed tile counts match scores that count the hand themselves"""
+        tiles = ["1B", "2B", "2B", "4C", "5C", "R", "R", "R", "E", "S", "F", "2024", "J"]
+        hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
+        tile_counts = Counter(tiles)
+
+        for tile in set(tiles) | {"3B", "G", "N"}:
+            self.assertEqual(self.calculator._calculate_discard_score(tile, tiles, hand_analysis, 2024, tile_counts),
+                             self.calculator._calculate_discard_score(tile, tiles, hand_analysis, 2024))
+            self.assertEqual(self.calculator._calculate_draw_score(tile, tiles, hand_analysis, 2024, tile_counts),
+                             self.calculator._calculate_draw_score(tile, tiles, hand_analysis, 2024))
+
+    def test_score_tiles_matches_per_tile_scores(self):
+        """Test the vectorized scores equal the per-tile discard and draw scores for every tile kind"""
+        tiles = ["1B", "2B", "2B", "4C", "5C", "R", "R", "R", "E", "S", "F", "2024", "J"]
+        hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
+
+        for year in (2024, 2023):
+            discard_scores, draw_scores = self.calculator._score_tiles(tiles, hand_analysis, year)
+            for tile_id, tile in enumerate(TILE_NAMES):
+                self.assertEqual(discard_scores[tile_id],
+                                 self.calculator._calculate_discard_score(tile, tiles, hand_analysis, year))
+                self.assertEqual(draw_scores[tile_id],
+                                 self.calculator._calculate_draw_score(tile, tiles, hand_analysis, year))
+
+    def test_score_kernel_matches_score_arrays(self):
+        """Test the compiled scoring kernel and the NumPy scoring give the same scores"""
+        counts = hand_counts(["1B", "2B", "2B", "4C", "5C", "9C", "7D", "R", "E", "F", "2024", "J", "B1"])
+        base_values = self.calculator._base_values
+        year_values = _year_values(2024)
+        suit_structure = np.array([1.0, 2.0, 0.0])
+
+        discard_scores = np.empty(len(counts))
+        draw_scores = np.empty(len(counts))
+        _score_kernel(counts, base_values, year_values, suit_structure, discard_scores, draw_scores)
+        expected_discard, expected_draw = _score_arrays(counts, base_values, year_values, suit_structure)
+        np.testing.assert_array_equal(discard_scores, expected_discard)
+        np.testing.assert_array_equal(draw_scores, expected_draw)
+
+    def test_recommendations_batch(self):
+        """Test batch recommendations match single-hand ones when tiles_to_win is empty"""
+        rng = random.Random(1)
+        hands = [sorted(rng.choices(TILE_NAMES, k=13), key=TILE_ID.get) for _ in range(20)]
+        years = [2024, 2023] * 10
+        best_discards, best_draws = self.calculator.get_recommendations_batch(
+            np.stack([hand_counts(tiles) for tiles in hands]), years)
+
+        for tiles, year, discard_id, draw_ids in zip(hands, years, best_discards, best_draws):
+            hand_analysis = {**self.evaluator.evaluate_hand(tiles, year), 'tiles_to_win': []}
+            self.assertEqual(TILE_NAMES[discard_id], self.calculator._find_best_discard(tiles, hand_analysis, year))
+            self.assertEqual([TILE_NAMES[tile_id] for tile_id in draw_ids if tile_id >= 0],
+                             self.calculator._find_best_draws(tiles, hand_analysis, year))
+
+        best_discards, best_draws = self.calculator.get_recommendations_batch(np.zeros((1, len(TILE_NAMES))))
+        self.assertEqual(best_discards.tolist(), [-1])
+        self.assertEqual(best_draws.tolist(), [[-1] * 8])
+        self.assertEqual(self.calculator._find_best_draws([], {}, 2024), [])
+        with self.assertRaises(ValueError):
+            self.calculator.get_recommendations_batch(np.zeros(len(TILE_NAMES)))
+
+    def test_recommend_kernel_matches_recommend_arrays(self):
+        """Test the parallel batch kernel and the NumPy batch path pick the same tiles"""
+        rng = random.Random(2)
+        hands = np.stack([hand_counts(rng.choices(TILE_NAMES, k=13)) for _ in range(50)]
+                         + [np.zeros(len(TILE_NAMES), dtype=np.int8)])
+        is_2024 = np.array([rng.random() < 0.5 for _ in range(len(hands))])
+        year_values = np.where(is_2024[:, None], _year_values(2024), _year_values(2023))
+        dragon_ids = np.array([TILE_ID[dragon] for dragon in ('G', 'R', '0')], dtype=np.intp)
+        base_values = self.calculator._base_values
+
+        best_discards = np.empty(len(hands), dtype=np.intp)
+        best_draws = np.full((len(hands), 8), -1, dtype=np.intp)
+        _recommend_kernel(hands, base_values, year_values, is_2024, dragon_ids, _SPECIAL_VECTOR, _YEAR_2024_VECTOR,
+                          best_discards, best_draws)
+        expected_discards, expected_draws = _recommend_arrays(hands, base_values, year_values, is_2024, dragon_ids, 8)
+        np.testing.assert_array_equal(best_discards, expected_discards)
+        np.testing.assert_array_equal(best_draws, expected_draws)
+
+    def test_find_helpful_tiles(self):
+        """Test helpful tiles are singles, same-suit neighbours and missing special tiles, in tile-id order"""
+        helpful = self.calculator._find_helpful_tiles(["1B", "1B", "9C", "R"], {}, 2023)
+        self.assertEqual(helpful, ["2B", "8C", "9C", "R", "G", "0", "F", "2024"])
+        self.assertEqual(len(self.calculator._find_helpful_tiles(["1B", "1B", "9C", "R"], {}, 2024)), 31)
+
+    def test_find_helpful_tiles_many_copies(self):
+        """Test sixteen copies of a tile do not hide the next tile id"""
+        helpful = self.calculator._find_helpful_tiles(["1B"] * 16 + ["2B"], {}, 2023)
+        self.assertEqual(helpful, self.calculator._find_helpful_tiles(["1B", "1B", "2B"], {}, 2023))
+        self.assertIn("2B", helpful)
+
+    def test_tile_categories(self):
+        """Test every tile id is classified once into its scoring category"""
+        categories = TileCalculator._TILE_CATEGORY
+        self.assertEqual(categories[TILE_ID["W"]], CATEGORY_WIND)
+        self.assertEqual(categories[TILE_ID["0"]], CATEGORY_DRAGON)
+        self.assertEqual(categories[TILE_ID["9D"]], CATEGORY_NUMBERED)
+        self.assertEqual(categories[TILE_ID["J"]], CATEGORY_BLANK)
+        self.assertEqual(self.calculator._base_value[TILE_ID["2024"]], self.calculator.tile_values['year_tiles'])
+
+    def test_sequence_neighbours_stay_in_suit(self):
+        """Test tile-id neighbours do not cross from one suit into the next"""
+        self.assertEqual(self.calculator._calculate_sequence_potential("9B", Counter(["1C", "2C"])), 0)
+        self.assertEqual(self.calculator._calculate_sequence_potential("9B", Counter(["8B", "1C"])), 3)
+        self.assertEqual(self.calculator._calculate_sequence_help("1C", Counter(["9B", "2C"])), 2)
+        self.assertEqual(self.calculator._calculate_sequence_help("E", Counter(["N", "S"])), 0)
+
+    def test_generate_reasoning(self):
+        """Test the discard reason follows the discarded tile's category"""
+        reasoning = self.calculator._generate_reasoning([], "W", [], {}, 2024)
+        self.assertTrue(reasoning.startswith("Discard W - Wind tiles are valuable"))
+        reasoning = self.calculator._generate_reasoning([], "0", ["1B"], {}, 2024)
+        self.assertTrue(reasoning.startswith("Discard 0 - Dragon tiles are valuable"))
+        self.assertIn("Best draws: 1B", reasoning)
+
+    def test_generate_reasoning_hand_value_tiers(self):
+        """Test each hand_value tier starts at its threshold"""
+        for hand_value, expected in [(0, "needs work"), (24.9, "needs work"), (25, "is developing"),
+                                     (35, "is strong"), (49, "is strong"), (50, "is excellent")]:
+            reasoning = self.calculator._generate_reasoning([], None, [], {'hand_value': hand_value}, 2024)
+            self.assertIn(f"Your hand {expected}", reasoning)
+
     def test_generate_strategic_advice(self):
         """Test strategic advice generation"""
-        tiles = ["1B", "2B", "3B", "4B", "5B", "6B", "7B", "8B", "9B", "E", "S", "W", "N", "F"]
+        tiles = FULL_HAND
         hand_analysis = self.evaluator.evaluate_hand(tiles, 2024)
         
         advice = self.calculator._generate_strategic_advice(tiles, hand_analysis, 2024)
@@ -285,5 +527,16 @@ class TestTileCalculator(unittest.TestCase):
         self.assertIsInstance(advice, str)
         self.assertGreater(len(advice), 0)
 
+    def test_generate_strategic_advice_number_patterns(self):
+        """Test the 2024 number advice reads ranks across suits, with or without shared counts"""
+        tiles = ["2B", "4C", "6D", "8B", "2C", "4D", "1B", "E", "S", "W", "N", "F", "R"]
+        for counts in (None, hand_counts(tiles)):
+            advice = self.calculator._generate_strategic_advice(tiles, {}, 2024, counts)
+            self.assertIn("2468 patterns", advice)
+            self.assertNotIn("13579 patterns", advice)
+            self.assertIn("369 patterns", advice)
+        advice = self.calculator._generate_strategic_advice(["1B", "5C", "E"], {}, 2024)
+        self.assertNotIn("369 patterns", advice)
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,290 @@
+"""
+Tests for American Mahjong Pattern Matcher
+Tests count-vector encoding and pattern matching.
+"""
+
+import pickle
+import unittest
+import numpy as np
+from src.mahjong.hand_evaluator import HandEvaluator
+from src.mahjong.tiles import (
+    JOKER_ID, NUM_TILE_KINDS, NO_SUIT, TILE_ID, TILE_NAMES, TILE_RANK, TILE_SUIT, hand_counts, tile_ids
+)
+from src.mahjong.pattern_matcher import (
+    COMPONENT_TYPES, SUIT_PERMUTATIONS, SUIT_REQUIREMENT_NAMES, PatternTable, build_requirements, split_template, number_offsets,
+    hand_hash, update_hand_hash, validate_suit_requirements_batch
+)
+
+class TestPatternMatcher(unittest.TestCase):
+    """Test cases for count-vector pattern matching"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.evaluator = HandEvaluator()
+        self.same_suit_hand = ["2B"] * 3 + ["4B"] * 3 + ["6B"] * 4 + ["8B"] * 4
+
+    def test_hand_counts(self):
+        """Test tile strings are counted by tile id"""
+        counts = hand_counts(["1B", "1B", "E", "2024", "J"])
+        self.assertEqual(counts.shape, (NUM_TILE_KINDS,))
+        self.assertEqual(counts[TILE_ID['1B']], 2)
+        self.assertEqual(counts[TILE_ID['E']], 1)
+        self.assertEqual(counts[TILE_ID['2024']], 1)
+        self.assertEqual(counts[TILE_ID['J']], 1)
+        self.assertEqual(counts.sum(), 5)
+
+    def test_tile_tables(self):
+        """Test suit and number are read from the tile id"""
+        ids = tile_ids(["7C", "1B", "9D", "R", "2024"])
+        self.assertEqual(list(ids), [TILE_ID[tile] for tile in ["7C", "1B", "9D", "R", "2024"]])
+        self.assertEqual([TILE_SUIT[tile_id] for tile_id in ids], [1, 0, 2, NO_SUIT, NO_SUIT])
+        self.assertEqual([TILE_RANK[tile_id] for tile_id in ids], [7, 1, 9, 0, 0])
+
+    def test_build_requirements(self):
+        """Test a pattern expands to one row per suit permutation"""
+        pattern_info = self.evaluator.rules.get_pattern_by_id('2468_222_444_6666_8888_same')
+        req_counts = build_requirements(pattern_info)
+
+        self.assertEqual(req_counts.shape, (len(SUIT_PERMUTATIONS), NUM_TILE_KINDS))
+        self.assertEqual(req_counts.dtype, np.int8)
+        for row in req_counts:
+            self.assertEqual(row.sum(), 14)
+        self.assertEqual(req_counts[:, TILE_ID['6B']].max(), 4)
+        self.assertEqual(req_counts[:, TILE_ID['6D']].max(), 4)
+
+    def test_count_templates(self):
+        """Test patterns expose their cached requirement rows"""
+        pattern_info = self.evaluator.rules.get_pattern_by_id('2468_222_444_6666_8888_same')
+        templates = pattern_info.count_templates
+
+        np.testing.assert_array_equal(templates, build_requirements(pattern_info))
+        self.assertIs(templates, pattern_info.count_templates)
+        self.assertFalse(templates.flags.writeable)
+
+    def test_split_template(self):
+        """Test suit variants of a pattern share one template"""
+        same = self.evaluator.rules.get_pattern_by_id('2468_222_444_6666_8888_same')
+        two = self.evaluator.rules.get_pattern_by_id('2468_222_444_6666_8888_two')
+        same_template, same_suits = split_template(same)
+        two_template, two_suits = split_template(two)
+
+        self.assertIs(same_template, two_template)
+        self.assertEqual(same_suits, (0, 0, 0, 0))
+        self.assertEqual(two_suits, (0, 0, 1, 1))
+
+        other = self.evaluator.rules.get_pattern_by_id('consec_111_222_3333_4444_two')
+        self.assertIs(split_template(other)[1], two_suits)
+
+    def test_pattern_table(self):
+        """Test the table only keeps distinct projections"""
+        patterns = self.evaluator.rules.get_all_patterns(2024)
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+
+        self.assertEqual(table.pattern_ids, list(patterns))
+        self.assertLessEqual(len(table.requirements), len(patterns))
+        self.assertEqual(table.records['req_idx'].max(), len(table.requirements) - 1)
+        self.assertEqual(table.req.shape, (sum(len(rows) for rows in table.requirements), NUM_TILE_KINDS))
+        self.assertTrue(table.req.flags['C_CONTIGUOUS'])
+
+    def test_match_patterns(self):
+        """Test matching a complete hand in any suit"""
+        self.assertIn('2468_222_444_6666_8888_same', self.evaluator.match_patterns(self.same_suit_hand, 2024))
+
+        dots_hand = [tile.replace('B', 'D') for tile in self.same_suit_hand]
+        self.assertIn('2468_222_444_6666_8888_same', self.evaluator.match_patterns(dots_hand, 2024))
+
+    def test_consecutive_expansion(self):
+        """Test consecutive-number patterns match every run"""
+        pattern_info = self.evaluator.rules.get_pattern_by_id('consec_111_222_3333_4444_same')
+        self.assertEqual(number_offsets(pattern_info), tuple(range(6)))
+        self.assertEqual(number_offsets(self.evaluator.rules.get_pattern_by_id('2468_222_444_6666_8888_same')), (0,))
+
+        hand = ["4D"] * 3 + ["5D"] * 3 + ["6D"] * 4 + ["7D"] * 4
+        self.assertIn('consec_111_222_3333_4444_same', self.evaluator.match_patterns(hand, 2024))
+
+    def test_pattern_records(self):
+        """Test pattern metadata is packed per category"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        quints = table.category_slices['quint_patterns']
+        quint_ids = list(self.evaluator.rules.get_patterns_by_category('quint'))
+
+        self.assertEqual(table.pattern_ids[quints], quint_ids)
+        self.assertEqual(table.records.dtype.itemsize, 13)
+        self.assertEqual(list(table.records['points'][quints]),
+                         [pattern.points for pattern in self.evaluator.rules.get_patterns_by_category('quint').values()])
+
+        hand = ["2B"] * 3 + ["4B"] * 3 + ["6B"] * 4 + ["8B"] * 4
+        self.assertEqual(table.match(hand_counts(hand), 'quint_patterns'), [])
+        self.assertIn('2468_222_444_6666_8888_same', table.match(hand_counts(hand), '2468_patterns'))
+
+    def test_pattern_flags(self):
+        """Test packed pattern flags filter like the rules indexes"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        rules = self.evaluator.rules
+        self.assertEqual(table.flags.dtype, np.uint16)
+
+        def ids(indexes):
+            return [table.pattern_ids[i] for i in indexes]
+
+        self.assertEqual(ids(table.patterns_with_flags(category='C')), list(rules.get_patterns_for_hand_category('C')))
+        self.assertEqual(ids(table.patterns_with_flags(joker_allowed=False)), list(rules.get_patterns_by_joker_allowed(False)))
+        self.assertEqual(ids(table.patterns_with_flags(suit_requirement='any_1_suit')),
+                         list(rules.get_patterns_for_suit_requirement('any_1_suit')))
+        self.assertEqual(len(table.patterns_with_flags()), len(table.pattern_ids))
+        self.assertEqual(len(table.patterns_with_flags(suit_requirement='missing')), 0)
+
+    def test_component_table(self):
+        """Test pattern components are packed into one table with per-pattern offsets"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        self.assertEqual(len(table.component_offsets), len(table.pattern_ids) + 1)
+
+        pattern_idx = table.pattern_ids.index('2468_222_444_6666_8888_two')
+        components = table.get_components(pattern_idx)
+        self.assertTrue(np.shares_memory(components, table.components))
+        self.assertEqual(components['val'].tolist(), [1, 3, 5, 7])
+        self.assertEqual(components['cnt'].tolist(), [3, 3, 4, 4])
+        self.assertEqual(components['suit'].tolist(), [0, 0, 1, 1])
+        self.assertTrue((components['ptype'] == COMPONENT_TYPES.index('number')).all())
+
+    def test_count_signatures(self):
+        """Test the suit-free signature rejects hands that are too far from every pattern"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        self.assertEqual(len(table.signatures), len(table.requirements))
+
+        scattered = hand_counts(["1B", "3B", "5B", "7B", "9B", "2C", "4C", "6C", "8C", "1D", "3D", "5D", "E", "S"])
+        self.assertEqual(table.match(scattered), [])
+
+        self.assertEqual(table.min_total_tiles, table.req.sum(axis=1).min())
+        self.assertEqual(table.match(hand_counts(self.same_suit_hand[:table.min_total_tiles - 1])), [])
+
+    def test_match_short_hands(self):
+        """Test the tile-count early exit never rejects a short hand that covers a pattern"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        hand = hand_counts(['2024', '2024', 'N', 'N', 'E', 'E', 'E', 'W', 'W', 'W', 'S', 'S'])
+        self.assertIn('2024_NN_EEE_2024_WWW_SS', table.match(hand))
+
+        # Requirement rows with a few tiles swapped for jokers or dropped
+        rng = np.random.default_rng(4)
+        hands = table.req[rng.integers(len(table.req), size=500)].copy()
+        for row in hands:
+            for _ in range(rng.integers(0, 3)):
+                row[rng.choice(np.flatnonzero(row))] -= 1
+                row[JOKER_ID] += rng.integers(0, 2)
+        hands[0] = hand
+        matched = table.match_many(hands)
+        self.assertGreater(matched.any(axis=1).sum(), 100)
+        for hand, row in zip(hands, matched):
+            self.assertEqual(table.match(hand), [table.pattern_ids[i] for i in np.flatnonzero(row)])
+
+    def test_candidate_patterns(self):
+        """Test the tile-kind screen keeps every pattern the hand matches"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        rng = np.random.default_rng(3)
+        hands = rng.multinomial(14, np.full(NUM_TILE_KINDS, 1 / NUM_TILE_KINDS), size=100).astype(np.int8)
+        hands[0] = hand_counts(self.same_suit_hand[:-2] + ["J", "J"])
+
+        for hand in hands:
+            candidates = [table.pattern_ids[i] for i in table.candidate_patterns(hand)]
+            self.assertTrue(set(table.match(hand)) <= set(candidates))
+        self.assertIn('2468_222_444_6666_8888_same', [table.pattern_ids[i] for i in table.candidate_patterns(hands[0])])
+        self.assertLess(len(table.candidate_patterns(hand_counts(["E"] * 14))), len(table.pattern_ids))
+
+    def test_hand_hash(self):
+        """Test the Zobrist hash updates incrementally and keys the match cache"""
+        hand = hand_counts(self.same_suit_hand)
+        drawn = hand_counts(self.same_suit_hand + ["E"])
+        self.assertEqual(update_hand_hash(hand_hash(hand), TILE_ID['E'], 0, 1), hand_hash(drawn))
+        self.assertEqual(hand_hash(np.zeros(NUM_TILE_KINDS, dtype=np.int8)), 0)
+
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        matched = table.match(hand)
+        self.assertIn((hand_hash(hand), None), table._match_cache)
+        matched.clear()
+        self.assertIn('2468_222_444_6666_8888_same', table.match(hand))
+
+        # A colliding entry for other counts is recomputed, not returned
+        table._match_cache[hand_hash(drawn), None] = (hand.tobytes(), ())
+        self.assertIn('2468_222_444_6666_8888_same', table.match(drawn))
+
+    def test_match_patterns_with_jokers(self):
+        """Test jokers fill missing tiles"""
+        hand = self.same_suit_hand[:-2] + ["J", "J"]
+        self.assertIn('2468_222_444_6666_8888_same', self.evaluator.match_patterns(hand, 2024))
+
+        short_hand = self.same_suit_hand[:-2] + ["J", "E"]
+        self.assertNotIn('2468_222_444_6666_8888_same', self.evaluator.match_patterns(short_hand, 2024))
+
+    def test_score_hands(self):
+        """Test batch scoring agrees with matching each hand"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        points = dict(zip(table.pattern_ids, table.records['points'].tolist()))
+        rng = np.random.default_rng(1)
+        hands = rng.multinomial(14, np.full(NUM_TILE_KINDS, 1 / NUM_TILE_KINDS), size=100).astype(np.int8)
+        hands[0] = hand_counts(self.same_suit_hand[:-1] + ["J"])
+
+        scores = table.score_hands(hands)
+        self.assertEqual(scores.dtype, np.int32)
+        self.assertGreater(scores[0], 0)
+        for hand, score in zip(hands, scores):
+            self.assertEqual(score, max((points[pid] for pid in table.match(hand)), default=0))
+
+        with self.assertRaises(ValueError):
+            table.score_hands(np.zeros(NUM_TILE_KINDS, dtype=np.int8))
+
+    def test_match_many(self):
+        """Test batch matching agrees with matching each hand"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        rng = np.random.default_rng(3)
+        hands = rng.multinomial(14, np.full(NUM_TILE_KINDS, 1 / NUM_TILE_KINDS), size=100).astype(np.int8)
+        hands[0] = hand_counts(self.same_suit_hand)
+        hands[1] = hand_counts(self.same_suit_hand[:-2] + ["J", "J"])
+
+        matched = table.match_many(hands)
+        self.assertEqual(matched.shape, (len(hands), len(table.pattern_ids)))
+        for hand, row in zip(hands, matched):
+            self.assertEqual([table.pattern_ids[i] for i in np.flatnonzero(row)], table.match(hand))
+        self.assertEqual(
+            self.evaluator.match_patterns_batch([self.same_suit_hand, self.same_suit_hand[:-2] + ["J", "J"]], 2024),
+            [self.evaluator.match_patterns(self.same_suit_hand, 2024),
+             self.evaluator.match_patterns(self.same_suit_hand[:-2] + ["J", "J"], 2024)]
+        )
+        self.assertEqual(self.evaluator.match_patterns_batch([], 2024), [])
+
+        with self.assertRaises(ValueError):
+            table.match_many(np.zeros(NUM_TILE_KINDS, dtype=np.int8))
+
+    def test_pickle_out_of_band(self):
+        """Test a table pickles its tables as out-of-band buffers and shares them on load"""
+        table = PatternTable(self.evaluator.rules.year_patterns[2024])
+        buffers = []
+        data = pickle.dumps(table, protocol=5, buffer_callback=buffers.append)
+        raw = [buffer.raw() for buffer in buffers]
+        loaded = pickle.loads(data, buffers=raw)
+
+        self.assertTrue(any(np.shares_memory(loaded.req, np.asarray(buffer)) for buffer in raw))
+        self.assertTrue(all(np.shares_memory(rows, loaded.req) for rows in loaded.requirements))
+        self.assertEqual(loaded.match(hand_counts(self.same_suit_hand)), table.match(hand_counts(self.same_suit_hand)))
+        self.assertIs(pickle.loads(pickle.dumps(self.evaluator.rules)), self.evaluator.rules)
+
+    def test_validate_suit_requirements_batch(self):
+        """Test batch suit validation agrees with validating each hand"""
+        rng = np.random.default_rng(2)
+        hands = rng.integers(0, 37, size=(50, 14))
+        hands[0] = [TILE_ID[tile] for tile in ["1C"] * 11 + ["R"] * 3]
+        requirement_ids = np.arange(len(SUIT_REQUIREMENT_NAMES))
+
+        valid = validate_suit_requirements_batch(hands, requirement_ids)
+        self.assertEqual(valid.shape, (len(hands), len(SUIT_REQUIREMENT_NAMES)))
+        self.assertTrue(valid[0, SUIT_REQUIREMENT_NAMES.index('any_1_suit_matching_dragons')])
+        for hand, row in zip(hands, valid):
+            tiles = [TILE_NAMES[tile_id] for tile_id in hand]
+            self.assertEqual(list(row), [self.evaluator.rules.validate_suit_requirement(tiles, name)
+                                         for name in SUIT_REQUIREMENT_NAMES])
+
+    def test_match_patterns_invalid(self):
+        """Test invalid tiles are rejected"""
+        with self.assertRaises(ValueError):
+            self.evaluator.match_patterns(["1B"] * 13 + ["INVALID"], 2024)
+
+if __name__ == '__main__':
+    unittest.main()
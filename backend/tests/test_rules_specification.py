@@ -0,0 +1,196 @@
+"""
+Tests for American Mahjong Rules Specification
+Tests pattern lookup and the lazily built pattern categories.
+"""
+
+import pickle
+import sys
+import unittest
+from src.mahjong import rules_specification
+from src.mahjong.tiles import TILE_ID, hand_counts
+from src.mahjong.rules_specification import (
+    PATTERN_DATA_FILE, SUIT_REQUIREMENT_MASKS, Component, MahjongRules, Pattern, RuleBit, build_pattern_data,
+    mahjong_rules, parse_rule_bits
+)
+
+class TestMahjongRules(unittest.TestCase):
+    """Test cases for MahjongRules"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.rules = mahjong_rules
+
+    def test_shared_instance(self):
+        """Test every MahjongRules() is the shared instance and keeps its caches"""
+        all_patterns = self.rules.get_all_patterns(2024)
+        self.assertIs(MahjongRules(), self.rules)
+        self.assertIs(MahjongRules().get_all_patterns(2024), all_patterns)
+        self.assertIs(self.rules.suit_requirements, rules_specification.SUIT_REQUIREMENTS)
+        self.assertIn(TILE_ID['1C'], self.rules.tile_definitions['numbered_tiles']['cracks'])
+        self.assertNotIn(TILE_ID['1B'], self.rules.tile_definitions['numbered_tiles']['cracks'])
+        with self.assertRaises(TypeError):
+            self.rules.dragon_associations['C'] = 'G'
+
+    def test_pattern_data_file(self):
+        """Test the pickled pattern data matches the pattern literals"""
+        with open(PATTERN_DATA_FILE, 'rb') as data_file:
+            self.assertEqual(pickle.load(data_file), build_pattern_data(),
+                             "Pattern data is stale; run python tools/build_patterns.py")
+
+    def test_categories(self):
+        """Test every category is listed and built once"""
+        categories = self.rules.year_patterns[2024]
+        self.assertEqual(len(categories), 10)
+        self.assertIn('quint_patterns', categories)
+        self.assertIs(categories['quint_patterns'], self.rules.get_patterns_by_category('quint'))
+        self.assertEqual(self.rules.get_patterns_by_category('missing'), {})
+        self.assertIn((2024, 'quint'), rules_specification._CATEGORY_PATTERNS)
+        self.assertNotIn((2024, 'missing'), rules_specification._CATEGORY_PATTERNS)
+
+    def test_module_category_attribute(self):
+        """Test categories are reachable as module attributes"""
+        self.assertIs(rules_specification.winds_dragons_patterns,
+                      self.rules.get_patterns_by_category('winds_dragons'))
+        with self.assertRaises(AttributeError):
+            rules_specification.missing_patterns
+        self.assertIs(rules_specification.mahjong_rules, MahjongRules())
+
+    def test_get_pattern_by_id(self):
+        """Test pattern lookup across categories"""
+        pattern = self.rules.get_pattern_by_id('2468_222_444_6666_8888_same')
+        self.assertEqual(pattern['pattern'], '222 444 6666 8888')
+        self.assertIsNone(self.rules.get_pattern_by_id('missing'))
+        self.assertEqual(len(self.rules.get_all_patterns(2024)), 60)
+
+    def test_get_all_patterns_cached(self):
+        """Test merged patterns are built once per known year"""
+        self.assertIs(self.rules.get_all_patterns(2024), self.rules.get_all_patterns(2024))
+        self.assertEqual(self.rules.get_all_patterns(1999), {})
+        self.assertNotIn(1999, rules_specification._ALL_PATTERNS)
+        self.assertIs(self.rules.get_all_patterns(1999), self.rules.get_patterns_by_category('missing'))
+        with self.assertRaises(TypeError):
+            self.rules.get_all_patterns(1999)['x'] = None
+
+    def test_module_functions(self):
+        """Test the module-level lookups match the shared instance"""
+        self.assertIs(rules_specification.get_all_patterns(2024), self.rules.get_all_patterns(2024))
+        self.assertIs(rules_specification.YEAR_PATTERNS, self.rules.year_patterns)
+        self.assertIs(rules_specification.get_pattern_by_id('2024_NN_EEE_2024_WWW_SS'),
+                      self.rules.get_pattern_by_id('2024_NN_EEE_2024_WWW_SS'))
+        with self.assertRaises(TypeError):
+            rules_specification.YEAR_PATTERNS[2025] = {}
+
+    def test_pattern_records(self):
+        """Test patterns are frozen records with dict-style access"""
+        pattern = self.rules.get_pattern_by_id('2024_NN_EEE_2024_WWW_SS')
+        self.assertIsInstance(pattern, Pattern)
+        self.assertIsInstance(pattern.components[0], Component)
+        self.assertEqual(pattern['points'], pattern.points)
+        self.assertEqual(pattern.get('special_rules', []), pattern.special_rules)
+        self.assertEqual(pattern.components[0].value_id, TILE_ID['N'])
+        self.assertEqual(self.rules.get_pattern_by_id('2468_222_444_6666_8888_same').components[0].value_id, 1)
+        self.assertEqual(pattern.components[0].get('suit'), None)
+        self.assertNotIn('suit', pattern.components[0])
+        with self.assertRaises(KeyError):
+            pattern.components[0]['suit']
+        with self.assertRaises(AttributeError):
+            pattern.points = 0
+
+    def test_pattern_indexes(self):
+        """Test patterns can be looked up by suit requirement, hand category and joker use"""
+        all_patterns = self.rules.get_all_patterns(2024)
+
+        one_suit = self.rules.get_patterns_for_suit_requirement('any_1_suit')
+        self.assertEqual(list(one_suit), [pid for pid, p in all_patterns.items() if p.suit_requirement == 'any_1_suit'])
+
+        concealed = self.rules.get_patterns_for_hand_category('C')
+        self.assertTrue(all(pattern.category == 'C' for pattern in concealed.values()))
+
+        no_jokers = self.rules.get_patterns_by_joker_allowed(False)
+        with_jokers = self.rules.get_patterns_by_joker_allowed(True)
+        self.assertEqual(len(no_jokers) + len(with_jokers), len(all_patterns))
+        self.assertEqual(self.rules.get_patterns_for_suit_requirement('missing'), {})
+        fourteen = self.rules.get_patterns_by_tile_count(14)
+        self.assertEqual(list(fourteen), [pid for pid, p in all_patterns.items() if p.total_tiles == 14])
+        self.assertEqual(self.rules.get_patterns_by_tile_count(12), {})
+
+    def test_match_hand(self):
+        """Test matching a tile-count vector against the stacked templates"""
+        hand = hand_counts(["2B"] * 3 + ["4B"] * 3 + ["6B"] * 4 + ["8B"] * 4)
+        self.assertIn('2468_222_444_6666_8888_same', self.rules.match_hand(hand, 2024))
+        self.assertIs(self.rules.get_pattern_table(2024), self.rules.get_pattern_table(2024))
+        self.assertEqual(self.rules.match_hand(hand, 1999), [])
+
+    def test_total_tiles(self):
+        """Test tile totals are derived from the components"""
+        self.assertEqual(self.rules.get_pattern_by_id('2024_NN_EEE_2024_WWW_SS')['total_tiles'], 14)
+        self.assertEqual(self.rules.get_pattern_by_id('consec_FFFF_123_444_444')['total_tiles'], 13)
+        self.assertEqual(self.rules.get_pattern_by_id('singles_112_11223_112233').total_tiles, 14)
+
+        with self.assertRaises(ValueError):
+            Pattern.from_dict({
+                'name': 'Short', 'pattern': '111 222', 'description': '', 'points': 25,
+                'category': 'X', 'suit_requirement': 'any_1_suit', 'joker_allowed': True,
+                'components': [{'type': 'number', 'value': 1, 'count': 3, 'suit': 'A'}]
+            })
+
+    def test_shared_components(self):
+        """Test equal components are stored once"""
+        same = self.rules.get_pattern_by_id('2468_222_444_6666_8888_same')
+        two = self.rules.get_pattern_by_id('2468_222_444_6666_8888_two')
+        self.assertIs(same.components[0], two.components[0])
+        self.assertIs(same.components[1], two.components[1])
+
+    def test_interned_fields(self):
+        """Test repeated string fields share one object across patterns"""
+        patterns = list(self.rules.get_all_patterns(2024).values())
+        self.assertTrue(all(sys.intern(pattern_id) is pattern_id for pattern_id in self.rules.get_all_patterns(2024)))
+        self.assertEqual(len({id(pattern.category) for pattern in patterns}), 2)
+        self.assertEqual(len({id(pattern.suit_requirement) for pattern in patterns}),
+                         len({pattern.suit_requirement for pattern in patterns}))
+        types = {component.type for pattern in patterns for component in pattern.components}
+        self.assertEqual(len({id(component.type) for pattern in patterns for component in pattern.components}),
+                         len(types))
+
+    def test_validate_suit_requirement(self):
+        """Test suit requirements are checked against the hand's suit and dragon mask"""
+        validate = self.rules.validate_suit_requirement
+        self.assertTrue(validate(["1B", "2B", "3B"], 'any_1_suit'))
+        self.assertFalse(validate(["1B", "2C", "3B"], 'any_1_suit'))
+        self.assertTrue(validate(["1B", "2C", "E"], 'any_2_suits'))
+        self.assertTrue(validate(["1B", "2C", "3D"], 'any_2_or_3_suits'))
+        self.assertTrue(validate(["1C", "2C", "R"], 'any_1_suit_matching_dragons'))
+        self.assertFalse(validate(["1C", "2C", "G"], 'any_1_suit_matching_dragons'))
+        self.assertTrue(validate(["1C", "2C", "G"], 'any_1_suit_opposite_dragons'))
+        self.assertTrue(validate(["1B", "2C", "R"], 'any_2_suits_matching_dragons'))
+        self.assertTrue(validate(["R", "G", "0"], 'any_3_dragons'))
+        self.assertFalse(validate(["R", "G", "1B"], 'any_3_dragons'))
+        self.assertTrue(validate(["R", "G"], 'any_2_dragons'))
+        self.assertEqual(set(SUIT_REQUIREMENT_MASKS), set(self.rules.suit_requirements))
+        with self.assertRaises(ValueError):
+            validate(["1B"], 'missing')
+
+    def test_suit_requirement_info(self):
+        """Test suit requirement descriptions are served from the descriptions module"""
+        info = self.rules.get_suit_requirement_info('any_1_suit')
+        self.assertEqual(info['examples'], ['All Bams', 'All Cracks', 'All Dots'])
+        self.assertEqual(self.rules.get_suit_requirement_info('missing'), {})
+        self.assertEqual(self.rules.hand_categories['C']['name'], 'Concealed')
+        self.assertIs(rules_specification.JOKER_RULES, self.rules.joker_rules)
+
+    def test_rule_bits(self):
+        """Test special rules are compiled into rule bits"""
+        self.assertEqual(parse_rule_bits(['Can be any 3 consecutive numbers (123, 234, 345, 456, 567, 678, 789)']),
+                         RuleBit.CONSEC3)
+        self.assertEqual(parse_rule_bits([]), RuleBit.NONE)
+
+        pattern = self.rules.get_pattern_by_id('consec_11_22_333_444_DDDD')
+        self.assertTrue(pattern.rule_bits & RuleBit.CONSEC4)
+        self.assertTrue(pattern.rule_bits & RuleBit.MATCHING_DRAGONS)
+        self.assertFalse(pattern.rule_bits & RuleBit.ODD)
+
+        pattern = self.rules.get_pattern_by_id('singles_FF_22_46_88_22_46_88')
+        self.assertTrue(pattern.rule_bits & RuleBit.NO_FLOWERS)
+
+if __name__ == '__main__':
+    unittest.main()
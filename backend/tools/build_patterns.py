@@ -0,0 +1,28 @@
+"""
+Build Pattern Data
+Writes the pattern literals from rules_specification to the pickled data file
+loaded at runtime. Run from the backend directory after editing a pattern:
+
+    python tools/build_patterns.py
+"""
+
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.mahjong.rules_specification import PATTERN_DATA_FILE, build_pattern_data
+
+# Fixed protocol so the file is the same whichever Python builds it
+PICKLE_PROTOCOL = 4
+
+def main():
+    """Write the pattern data file"""
+    PATTERN_DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(PATTERN_DATA_FILE, 'wb') as data_file:
+        pickle.dump(build_pattern_data(), data_file, protocol=PICKLE_PROTOCOL)
+    print(f"Wrote {PATTERN_DATA_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -1,53 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import requests
 import json
 
 # Test the API endpoints
 base_url = "http://localhost:5000/api"
 
+# One session per worker thread, so connections to the server are kept alive
+# and reused; a requests.Session is not safe to share across threads
+_local = threading.local()
+
+def get_session():
+    """Get the calling thread's session"""
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+    return _local.session
+
 def test_get_patterns():
-    """Test the get-patterns endpoint"""
+    """Test the get-patterns endpoint and return its report"""
+    lines = []
     try:
-        response = requests.get(f"{base_url}/get-patterns?year=2024")
-        print(f"GET /get-patterns status: {response.status_code}")
+        response = get_session().get(f"{base_url}/get-patterns?year=2024")
+        lines.append(f"GET /get-patterns status: {response.status_code}")
         if response.status_code == 200:
             data = response.json()
-            print(f"Patterns returned: {len(data.get('patterns', []))}")
+            lines.append(f"Patterns returned: {len(data.get('patterns', []))}")
         else:
-            print(f"Error: {response.text}")
+            lines.append(f"Error: {response.text}")
     except Exception as e:
-        print(f"Exception: {e}")
+        lines.append(f"Exception: {e}")
+    return "\n".join(lines)
 
 def test_validate_tiles():
-    """Test the validate-tiles endpoint"""
+    """Test the validate-tiles endpoint and return its report"""
+    lines = []
     try:
         # Test with valid tiles
         tiles = ["1B", "2B", "3B", "1C", "2C", "3C", "1D", "2D", "3D", "E", "S", "W", "N"]
-        response = requests.post(f"{base_url}/validate-tiles", json={"tiles": tiles})
-        print(f"POST /validate-tiles status: {response.status_code}")
+        response = get_session().post(f"{base_url}/validate-tiles", json={"tiles": tiles})
+        lines.append(f"POST /validate-tiles status: {response.status_code}")
         if response.status_code == 200:
             data = response.json()
-            print(f"Validation result: {data.get('valid', False)}")
+            lines.append(f"Validation result: {data.get('valid', False)}")
         else:
-            print(f"Error: {response.text}")
+            lines.append(f"Error: {response.text}")
     except Exception as e:
-        print(f"Exception: {e}")
+        lines.append(f"Exception: {e}")
+    return "\n".join(lines)
 
 def test_get_tile_info():
-    """Test the get-tile-info endpoint"""
+    """Test the get-tile-info endpoint and return its report"""
+    lines = []
     try:
-        response = requests.get(f"{base_url}/get-tile-info")
-        print(f"GET /get-tile-info status: {response.status_code}")
+        response = get_session().get(f"{base_url}/get-tile-info")
+        lines.append(f"GET /get-tile-info status: {response.status_code}")
         if response.status_code == 200:
             data = response.json()
-            print(f"Tile categories: {list(data.get('tile_categories', {}).keys())}")
+            lines.append(f"Tile categories: {list(data.get('tile_categories', {}).keys())}")
         else:
-            print(f"Error: {response.text}")
+            lines.append(f"Error: {response.text}")
     except Exception as e:
-        print(f"Exception: {e}")
+        lines.append(f"Exception: {e}")
+    return "\n".join(lines)
 
 if __name__ == "__main__":
     print("Testing API endpoints...")
-    test_get_patterns()
-    test_validate_tiles()
-    test_get_tile_info()
+    # The endpoints are independent, so wait on all three requests at once; each
+    # check returns its report, printed in order so the output does not interleave
+    tests = [test_get_patterns, test_validate_tiles, test_get_tile_info]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        for future in [executor.submit(test) for test in tests]:
+            print(future.result())
     print("API testing complete!") 
\ No newline at end of file